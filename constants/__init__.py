@@ -10,6 +10,7 @@ from .levels import Levels
 from .organization import Organization
 from .relevance import Relevance
 from .role import Role
+from .search_engine import SearchEngine
 from .states import States
 from .student_example import StudentExample
 from .student_tip import StudentTip
@@ -38,4 +39,5 @@ __all__ = [
     "Cache",
     "Organization",
     "Group",
+    "SearchEngine",
 ]
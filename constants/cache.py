@@ -1,5 +1,5 @@
 class Cache:
-    MANAGER_USERS_CACHE_KEY = "MANAGER_USERS"
+    MANAGER_USER_IDS_CACHE_KEY = "MANAGER_USER_IDS"
 
     TIMEOUT_A_DAY = 60 * 60 * 24  # a day
 
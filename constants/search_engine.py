@@ -0,0 +1,5 @@
+class SearchEngine:
+    ICONTAINS = "icontains"
+    FULL_TEXT = "full_text"
+
+    VALUES = [ICONTAINS, FULL_TEXT]
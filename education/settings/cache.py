@@ -6,7 +6,9 @@ REDIS_CACHE_URL = env.cache(
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        # django_redis RedisCache reporting hits and misses to the
+        # request stats
+        "BACKEND": "libs.cache.instrumented.InstrumentedRedisCache",
         "LOCATION": REDIS_CACHE_URL["LOCATION"],
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
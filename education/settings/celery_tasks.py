@@ -12,11 +12,32 @@ CELERY_RESULT_BACKEND = env.cache_url(
     "CELERY_RESULT_BACKEND", default="redis://localhost:6379/0"
 )
 CELERY_TIMEZONE = TIME_ZONE
-CELERY_TASK_SERIALIZER = "pickle"
-CELERY_RESULT_SERIALIZER = "pickle"
-CELERY_ACCEPT_CONTENT = ["pickle"]
+# task arguments are ids and plain values, see NotificationDescriptor
+CELERY_TASK_SERIALIZER = "json"
+CELERY_RESULT_SERIALIZER = "json"
+CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_DEFAULT_QUEUE = "default"
 CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=False)
 CELERY_TASK_EAGER_PROPAGATES = env.bool(
     "CELERY_TASK_EAGER_PROPAGATES", default=False
 )
+
+# Tip reads are counted by the flush_tip_reads beat task when buffered, the
+# flush interval (seconds) bounds how stale the read counters can be
+TIP_READ_BUFFER_ENABLED = env.bool("TIP_READ_BUFFER_ENABLED", default=False)
+TIP_READ_BUFFER_FLUSH_INTERVAL = env.int(
+    "TIP_READ_BUFFER_FLUSH_INTERVAL", default=60
+)
+TIP_READ_BUFFER_BATCH_SIZE = env.int(
+    "TIP_READ_BUFFER_BATCH_SIZE", default=1000
+)
+TIP_READ_BUFFER_MAX_BATCHES = env.int(
+    "TIP_READ_BUFFER_MAX_BATCHES", default=10
+)
+
+CELERY_BEAT_SCHEDULE = {}
+if TIP_READ_BUFFER_ENABLED:
+    CELERY_BEAT_SCHEDULE["flush-tip-reads"] = {
+        "task": "tasks.tip_rating.flush_tip_reads",
+        "schedule": TIP_READ_BUFFER_FLUSH_INTERVAL,
+    }
@@ -14,3 +14,9 @@ CHANNEL_LAYERS = {
         },
     },
 }
+
+# hand websocket notification fan-out over to a celery worker
+# instead of sending it from the request thread
+WEBSOCKET_NOTIFICATION_USE_CELERY = env.bool(
+    "WEBSOCKET_NOTIFICATION_USE_CELERY", default=False
+)
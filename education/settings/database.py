@@ -7,3 +7,8 @@ DATABASES = {
     # read os.environ['SQLITE_URL']
     "extra": env.db("SQLITE_URL", default="sqlite:///my-local-sqlite.db"),
 }
+
+# "icontains" keeps the legacy ILIKE search, "full_text" opts in to the
+# prefix search of the stored search vectors
+SEARCH_ENGINE = env("SEARCH_ENGINE", default="icontains")
+SEARCH_CONFIG = env("SEARCH_CONFIG", default="english")
@@ -1,6 +1,7 @@
+import os
 import sys
 
-from .base import env
+from .base import BASE_DIR, env
 
 # Sentry -
 SENTRY_DSN = env.str("SENTRY_DSN", default="")
@@ -30,7 +31,13 @@ AWS_SECRET_ACCESS_KEY = env.str("AWS_SECRET_ACCESS_KEY", default="")
 AWS_STORAGE_BUCKET_NAME = env.str("AWS_STORAGE_BUCKET_NAME", default="")
 AWS_S3_REGION_NAME = env.str("AWS_S3_REGION_NAME", default="")
 
+# Admin exports hold user data, they are stored out of MEDIA_ROOT and
+# downloaded through a staff only admin view
+EXPORT_ROOT = os.path.join(BASE_DIR, "exports")
+EXPORT_FILE_STORAGE = "libs.import_export.storage.ExportFileSystemStorage"
+
 if USE_S3:
     AWS_S3_CUSTOM_DOMAIN = "%s.s3.amazonaws.com" % AWS_STORAGE_BUCKET_NAME
     STATICFILES_STORAGE = "libs.custom_storages.StaticStorage"
     DEFAULT_FILE_STORAGE = "libs.custom_storages.MediaStorage"
+    EXPORT_FILE_STORAGE = "libs.custom_storages.ExportStorage"
@@ -1,4 +1,7 @@
+from .base import env
+
 MIDDLEWARE = [
+    "libs.middleware.RequestStatsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -8,3 +11,10 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
+
+# Server-Timing header with the query count, database time and cache hits
+# of every request, optionally added up per endpoint in Redis
+REQUEST_STATS_ENABLED = env.bool("REQUEST_STATS_ENABLED", default=False)
+REQUEST_STATS_AGGREGATE_ENABLED = env.bool(
+    "REQUEST_STATS_AGGREGATE_ENABLED", default=False
+)
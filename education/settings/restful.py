@@ -17,7 +17,7 @@ REST_FRAMEWORK = {
     # filter
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.OrderingFilter",
+        "libs.filters.SearchRankOrderingFilter",
     ],
 }
 
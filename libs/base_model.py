@@ -1,4 +1,15 @@
+import copy
+
 from django.db import models
+from django.db.models import DEFERRED
+
+
+def snapshot(value):
+    # JSONField dicts and lists are mutated in place, the loaded value must
+    # not be the object held by the instance
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
 
 
 class BaseModel(models.Model):
@@ -8,6 +19,86 @@ class BaseModel(models.Model):
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            field_name: snapshot(value)
+            for field_name, value in zip(field_names, values)
+            if value is not DEFERRED
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        # what is saved becomes the new baseline, only the `update_fields`
+        # when given, expressions such as F() are left out since their
+        # result is only known to the database
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
+        loaded_values = self.__dict__.setdefault("_loaded_values", {})
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue
+            if update_fields is not None and update_fields.isdisjoint(
+                (field.name, field.attname)
+            ):
+                continue
+
+            value = self.__dict__[field.attname]
+            if hasattr(value, "resolve_expression"):
+                loaded_values.pop(field.attname, None)
+            else:
+                loaded_values[field.attname] = snapshot(value)
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+
+        fields = None if fields is None else set(fields)
+        loaded_values = self.__dict__.setdefault("_loaded_values", {})
+        for field in self._meta.concrete_fields:
+            if fields is not None and fields.isdisjoint(
+                (field.name, field.attname)
+            ):
+                continue
+            if field.attname in self.__dict__:
+                loaded_values[field.attname] = snapshot(
+                    self.__dict__[field.attname]
+                )
+
+    def get_loaded_value(self, field_name):
+        """Value of `field_name` as last loaded from or saved to the
+        database, read with a single column query when it was deferred or
+        the instance was built by hand."""
+        field = self._meta.get_field(field_name)
+        loaded_values = self.__dict__.setdefault("_loaded_values", {})
+
+        if field.attname not in loaded_values:
+            loaded_values[field.attname] = (
+                type(self)
+                ._base_manager.filter(pk=self.pk)
+                .values_list(field.attname, flat=True)
+                .first()
+            )
+
+        return loaded_values[field.attname]
+
+    def has_changed(self, field_name):
+        if self._state.adding or self.pk is None:
+            return True
+
+        field = self._meta.get_field(field_name)
+        if field.attname not in self.__dict__:
+            # deferred and never assigned
+            return False
+
+        return self.get_loaded_value(field_name) != getattr(
+            self, field.attname
+        )
+
     @property
     def added(self):
         return self.created_at
@@ -1,5 +1,11 @@
 from .activity import ActivityCache
+from .endpoint_stats import EndpointStats
+from .tip_read import TipReadBuffer
+from .user import UserCache
 
 __all__ = [
     "ActivityCache",
+    "EndpointStats",
+    "TipReadBuffer",
+    "UserCache",
 ]
@@ -1,38 +1,172 @@
+import datetime
+
 from django.core.cache import cache
+from django_redis import get_redis_connection
 from notifications.models import Notification
 
 
 class ActivityCache:
     LAST_ACTIVITIES_CACHE_KEY = "LAST_ACTIVITIES"
-    LAST_ACTIVITY_CACHE_KEY = "LAST_ACTIVITY_{}"
+    ACTIVITIES_CACHE_KEY = "ACTIVITIES_{}"
     TIMEOUT = 60 * 60 * 24  # a day
 
+    # the activities of a user are a Redis hash of
+    # "<content type id>:<object id>" fields holding the latest timestamp,
+    # next to these fields
+    LAST_ACTIVITY_FIELD = "last_activity"
+    COMPLETE_FIELD = "complete"
+    REBUILDING_FIELD = "rebuilding"
+
+    # UTC timestamps in this format sort as strings
+    TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+    # Keeps the latest value of every field of the KEYS[1] hash. ARGV[1] is
+    # "1" to leave a missing hash alone, ARGV[2] the expiry in seconds ("0"
+    # keeps the current one), the other arguments are field/value pairs.
+    MERGE_SCRIPT = """
+        if ARGV[1] == "1" and redis.call("EXISTS", KEYS[1]) == 0 then
+            return 0
+        end
+        for i = 3, #ARGV, 2 do
+            local current = redis.call("HGET", KEYS[1], ARGV[i])
+            if not current or current < ARGV[i + 1] then
+                redis.call("HSET", KEYS[1], ARGV[i], ARGV[i + 1])
+            end
+        end
+        if ARGV[2] ~= "0" then
+            redis.call("EXPIRE", KEYS[1], ARGV[2])
+        end
+        return 1
+    """
+
+    @classmethod
+    def get_connection(cls):
+        """Redis connection of the default cache, None with the other
+        cache backends (e.g. the database cache of the tests)."""
+        try:
+            return get_redis_connection("default")
+        except NotImplementedError:
+            return None
+
     @classmethod
     def refresh(cls, user_id):
-        cls.get_last_activity_by_user(user_id, refresh=True)
-        cls.get_activities_by_user(user_id, refresh=True)
+        cls.rebuild_activities_by_user(user_id)
 
     @classmethod
-    def get_last_activity_by_user(cls, user_id, refresh=False):
-        key_name = cls.LAST_ACTIVITY_CACHE_KEY.format(user_id)
+    def add_notifications(cls, notifications):
+        """Write new success notifications through to the per user cache.
 
-        value = cache.get(key_name)
-        if value and not refresh:
-            return value
+        Every notification updates one field of the user's activities hash
+        with an atomic script, cold hashes are left untouched and rebuilt
+        on the next read. Without Redis the cached activities are dropped.
+        """
+        notifications_by_user = {}
+        for notification in notifications:
+            if notification.level != "success":
+                continue
 
-        last_notification = (
-            Notification.objects.filter(level="success")
-            .filter(recipient_id=user_id)
-            .order_by("-timestamp")
-            .first()
-        )
+            notifications_by_user.setdefault(
+                notification.recipient_id, []
+            ).append(notification)
+
+        for user_id, user_notifications in notifications_by_user.items():
+            cls.add_user_notifications(user_id, user_notifications)
+
+    @classmethod
+    def add_user_notifications(cls, user_id, notifications):
+        fields = {
+            cls.LAST_ACTIVITY_FIELD: max(
+                cls.format_timestamp(notification.timestamp)
+                for notification in notifications
+            )
+        }
+
+        for notification in notifications:
+            if not notification.action_object_object_id:
+                continue
+
+            field = cls.get_activity_field(
+                notification.action_object_content_type_id,
+                notification.action_object_object_id,
+            )
+            timestamp = cls.format_timestamp(notification.timestamp)
+            fields[field] = max(fields.get(field, timestamp), timestamp)
+
+        cls.merge_fields(user_id, fields)
+
+    @classmethod
+    def merge_fields(cls, user_id, fields, complete=False):
+        """Merge `fields` into the user's activities, keeping the latest
+        timestamps. `complete` fields replace a cold cache."""
+        key_name = cls.ACTIVITIES_CACHE_KEY.format(user_id)
+
+        connection = cls.get_connection()
+        if connection is None:
+            if complete:
+                fields = dict(fields, **{cls.COMPLETE_FIELD: "1"})
+                cache.set(key_name, fields, timeout=cls.TIMEOUT)
+            else:
+                cache.delete(key_name)
+            return
 
-        if not last_notification:
+        args = ["0" if complete else "1", cls.TIMEOUT if complete else 0]
+        for field, value in fields.items():
+            args.extend([field, value])
+        if complete:
+            args.extend([cls.COMPLETE_FIELD, "1"])
+
+        merge = connection.register_script(cls.MERGE_SCRIPT)
+        merge(keys=[cache.make_key(key_name)], args=args)
+
+    @classmethod
+    def get_fields(cls, user_id):
+        """Fields of the user's activities, None when they are not cached
+        or only partially (a rebuild is running)."""
+        key_name = cls.ACTIVITIES_CACHE_KEY.format(user_id)
+
+        connection = cls.get_connection()
+        if connection is None:
+            fields = cache.get(key_name)
+        else:
+            fields = {
+                field.decode(): value.decode()
+                for field, value in connection.hgetall(
+                    cache.make_key(key_name)
+                ).items()
+            }
+
+        if not fields or cls.COMPLETE_FIELD not in fields:
             return None
 
-        cache.set(key_name, last_notification.timestamp, timeout=cls.TIMEOUT)
+        return fields
+
+    @classmethod
+    def get_activity_field(cls, action_object_type_id, action_object_id):
+        return "{}:{}".format(action_object_type_id, action_object_id)
+
+    @classmethod
+    def format_timestamp(cls, timestamp):
+        return timestamp.astimezone(datetime.timezone.utc).strftime(
+            cls.TIMESTAMP_FORMAT
+        )
 
-        return last_notification.timestamp
+    @classmethod
+    def parse_timestamp(cls, value):
+        return datetime.datetime.strptime(value, cls.TIMESTAMP_FORMAT).replace(
+            tzinfo=datetime.timezone.utc
+        )
+
+    @classmethod
+    def get_last_activity_by_user(cls, user_id, refresh=False):
+        fields = None if refresh else cls.get_fields(user_id)
+        if fields is None:
+            fields = cls.rebuild_activities_by_user(user_id)
+
+        value = fields.get(cls.LAST_ACTIVITY_FIELD)
+        if not value:
+            return None
+
+        return cls.parse_timestamp(value)
 
     @classmethod
     def get_last_activities(cls):
@@ -126,8 +260,100 @@ class ActivityCache:
 
     @classmethod
     def get_activities_by_user(cls, user_id, **kwargs):
+        # the cache only keeps the latest timestamp of every action object,
+        # so an upper bound needs the notifications table
+        if kwargs.get("end_date"):
+            return cls.query_activities_by_user(user_id, **kwargs)
+
+        fields = cls.get_fields(user_id)
+        if fields is None:
+            fields = cls.rebuild_activities_by_user(user_id)
+
+        start_date = kwargs.get("start_date")
+
+        cached_activities = {}
+        for field, value in fields.items():
+            if ":" not in field:
+                continue
+
+            action_object_type_id, action_object_id = field.split(":")
+            key = (int(action_object_type_id), int(action_object_id))
+            cached_activities[key] = cls.parse_timestamp(value)
+
+        activities = {}
+        for key, timestamp in sorted(cached_activities.items()):
+            if start_date and timestamp < start_date:
+                continue
+
+            action_object_type_id, action_object_id = key
+            if action_object_type_id not in activities:
+                activities[action_object_type_id] = []
+            activities[action_object_type_id].append(
+                {action_object_id: timestamp}
+            )
+
+        return activities
+
+    @classmethod
+    def rebuild_activities_by_user(cls, user_id):
+        connection = cls.get_connection()
+        if connection is not None:
+            # notifications merged while the table is read are kept
+            key = cache.make_key(cls.ACTIVITIES_CACHE_KEY.format(user_id))
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.hsetnx(key, cls.REBUILDING_FIELD, "1")
+            pipeline.expire(key, cls.TIMEOUT)
+            pipeline.execute()
+
+        fields = {}
+        for notification in cls.get_latest_notifications_by_user(user_id):
+            field = cls.get_activity_field(
+                notification["action_object_content_type_id"],
+                notification["action_object_object_id"],
+            )
+            fields[field] = cls.format_timestamp(notification["timestamp"])
+
+        last_activity = (
+            Notification.objects.filter(level="success", recipient_id=user_id)
+            .order_by("-timestamp")
+            .values_list("timestamp", flat=True)
+            .first()
+        )
+        if last_activity:
+            fields[cls.LAST_ACTIVITY_FIELD] = cls.format_timestamp(
+                last_activity
+            )
+
+        cls.merge_fields(user_id, fields, complete=True)
+
+        return dict(fields, **{cls.COMPLETE_FIELD: "1"})
+
+    @classmethod
+    def query_activities_by_user(cls, user_id, **kwargs):
+        notifications = cls.get_latest_notifications_by_user(user_id, **kwargs)
+
+        activities = {}
+        for notification in notifications:
+            action_object_type_id = notification[
+                "action_object_content_type_id"
+            ]
+            action_object_id = notification["action_object_object_id"]
+            timestamp = notification["timestamp"]
+
+            if action_object_type_id not in activities:
+                activities[action_object_type_id] = []
+            activities[action_object_type_id].append(
+                {int(action_object_id): timestamp}
+            )
+
+        return activities
+
+    @classmethod
+    def get_latest_notifications_by_user(cls, user_id, **kwargs):
         notifications = Notification.objects.filter(
-            level="success", recipient_id=user_id
+            level="success",
+            recipient_id=user_id,
+            action_object_object_id__isnull=False,
         )
 
         if kwargs.get("start_date"):
@@ -140,7 +366,7 @@ class ActivityCache:
                 timestamp__lt=kwargs["end_date"]
             )
 
-        notifications = (
+        return (
             notifications.order_by(
                 "recipient_id",
                 "action_object_object_id",
@@ -158,19 +384,3 @@ class ActivityCache:
                 "timestamp",
             )
         )
-
-        activities = {}
-        for notification in notifications:
-            action_object_type_id = notification[
-                "action_object_content_type_id"
-            ]
-            action_object_id = notification["action_object_object_id"]
-            timestamp = notification["timestamp"]
-
-            if action_object_type_id not in activities:
-                activities[action_object_type_id] = []
-            activities[action_object_type_id].append(
-                {int(action_object_id): timestamp}
-            )
-
-        return activities
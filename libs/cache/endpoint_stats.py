@@ -0,0 +1,62 @@
+from collections import defaultdict
+
+from django_redis import get_redis_connection
+
+
+class EndpointStats:
+    """Redis hash adding up the request stats of every endpoint.
+
+    Fields are `<endpoint>|<counter>`, every request increments them in
+    one pipelined round trip.
+    """
+
+    ENDPOINT_STATS_KEY = "ENDPOINT_STATS"
+
+    @classmethod
+    def get_connection(cls):
+        return get_redis_connection("default")
+
+    @classmethod
+    def record(cls, endpoint, counters):
+        pipeline = cls.get_connection().pipeline(transaction=False)
+        for name, value in counters.items():
+            pipeline.hincrbyfloat(
+                cls.ENDPOINT_STATS_KEY, "{}|{}".format(endpoint, name), value
+            )
+        pipeline.execute()
+
+    @classmethod
+    def get_all(cls):
+        """Counters of every endpoint, with the per request averages."""
+        endpoints = defaultdict(dict)
+        fields = cls.get_connection().hgetall(cls.ENDPOINT_STATS_KEY)
+        for field, value in fields.items():
+            endpoint, name = field.decode().rsplit("|", 1)
+            endpoints[endpoint][name] = float(value)
+
+        stats = []
+        for endpoint, counters in endpoints.items():
+            requests = counters.get("requests") or 1
+            stats.append(
+                {
+                    "endpoint": endpoint,
+                    "requests": int(counters.get("requests", 0)),
+                    "avg_queries": counters.get("queries", 0) / requests,
+                    "avg_db_ms": counters.get("db_ms", 0) / requests,
+                    "avg_app_ms": counters.get("app_ms", 0) / requests,
+                    "avg_total_ms": counters.get("total_ms", 0) / requests,
+                    "cache_hits": int(counters.get("cache_hits", 0)),
+                    "cache_misses": int(counters.get("cache_misses", 0)),
+                }
+            )
+
+        return sorted(
+            stats,
+            key=lambda endpoint_stats: endpoint_stats["avg_total_ms"]
+            * endpoint_stats["requests"],
+            reverse=True,
+        )
+
+    @classmethod
+    def reset(cls):
+        cls.get_connection().delete(cls.ENDPOINT_STATS_KEY)
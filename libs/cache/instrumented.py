@@ -0,0 +1,38 @@
+from django_redis.cache import RedisCache
+
+from libs.request_stats import RequestStats
+
+_missing = object()
+
+
+class InstrumentedCacheMixin:
+    """Cache backend mixin reporting hits and misses to the stats of the
+    current request."""
+
+    def get(self, key, default=None, version=None, **kwargs):
+        value = super().get(key, _missing, version=version, **kwargs)
+
+        if value is _missing:
+            RequestStats.record_cache(misses=1)
+            return default
+
+        RequestStats.record_cache(hits=1)
+        return value
+
+    def get_many(self, keys, version=None, **kwargs):
+        keys = list(keys)
+        stats = RequestStats.current()
+        lookups = stats.cache_lookups if stats else 0
+
+        values = super().get_many(keys, version=version, **kwargs)
+
+        # BaseCache.get_many falls back to get, which counted the keys
+        if stats and stats.cache_lookups == lookups:
+            RequestStats.record_cache(
+                hits=len(values), misses=len(keys) - len(values)
+            )
+        return values
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    pass
@@ -0,0 +1,83 @@
+import json
+import uuid
+
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+
+class TipReadBuffer:
+    """Redis list of tip reads waiting to be counted.
+
+    Reads are appended on the request path and flushed in batches by the
+    `flush_tip_reads` task, which writes the counters and notifications.
+    A batch is moved atomically to its own processing list by `claim`, so
+    overlapping flushes never count the same reads twice. The list is
+    deleted by `ack` once the batch was written, or its reads are put back
+    at the head of the buffer by `release` when the write failed. A worker
+    killed in between leaves the list behind instead of counting it again.
+    """
+
+    TIP_READS_KEY = "TIP_READS"
+    PROCESSING_KEY = "TIP_READS_PROCESSING_{}"
+
+    # Moves the ARGV[1] oldest reads of KEYS[1] to the KEYS[2] list and
+    # returns them. RPUSH is called in chunks to stay within the Lua stack.
+    CLAIM_SCRIPT = """
+        local reads = redis.call("LRANGE", KEYS[1], 0, ARGV[1] - 1)
+        if #reads == 0 then
+            return reads
+        end
+        redis.call("LTRIM", KEYS[1], #reads, -1)
+        for i = 1, #reads, 1000 do
+            redis.call(
+                "RPUSH", KEYS[2], unpack(reads, i, math.min(i + 999, #reads))
+            )
+        end
+        return reads
+    """
+
+    # Puts the reads of the KEYS[2] list back at the head of KEYS[1], in
+    # their order, and deletes KEYS[2].
+    RELEASE_SCRIPT = """
+        local reads = redis.call("LRANGE", KEYS[2], 0, -1)
+        for i = #reads, 1, -1 do
+            redis.call("LPUSH", KEYS[1], reads[i])
+        end
+        redis.call("DEL", KEYS[2])
+        return #reads
+    """
+
+    @classmethod
+    def get_connection(cls):
+        return get_redis_connection("default")
+
+    @classmethod
+    def add(cls, user_id, tip_id, student_id=None):
+        read = {
+            "user": user_id,
+            "tip": tip_id,
+            "student": student_id,
+            "timestamp": timezone.now().isoformat(),
+        }
+
+        cls.get_connection().rpush(cls.TIP_READS_KEY, json.dumps(read))
+
+    @classmethod
+    def claim(cls, count):
+        """Move the `count` oldest reads to a new processing list, returns
+        the key of the list with the reads."""
+        batch_key = cls.PROCESSING_KEY.format(uuid.uuid4().hex)
+
+        claim = cls.get_connection().register_script(cls.CLAIM_SCRIPT)
+        reads = claim(keys=[cls.TIP_READS_KEY, batch_key], args=[count])
+
+        return batch_key, [json.loads(read) for read in reads]
+
+    @classmethod
+    def ack(cls, batch_key):
+        cls.get_connection().delete(batch_key)
+
+    @classmethod
+    def release(cls, batch_key):
+        release = cls.get_connection().register_script(cls.RELEASE_SCRIPT)
+        release(keys=[cls.TIP_READS_KEY, batch_key])
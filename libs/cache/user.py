@@ -0,0 +1,70 @@
+import copy
+import time
+
+from django.core.cache import cache
+
+
+class UserCache:
+    """Short lived user lookup by id, used to authenticate websockets.
+
+    Users are kept in a per process dict for LOCAL_TIMEOUT seconds in
+    front of the shared cache. Saving or deleting a user invalidates both,
+    other processes pick the change up once their local entry expires.
+    """
+
+    USER_CACHE_KEY = "USER_{}"
+    TIMEOUT = 60 * 5  # 5 minutes
+    LOCAL_TIMEOUT = 30  # 30 seconds
+    LOCAL_MAX_SIZE = 1000
+
+    _local_users = {}
+
+    @classmethod
+    def get_user(cls, user_id):
+        user = cls.get_local_user(user_id)
+        if user:
+            return user
+
+        key_name = cls.USER_CACHE_KEY.format(user_id)
+        user = cache.get(key_name)
+
+        if not user:
+            from main.models import User
+
+            user = User.objects.filter(pk=user_id).first()
+            if not user:
+                return None
+
+            cache.set(key_name, user, timeout=cls.TIMEOUT)
+
+        cls.set_local_user(user)
+
+        return copy.copy(user)
+
+    @classmethod
+    def get_local_user(cls, user_id):
+        value = cls._local_users.get(user_id)
+        if not value:
+            return None
+
+        expires_at, user = value
+        if expires_at < time.monotonic():
+            cls._local_users.pop(user_id, None)
+            return None
+
+        return copy.copy(user)
+
+    @classmethod
+    def set_local_user(cls, user):
+        if len(cls._local_users) >= cls.LOCAL_MAX_SIZE:
+            cls._local_users.clear()
+
+        cls._local_users[user.pk] = (
+            time.monotonic() + cls.LOCAL_TIMEOUT,
+            user,
+        )
+
+    @classmethod
+    def invalidate(cls, user_id):
+        cls._local_users.pop(user_id, None)
+        cache.delete(cls.USER_CACHE_KEY.format(user_id))
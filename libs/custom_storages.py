@@ -8,3 +8,13 @@ class StaticStorage(S3Boto3Storage):
 
 class MediaStorage(S3Boto3Storage):
     location = settings.MEDIA_ROOT
+
+
+class ExportStorage(S3Boto3Storage):
+    """Private storage of the admin exports, downloaded through the admin
+    only."""
+
+    location = "exports"
+    default_acl = "private"
+    custom_domain = None
+    querystring_auth = True
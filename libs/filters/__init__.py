@@ -1,7 +1,9 @@
 from .base_search import BaseSearchFilter
 from .base_select2_admin_filter import Select2Filter
+from .ordering import SearchRankOrderingFilter
 
 __all__ = [
     "BaseSearchFilter",
+    "SearchRankOrderingFilter",
     "Select2Filter",
 ]
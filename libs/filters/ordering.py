@@ -0,0 +1,19 @@
+from rest_framework.filters import OrderingFilter
+
+
+class SearchRankOrderingFilter(OrderingFilter):
+    """OrderingFilter keeping the full text search rank order.
+
+    Ranked search results (see `BaseQuerySet.full_text_search`) are only
+    reordered when the request asks for an ordering, the default ordering
+    of the view does not apply to them.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        if (
+            "search_rank" in queryset.query.annotations
+            and not request.query_params.get(self.ordering_param)
+        ):
+            return None
+
+        return super().get_ordering(request, queryset, view)
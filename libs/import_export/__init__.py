@@ -1,7 +1,11 @@
 from .base_admin import BaseImportExportModelAdmin
 from .resources import TipRatingResource
+from .storage import get_export_storage
+from .writer import ExportFileWriter
 
 __all__ = [
     "BaseImportExportModelAdmin",
+    "ExportFileWriter",
     "TipRatingResource",
+    "get_export_storage",
 ]
@@ -1,11 +1,15 @@
+from .background_export import BackgroundExportModelAdminMixin
 from .export_filterset import ExportFilterSetMixin
 from .select_field import (
     SelectFieldExportModelAdminMixin,
     SelectFieldResourceMixin,
 )
+from .streaming_export import StreamingExportResourceMixin
 
 __all__ = [
+    "BackgroundExportModelAdminMixin",
     "ExportFilterSetMixin",
     "SelectFieldExportModelAdminMixin",
     "SelectFieldResourceMixin",
+    "StreamingExportResourceMixin",
 ]
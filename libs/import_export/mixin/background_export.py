@@ -0,0 +1,109 @@
+from django.core.exceptions import PermissionDenied
+from django.http import FileResponse, Http404, HttpResponseRedirect
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+from django.utils.translation import gettext_lazy as _
+from import_export.forms import ExportForm
+
+from ..storage import get_export_storage
+from ..writer import ExportFileWriter
+
+
+class BackgroundExportModelAdminMixin:
+    """Runs the admin export in the `export_task` Celery task.
+
+    The task receives the user id, the file extension, the urlencoded
+    export form data, the file name and the download link, and emails the
+    link once the file is written, so large exports no longer time out
+    the admin request. The file is saved to the private export storage
+    under a random name and downloaded through `export_download_view`.
+    """
+
+    export_task = None
+
+    def get_export_formats(self):
+        formats = super().get_export_formats()
+        if self.export_task is None:
+            return formats
+
+        return [
+            file_format
+            for file_format in formats
+            if file_format().get_extension() in ExportFileWriter.FORMATS
+        ]
+
+    def export_action(self, request, *args, **kwargs):
+        if self.export_task is None or request.method != "POST":
+            return super().export_action(request, *args, **kwargs)
+
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+
+        formats = self.get_export_formats()
+        form = ExportForm(formats, request.POST)
+        if not form.is_valid():
+            return super().export_action(request, *args, **kwargs)
+
+        file_format = formats[int(form.cleaned_data["file_format"])]()
+        name = self.get_export_file_name(file_format.get_extension())
+        self.export_task.delay(
+            request.user.id,
+            file_format.get_extension(),
+            request.POST.urlencode(),
+            name,
+            request.build_absolute_uri(
+                reverse(
+                    "admin:%s_%s_export_download" % self.get_model_info(),
+                    args=[name],
+                )
+            ),
+        )
+
+        self.message_user(
+            request,
+            _(
+                "The export has started, a download link will be sent to "
+                "{email} when it is done."
+            ).format(email=request.user.email),
+        )
+
+        return HttpResponseRedirect("../")
+
+    def get_urls(self):
+        urls = super().get_urls()
+        if self.export_task is None:
+            return urls
+
+        return [
+            path(
+                "export/<str:name>/",
+                self.admin_site.admin_view(self.export_download_view),
+                name="%s_%s_export_download" % self.get_model_info(),
+            )
+        ] + urls
+
+    def get_export_file_name(self, extension):
+        return "{}_{:%Y%m%d%H%M%S}_{}.{}".format(
+            self.model._meta.model_name,
+            timezone.localtime(),
+            get_random_string(32),
+            extension,
+        )
+
+    def export_download_view(self, request, name):
+        if not (
+            self.has_export_permission(request)
+            and self.has_view_permission(request)
+        ):
+            raise PermissionDenied
+
+        storage = get_export_storage()
+        if not name.startswith(
+            self.model._meta.model_name + "_"
+        ) or not storage.exists(name):
+            raise Http404
+
+        return FileResponse(
+            storage.open(name, "rb"), as_attachment=True, filename=name
+        )
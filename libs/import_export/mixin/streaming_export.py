@@ -0,0 +1,17 @@
+class StreamingExportResourceMixin:
+    """Resource mixin yielding the export rows one by one.
+
+    `Resource.export` collects every row in a tablib Dataset before
+    anything is written, `iter_export` yields the headers and then a row
+    per object so the rows can be written to a file as they are read.
+    """
+
+    def iter_export(self, queryset=None):
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        self.before_export(queryset)
+
+        yield self.get_export_headers()
+        for obj in self.iter_queryset(queryset):
+            yield self.export_resource(obj)
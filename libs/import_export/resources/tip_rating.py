@@ -1,11 +1,12 @@
-from django.db.models import Avg
 from import_export import resources
 from import_export.fields import Field
 
-from main.models import ExampleRating, TipRating
+from main.models import Example, TipRating
 
+from ..mixin import StreamingExportResourceMixin
 
-class TipRatingResource(resources.ModelResource):
+
+class TipRatingResource(StreamingExportResourceMixin, resources.ModelResource):
     user_id = Field()
     name = Field()
     title = Field()
@@ -40,6 +41,20 @@ class TipRatingResource(resources.ModelResource):
             "created_at",
         )
 
+    clarity_averages = None
+
+    def before_export(self, queryset, *args, **kwargs):
+        super().before_export(queryset, *args, **kwargs)
+
+        self.clarity_averages = Example.objects.clarity_averages_by_tip(
+            queryset.values("tip_id")
+        )
+
+    def iter_queryset(self, queryset):
+        queryset = queryset.select_related("tip", "added_by")
+
+        return super().iter_queryset(queryset)
+
     def dehydrate_user_id(self, tip_rating):
         return tip_rating.added_by_id
 
@@ -50,25 +65,18 @@ class TipRatingResource(resources.ModelResource):
         return tip_rating.tip.title
 
     def dehydrate_clarity_examples(self, tip_rating):
-        example_ids = tip_rating.tip.example_set.values_list("id", flat=True)
-
-        clarity_examples = (
-            ExampleRating.objects.filter(example_id__in=example_ids)
-            .values("example_id")
-            .annotate(avg_clarity=Avg("clarity"))
-            .values("example__headline", "avg_clarity")
-        )
-
-        result = []
-        for clarity_example in clarity_examples:
-            result.append(
-                '"{}":{}'.format(
-                    clarity_example["example__headline"],
-                    clarity_example["avg_clarity"],
-                )
+        clarity_averages = self.clarity_averages
+        if clarity_averages is None:
+            clarity_averages = Example.objects.clarity_averages_by_tip(
+                [tip_rating.tip_id]
             )
 
-        return ", ".join(result)
+        return ", ".join(
+            '"{}":{}'.format(headline, clarity_average)
+            for headline, clarity_average in clarity_averages.get(
+                tip_rating.tip_id, []
+            )
+        )
 
     def dehydrate_rate_number(self, tip_rating):
         return tip_rating.stars
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, get_storage_class
+
+
+class ExportFileSystemStorage(FileSystemStorage):
+    """Local storage of the admin exports under `EXPORT_ROOT`, which is
+    not served, the files are downloaded through the admin only."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("location", settings.EXPORT_ROOT)
+        super().__init__(**kwargs)
+
+
+def get_export_storage():
+    return get_storage_class(settings.EXPORT_FILE_STORAGE)()
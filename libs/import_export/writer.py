@@ -0,0 +1,48 @@
+import csv
+import datetime
+import io
+
+from django.utils import timezone
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+
+class ExportFileWriter:
+    """Writes export rows to a binary file without holding them in
+    memory, XLSX files use an openpyxl write-only workbook."""
+
+    FORMATS = ("csv", "xlsx")
+
+    @classmethod
+    def write(cls, rows, file_format, file):
+        if file_format not in cls.FORMATS:
+            raise ValueError("Unsupported export format: %s" % file_format)
+
+        getattr(cls, "write_{}".format(file_format))(rows, file)
+
+    @classmethod
+    def write_csv(cls, rows, file):
+        text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        csv.writer(text_file).writerows(rows)
+        text_file.flush()
+        # leave `file` open for the caller
+        text_file.detach()
+
+    @classmethod
+    def write_xlsx(cls, rows, file):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        for row in rows:
+            sheet.append([cls.to_xlsx_value(value) for value in row])
+
+        workbook.save(file)
+
+    @classmethod
+    def to_xlsx_value(cls, value):
+        # Excel has neither timezones nor control characters
+        if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+            return timezone.make_naive(value)
+        if isinstance(value, str):
+            return ILLEGAL_CHARACTERS_RE.sub("", value)
+
+        return value
@@ -126,15 +126,18 @@ class BaseManager(models.Manager):
             )
         )
 
-    def count_by_days(self, days=7):
+    def count_by_days(self, days=7, student_ids=None):
         from_date = timezone.localtime() - timezone.timedelta(days=days)
         to_date = timezone.localtime()
 
-        queryset = (
-            self.get_queryset()
-            .filter(created_at__gte=from_date, created_at__lt=to_date)
-            .values("student_id")
-            .annotate(count=Count("student_id"))
+        queryset = self.get_queryset().filter(
+            created_at__gte=from_date, created_at__lt=to_date
+        )
+        if student_ids is not None:
+            queryset = queryset.filter(student_id__in=student_ids)
+
+        queryset = queryset.values("student_id").annotate(
+            count=Count("student_id")
         )
 
         items = {}
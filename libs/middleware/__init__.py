@@ -1,5 +1,7 @@
+from .request_stats import RequestStatsMiddleware
 from .token_auth import TokenAuthMiddlewareStack
 
 __all__ = [
+    "RequestStatsMiddleware",
     "TokenAuthMiddlewareStack",
 ]
@@ -0,0 +1,102 @@
+import logging
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from redis.exceptions import RedisError
+
+from libs.cache import EndpointStats
+from libs.request_stats import RequestStats
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStatsMiddleware:
+    """Counts the queries, database time and cache hits of every request.
+
+    The counters are sent back in the `Server-Timing` header to staff
+    users, or to everyone with `DEBUG`, and, when
+    `REQUEST_STATS_AGGREGATE_ENABLED` is set, added up per endpoint in
+    Redis for the managers endpoint stats view. The endpoint is the HTTP
+    method with the resolved view name, e.g. `GET v1:tips-list`.
+
+    The body of a streaming response is produced after the view returns,
+    its stats are completed when the stream is closed. The header of such
+    a response only covers the view.
+    """
+
+    namespaces = ["v1"]
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_STATS_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        started_at = time.monotonic()
+        with self.collect(stats):
+            response = self.get_response(request)
+        stats.total_seconds = time.monotonic() - started_at
+
+        if self.show_server_timing(request):
+            response["Server-Timing"] = stats.get_server_timing()
+
+        if response.streaming:
+            response.streaming_content = self.stream(
+                request, response.streaming_content, stats, started_at
+            )
+        else:
+            self.record(request, stats)
+
+        return response
+
+    @contextmanager
+    def collect(self, stats):
+        token = stats.activate()
+        try:
+            with connection.execute_wrapper(stats):
+                yield
+        finally:
+            RequestStats.deactivate(token)
+
+    def stream(self, request, content, stats, started_at):
+        try:
+            with self.collect(stats):
+                yield from content
+        finally:
+            stats.total_seconds = time.monotonic() - started_at
+            self.record(request, stats)
+
+    def show_server_timing(self, request):
+        if settings.DEBUG:
+            return True
+
+        user = getattr(request, "user", None)
+        return user is not None and user.is_staff
+
+    def record(self, request, stats):
+        endpoint = self.get_endpoint(request)
+        if not endpoint or not settings.REQUEST_STATS_AGGREGATE_ENABLED:
+            return
+
+        # the stats are best effort, a Redis outage must not fail requests
+        try:
+            EndpointStats.record(endpoint, stats.get_counters())
+        except RedisError:
+            logger.warning(
+                "Could not record the stats of %s", endpoint, exc_info=True
+            )
+
+    def get_endpoint(self, request):
+        resolver_match = getattr(request, "resolver_match", None)
+        if (
+            resolver_match is None
+            or resolver_match.namespace not in self.namespaces
+        ):
+            return None
+
+        return "{} {}".format(request.method, resolver_match.view_name)
@@ -6,21 +6,37 @@ from channels.middleware import BaseMiddleware
 from django.shortcuts import get_object_or_404
 from rest_framework_simplejwt.state import token_backend
 
+from libs.cache import UserCache
 from libs.jwt_auth.custom_jwt_payload_handler import get_username_field
 
 
-@database_sync_to_async
-def get_user(token_key):
+def get_user_from_payload(payload):
     from django.contrib.auth.models import AnonymousUser
 
     from main.models import User
 
+    user_id = payload.get("user_id")
+    if user_id is not None:
+        return UserCache.get_user(user_id) or AnonymousUser()
+
+    # tokens issued without the user_id claim
     username_field = get_username_field()
+    username = payload[username_field]
+    return get_object_or_404(User, username=username)
+
+
+async def get_user(token_key):
+    from django.contrib.auth.models import AnonymousUser
 
     try:
         payload = token_backend.decode(token_key)
-        username = payload[username_field]
-        return get_object_or_404(User, username=username)
+
+        # a local cache hit does not need a thread pool worker
+        user = UserCache.get_local_user(payload.get("user_id"))
+        if user:
+            return user
+
+        return await database_sync_to_async(get_user_from_payload)(payload)
     except Exception:
         return AnonymousUser()
 
@@ -0,0 +1,9 @@
+from .bulk_writer import NotificationBulkWriter
+from .descriptor import NotificationDescriptor
+from .object_loader import NotificationObjectLoader
+
+__all__ = [
+    "NotificationBulkWriter",
+    "NotificationDescriptor",
+    "NotificationObjectLoader",
+]
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import QuerySet
+from django.utils import timezone
+from notifications.models import Notification
+from notifications.settings import get_config
+
+from libs.cache import ActivityCache
+
+
+class NotificationBulkWriter:
+    """Bulk replacement for `notify.send`.
+
+    Accepts the same notification info dicts as `notify.send`, expands
+    every recipient (user, list, queryset or group) and writes all rows
+    with a single `bulk_create` instead of one INSERT per recipient.
+    """
+
+    BATCH_SIZE = 500
+
+    OPTIONAL_OBJECTS = ("target", "action_object")
+
+    @classmethod
+    def write(cls, notifications_info):
+        notifications = []
+        for notification_info in notifications_info:
+            notifications.extend(cls.build_notifications(**notification_info))
+
+        if not notifications:
+            return []
+
+        notifications = Notification.objects.bulk_create(
+            notifications, batch_size=cls.BATCH_SIZE
+        )
+
+        ActivityCache.add_notifications(notifications)
+        cls.add_activity_summaries(notifications)
+
+        return notifications
+
+    @classmethod
+    def add_activity_summaries(cls, notifications):
+        from main.models import UserActivitySummary
+
+        UserActivitySummary.objects.add_notifications(notifications)
+
+    @classmethod
+    def build_notifications(cls, **kwargs):
+        recipient = kwargs.pop("recipient")
+        actor = kwargs.pop("sender")
+        verb = kwargs.pop("verb")
+
+        optional_objects = [
+            (kwargs.pop(name, None), name) for name in cls.OPTIONAL_OBJECTS
+        ]
+
+        base_fields = {
+            "actor_content_type": ContentType.objects.get_for_model(actor),
+            "actor_object_id": actor.pk,
+            "verb": str(verb),
+            "public": bool(kwargs.pop("public", True)),
+            "description": kwargs.pop("description", None),
+            "timestamp": kwargs.pop("timestamp", None) or timezone.now(),
+            "level": kwargs.pop("level", Notification.LEVELS.info),
+        }
+
+        for obj, name in optional_objects:
+            if obj is None:
+                continue
+
+            base_fields["{}_object_id".format(name)] = obj.pk
+            base_fields[
+                "{}_content_type".format(name)
+            ] = ContentType.objects.get_for_model(obj)
+
+        if kwargs and get_config()["USE_JSONFIELD"]:
+            base_fields["data"] = kwargs
+
+        # recipients may be users or user ids
+        return [
+            Notification(
+                recipient_id=getattr(recipient, "pk", recipient), **base_fields
+            )
+            for recipient in cls.expand_recipients(recipient)
+        ]
+
+    @classmethod
+    def expand_recipients(cls, recipient):
+        if isinstance(recipient, Group):
+            return recipient.user_set.all()
+
+        if isinstance(recipient, (QuerySet, list)):
+            return recipient
+
+        return [recipient]
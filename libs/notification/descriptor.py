@@ -0,0 +1,137 @@
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_datetime
+
+
+class NotificationDescriptor:
+    """JSON friendly form of the notification info dicts of `notify.send`.
+
+    Objects are replaced by `[content type id, object id]` pairs and
+    recipients by user ids (or a group id), so Celery messages only carry
+    ids. `decode` loads the objects back with one `in_bulk` per content
+    type for a whole batch of descriptors, recipients stay user ids.
+    """
+
+    OBJECTS = ("sender", "action_object", "target")
+
+    @classmethod
+    def encode(cls, notifications_info):
+        return [
+            cls.encode_notification(**notification_info)
+            for notification_info in notifications_info
+        ]
+
+    @classmethod
+    def encode_notification(cls, **kwargs):
+        descriptor = {
+            "recipient": cls.encode_recipient(kwargs.pop("recipient")),
+            "verb": str(kwargs.pop("verb")),
+        }
+
+        for name in cls.OBJECTS:
+            obj = kwargs.pop(name, None)
+            if obj is not None:
+                descriptor[name] = cls.encode_object(obj)
+
+        if kwargs.get("description") is not None:
+            kwargs["description"] = str(kwargs["description"])
+
+        if kwargs.get("timestamp") is not None:
+            kwargs["timestamp"] = kwargs["timestamp"].isoformat()
+
+        descriptor.update(kwargs)
+
+        return descriptor
+
+    @classmethod
+    def encode_object(cls, obj):
+        return [ContentType.objects.get_for_model(obj).id, obj.pk]
+
+    @classmethod
+    def encode_recipient(cls, recipient):
+        if isinstance(recipient, Group):
+            return {"group": recipient.pk}
+
+        if isinstance(recipient, QuerySet):
+            return {"users": list(recipient.values_list("pk", flat=True))}
+
+        if isinstance(recipient, list):
+            # users or user ids
+            return {"users": [getattr(user, "pk", user) for user in recipient]}
+
+        return {"users": [recipient.pk]}
+
+    @classmethod
+    def decode(cls, descriptors):
+        """Notification info dicts of `descriptors`, the ones referring to
+        deleted objects are left out."""
+        object_ids = defaultdict(set)
+        group_ids = set()
+        user_ids = set()
+        for descriptor in descriptors:
+            for name in cls.OBJECTS:
+                if descriptor.get(name):
+                    content_type_id, object_id = descriptor[name]
+                    object_ids[content_type_id].add(object_id)
+
+            recipient = descriptor["recipient"]
+            if "group" in recipient:
+                group_ids.add(recipient["group"])
+            else:
+                user_ids.update(recipient["users"])
+
+        objects = {}
+        for content_type_id, ids in object_ids.items():
+            model = ContentType.objects.get_for_id(
+                content_type_id
+            ).model_class()
+            objects[content_type_id] = model._base_manager.in_bulk(ids)
+
+        groups = Group.objects.in_bulk(group_ids)
+        user_ids = set(
+            get_user_model()
+            ._base_manager.filter(pk__in=user_ids)
+            .values_list("pk", flat=True)
+        )
+
+        notifications_info = []
+        for descriptor in descriptors:
+            notification_info = dict(descriptor)
+
+            missing = False
+            for name in cls.OBJECTS:
+                if not descriptor.get(name):
+                    continue
+
+                content_type_id, object_id = descriptor[name]
+                obj = objects[content_type_id].get(object_id)
+                if obj is None:
+                    missing = True
+                    break
+                notification_info[name] = obj
+
+            recipient = descriptor["recipient"]
+            if "group" in recipient:
+                notification_info["recipient"] = groups.get(recipient["group"])
+            else:
+                notification_info["recipient"] = [
+                    user_id
+                    for user_id in recipient["users"]
+                    if user_id in user_ids
+                ]
+
+            if missing or not notification_info["recipient"]:
+                continue
+
+            if descriptor.get("timestamp"):
+                notification_info["timestamp"] = parse_datetime(
+                    descriptor["timestamp"]
+                )
+
+            notifications_info.append(notification_info)
+
+        return notifications_info
@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+
+class NotificationObjectLoader:
+    """Batch loader for the generic relations of a page of notifications.
+
+    Objects are grouped by content type and read with one `in_bulk` per
+    type, following the `student` relation when the model has one, so
+    rendering a page does not resolve every GenericForeignKey on its own.
+    """
+
+    OBJECTS = ("actor", "action_object")
+    SELECT_RELATED = ("student",)
+
+    @classmethod
+    def load(cls, notifications, objects=OBJECTS):
+        """Map of `(content type id, object id)` to the loaded object,
+        deleted objects are missing from it."""
+        object_ids = defaultdict(set)
+        for notification in notifications:
+            for name in objects:
+                key = cls.get_key(notification, name)
+                if key is not None:
+                    object_ids[key[0]].add(key[1])
+
+        loaded = {}
+        for content_type_id, ids in object_ids.items():
+            model = ContentType.objects.get_for_id(
+                content_type_id
+            ).model_class()
+            queryset = model._base_manager.select_related(
+                *cls.get_select_related(model)
+            )
+            for pk, obj in queryset.in_bulk(ids).items():
+                loaded[(content_type_id, str(pk))] = obj
+
+        return loaded
+
+    @classmethod
+    def get_key(cls, notification, name):
+        content_type_id = getattr(notification, f"{name}_content_type_id")
+        object_id = getattr(notification, f"{name}_object_id")
+        if content_type_id is None or object_id is None:
+            return None
+
+        return content_type_id, str(object_id)
+
+    @classmethod
+    def get_select_related(cls, model):
+        field_names = {
+            field.name for field in model._meta.fields if field.many_to_one
+        }
+        return [name for name in cls.SELECT_RELATED if name in field_names]
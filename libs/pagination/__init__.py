@@ -1,3 +1,4 @@
+from .keyset_pagination import KeysetPagination
 from .pagination_mixin import PaginationMixin
 
-__all__ = ["PaginationMixin"]
+__all__ = ["KeysetPagination", "PaginationMixin"]
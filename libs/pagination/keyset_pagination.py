@@ -0,0 +1,170 @@
+import base64
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # keep the microseconds, DjangoJSONEncoder truncates them
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination keyed on (first ordering field, pk).
+
+    Pages are fetched with a `WHERE (field, pk) > (value, pk)` style filter
+    instead of an OFFSET and no COUNT is run, so every page costs the same
+    however deep it is. The ordering field should not be nullable.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+
+    def __init__(self, page_size, cursor_query_param=None):
+        self.page_size = page_size
+        if cursor_query_param:
+            self.cursor_query_param = cursor_query_param
+
+        self.request = None
+        self.keys = None
+        self.next_position = None
+        self.previous_position = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.keys = self.get_keys(queryset)
+
+        position, reverse = self.decode_cursor(request)
+
+        ordering = [
+            "-" + key if descending != reverse else key
+            for key, descending in self.keys
+        ]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.build_filter(position, reverse))
+
+        items = list(queryset[: self.page_size + 1])
+        has_more = len(items) > self.page_size
+        items = items[: self.page_size]
+        if reverse:
+            items.reverse()
+
+        if items:
+            first_position = self.get_position(items[0])
+            last_position = self.get_position(items[-1])
+            if reverse:
+                self.next_position = last_position
+                self.previous_position = first_position if has_more else None
+            else:
+                self.next_position = last_position if has_more else None
+                self.previous_position = (
+                    first_position if position is not None else None
+                )
+
+        return items
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", None),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_keys(self, queryset):
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        field = ordering[0] if ordering else "pk"
+        if not isinstance(field, str):
+            field = "pk"
+
+        descending = field.startswith("-")
+        field = field.lstrip("-")
+        if field in ("pk", "id"):
+            return [("pk", descending)]
+
+        return [(field, descending), ("pk", descending)]
+
+    def build_filter(self, position, reverse):
+        q_object = Q()
+        equals = {}
+        for (key, descending), value in zip(self.keys, position):
+            lookup = "lt" if descending != reverse else "gt"
+            q_object |= Q(**equals, **{"{}__{}".format(key, lookup): value})
+            equals[key] = value
+
+        return q_object
+
+    def get_position(self, item):
+        position = []
+        for key, _descending in self.keys:
+            value = item
+            for attr in key.split(LOOKUP_SEP):
+                value = getattr(value, attr)
+            position.append(value)
+
+        return position
+
+    @classmethod
+    def dumps_cursor(cls, data):
+        """Opaque cursor of the JSON serializable `data`."""
+        data = json.dumps(data, cls=CursorJSONEncoder)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @classmethod
+    def loads_cursor(cls, cursor):
+        try:
+            return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(cls.invalid_cursor_message)
+
+    def encode_cursor(self, position, reverse):
+        cursor = self.dumps_cursor({"p": position, "r": reverse})
+
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+
+        data = self.loads_cursor(cursor)
+        try:
+            position, reverse = data["p"], bool(data["r"])
+        except (TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+
+        return self.encode_cursor(self.next_position, False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+
+        return self.encode_cursor(self.previous_position, True)
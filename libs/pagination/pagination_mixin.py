@@ -3,15 +3,33 @@ from collections import OrderedDict
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
+from .keyset_pagination import KeysetPagination
+
 
 class PaginationMixin:
+    # passing this parameter, even empty, switches to keyset pagination
+    cursor_query_param = "cursor"
+
+    keyset_paginator = None
+
     def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.keyset_paginator = KeysetPagination(
+                self.get_page_size(request), self.cursor_query_param
+            )
+            return self.keyset_paginator.paginate_queryset(
+                queryset, request, view=view
+            )
+
         try:
             return super().paginate_queryset(queryset, request, view=view)
         except NotFound:
             return list()
 
     def get_paginated_response(self, data):
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+
         if hasattr(self, "page") and self.page is not None:
             return super().get_paginated_response(data)
         else:
@@ -1,5 +1,8 @@
 from .base import BaseQuerySet
+from .search import JSONSearchVector, build_search_query
 
 __all__ = [
     "BaseQuerySet",
+    "JSONSearchVector",
+    "build_search_query",
 ]
@@ -1,14 +1,27 @@
+from collections import defaultdict
 from functools import reduce
 from operator import and_, or_
 
+from django.conf import settings
+from django.contrib.postgres.search import SearchRank
 from django.db import models
-from django.db.models import Count, Q
+from django.db.models import Avg, Count, F, OuterRef, Q, Subquery
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+import constants
+
+from .search import build_search_query
+
 
 class BaseQuerySet(models.QuerySet):
     DEFAULT_SEARCH_ICONTAINS_FIELDS = {}
     DEFAULT_SEARCH_JSON_FIELDS = {}
+    # search field -> (search vector lookup, weight of its lexemes)
+    FULL_TEXT_SEARCH_FIELDS = {}
+    # single valued search vector used to rank full text results
+    FULL_TEXT_SEARCH_RANK_VECTOR = None
 
     def _join_q_objects(self, q_objects, operator):
         if not q_objects:
@@ -22,12 +35,21 @@ class BaseQuerySet(models.QuerySet):
         return self._join_q_objects(q_objects, and_)
 
     def search(self, queryset, search_text, search_fields):
-        if not queryset:
+        if queryset is None:
             queryset = self
 
         if not search_text:
             return queryset
 
+        if (
+            settings.SEARCH_ENGINE == constants.SearchEngine.FULL_TEXT
+            and self.FULL_TEXT_SEARCH_FIELDS
+        ):
+            return self.full_text_search(queryset, search_text, search_fields)
+
+        return self.icontains_search(queryset, search_text, search_fields)
+
+    def icontains_search(self, queryset, search_text, search_fields):
         if not search_fields:
             search_fields = list(
                 self.DEFAULT_SEARCH_ICONTAINS_FIELDS.keys()
@@ -56,6 +78,48 @@ class BaseQuerySet(models.QuerySet):
 
         return queryset
 
+    def full_text_search(self, queryset, search_text, search_fields):
+        if not search_fields:
+            search_fields = self.FULL_TEXT_SEARCH_FIELDS.keys()
+
+        weights_by_vector = defaultdict(set)
+        for field in search_fields:
+            if field in self.FULL_TEXT_SEARCH_FIELDS:
+                vector, weight = self.FULL_TEXT_SEARCH_FIELDS[field]
+                weights_by_vector[vector].add(weight)
+
+        search_query = build_search_query(search_text, settings.SEARCH_CONFIG)
+        if not weights_by_vector or search_query is None:
+            return queryset
+
+        q_objects = []
+        for vector, weights in weights_by_vector.items():
+            lookup = {
+                vector: build_search_query(
+                    search_text,
+                    settings.SEARCH_CONFIG,
+                    "".join(sorted(weights)),
+                )
+            }
+            if LOOKUP_SEP in vector:
+                # semi join instead of joining the related rows, so the
+                # results need no distinct
+                lookup = {
+                    "pk__in": self.model.objects.filter(**lookup).values("pk")
+                }
+            q_objects.append(Q(**lookup))
+
+        queryset = queryset.filter(self._join_or_q_objects(q_objects))
+
+        if self.FULL_TEXT_SEARCH_RANK_VECTOR:
+            queryset = queryset.annotate(
+                search_rank=SearchRank(
+                    F(self.FULL_TEXT_SEARCH_RANK_VECTOR), search_query
+                )
+            ).order_by("-search_rank", "pk")
+
+        return queryset
+
     def build_icontains_fields_q_objects(self, icontains_fields, search_text):
         q_objects = []
         words = search_text.split()
@@ -131,14 +195,18 @@ class BaseQuerySet(models.QuerySet):
             )
         )
 
-    def count_by_days(self, days=7):
+    def count_by_days(self, days=7, student_ids=None):
         from_date = timezone.localtime() - timezone.timedelta(days=days)
         to_date = timezone.localtime()
 
-        queryset = (
-            self.filter(created_at__gte=from_date, created_at__lt=to_date)
-            .values("student_id")
-            .annotate(count=Count("student_id"))
+        queryset = self.filter(
+            created_at__gte=from_date, created_at__lt=to_date
+        )
+        if student_ids is not None:
+            queryset = queryset.filter(student_id__in=student_ids)
+
+        queryset = queryset.values("student_id").annotate(
+            count=Count("student_id")
         )
 
         items = {}
@@ -146,3 +214,26 @@ class BaseQuerySet(models.QuerySet):
             items[item["student_id"]] = item["count"]
 
         return items
+
+    def update_rating_aggregates(self, ratings, related_field, fields):
+        """Store the rating count and the average of each rating field
+        (`fields` maps the stored field to the rating field) with a single
+        UPDATE."""
+        ratings = (
+            ratings.filter(**{related_field: OuterRef("pk")})
+            .order_by()
+            .values(related_field)
+        )
+
+        values = {
+            "rating_count": Coalesce(
+                Subquery(ratings.annotate(value=Count("pk")).values("value")),
+                0,
+            ),
+        }
+        for field, rating_field in fields.items():
+            values[field] = Subquery(
+                ratings.annotate(value=Avg(rating_field)).values("value")
+            )
+
+        return self.update(**values)
@@ -0,0 +1,38 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchConfig,
+    SearchQuery,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db.models import Func
+
+WORD_REGEX = re.compile(r"\w+")
+
+
+class JSONSearchVector(SearchVectorCombinable, Func):
+    """tsvector of the string values of a jsonb field, keys excluded."""
+
+    template = (
+        "setweight(COALESCE(jsonb_to_tsvector(%(expressions)s, "
+        "'[\"string\"]'), ''::tsvector), '%(weight)s')"
+    )
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, config, weight):
+        super().__init__(
+            SearchConfig.from_parameter(config), expression, weight=weight
+        )
+
+
+def build_search_query(search_text, config, weights=""):
+    """Prefix query matching every word of `search_text`, restricted to the
+    lexemes labelled with one of `weights` (all of them when empty)."""
+    words = WORD_REGEX.findall(search_text)
+    if not words:
+        return None
+
+    terms = ["{}:*{}".format(word, weights) for word in words]
+
+    return SearchQuery(" & ".join(terms), config=config, search_type="raw")
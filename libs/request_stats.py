@@ -0,0 +1,81 @@
+import time
+from contextvars import ContextVar
+
+_current_request_stats = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    """SQL, cache and timing counters of the request being served.
+
+    Installed as a database execute wrapper, it counts every query and the
+    time spent in it. The instrumented cache backends report their hits
+    and misses to the stats of the current request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += time.monotonic() - started_at
+
+    @classmethod
+    def current(cls):
+        return _current_request_stats.get()
+
+    def activate(self):
+        return _current_request_stats.set(self)
+
+    @classmethod
+    def deactivate(cls, token):
+        _current_request_stats.reset(token)
+
+    @classmethod
+    def record_cache(cls, hits=0, misses=0):
+        stats = cls.current()
+        if stats is not None:
+            stats.cache_hits += hits
+            stats.cache_misses += misses
+
+    @property
+    def cache_lookups(self):
+        return self.cache_hits + self.cache_misses
+
+    @property
+    def app_seconds(self):
+        """Time spent outside the database: views, serializers and
+        rendering."""
+        return max(self.total_seconds - self.db_seconds, 0.0)
+
+    def get_server_timing(self):
+        return ", ".join(
+            [
+                'db;dur={:.2f};desc="{} queries"'.format(
+                    self.db_seconds * 1000, self.queries
+                ),
+                'cache;desc="{} hits, {} misses"'.format(
+                    self.cache_hits, self.cache_misses
+                ),
+                "app;dur={:.2f}".format(self.app_seconds * 1000),
+                "total;dur={:.2f}".format(self.total_seconds * 1000),
+            ]
+        )
+
+    def get_counters(self):
+        return {
+            "requests": 1,
+            "queries": self.queries,
+            "db_ms": round(self.db_seconds * 1000, 3),
+            "app_ms": round(self.app_seconds * 1000, 3),
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
@@ -1,5 +1,8 @@
+from .field_projection import FieldProjection, ProjectedFieldsMixin
 from .serializer_mixin import ReadWriteSerializerMixin
 
 __all__ = [
+    'FieldProjection',
+    'ProjectedFieldsMixin',
     'ReadWriteSerializerMixin'
 ]
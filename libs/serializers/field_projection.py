@@ -0,0 +1,61 @@
+class FieldProjection:
+    """Fields asked for with the `fields` and `expand` query parameters.
+
+    Without `fields` every field is rendered except the expandable ones,
+    which `expand` opts back in. `fields` renders exactly the listed
+    fields, expandable or not.
+    """
+
+    def __init__(self, fields=None, expand=()):
+        self.fields = None if fields is None else set(fields)
+        self.expand = set(expand)
+
+    @classmethod
+    def from_query_params(cls, query_params):
+        return cls(
+            fields=cls.split(query_params.get("fields")),
+            expand=cls.split(query_params.get("expand")) or (),
+        )
+
+    @classmethod
+    def split(cls, value):
+        if not value:
+            return None
+
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def includes(self, name, expandable=False):
+        if self.fields is not None:
+            return name in self.fields
+
+        return not expandable or name in self.expand
+
+    def get_deferred_fields(self, model, expandable_fields):
+        """Model columns of `expandable_fields` that are not rendered."""
+        column_names = {field.name for field in model._meta.concrete_fields}
+
+        return [
+            name
+            for name in expandable_fields
+            if name in column_names and not self.includes(name, True)
+        ]
+
+
+class ProjectedFieldsMixin:
+    """Serializer mixin rendering only the fields of the `projection` of
+    the serializer context, every field is rendered without one."""
+
+    expandable_fields = []
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        projection = self.context.get("projection")
+        if projection is None:
+            return fields
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if projection.includes(name, name in self.expandable_fields)
+        }
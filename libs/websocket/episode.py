@@ -1,8 +1,8 @@
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
-from notifications.models import Notification
 
 import constants
+from libs.notification import NotificationBulkWriter
 from main.models import User
 
 from .notification_websocket import NotificationWebsocketMixin
@@ -19,24 +19,31 @@ class EpisodeNotificationWebsocket(NotificationWebsocketMixin):
             user_id=episode.user_id
         ).values_list("user_id")
 
-        mapped_users = User.objects.filter(pk__in=mapped_user_ids)
-
-        for mapped_user in mapped_users:
-            Notification.objects.create(
-                level="success",
-                verb=constants.Activity.CREATE_EPISODE,
-                description=format_lazy(
-                    _(
-                        "{user_fullname} created a episode for "
-                        "the student {student_fullname}"
+        mapped_users = list(User.objects.filter(pk__in=mapped_user_ids))
+        if not mapped_users:
+            return
+
+        NotificationBulkWriter.write(
+            [
+                {
+                    "level": "success",
+                    "verb": constants.Activity.CREATE_EPISODE,
+                    "description": format_lazy(
+                        _(
+                            "{user_fullname} created a episode for "
+                            "the student {student_fullname}"
+                        ),
+                        user_fullname=episode.user.full_name,
+                        student_fullname=episode.student.full_name,
                     ),
-                    user_fullname=episode.user.full_name,
-                    student_fullname=episode.student.full_name,
-                ),
-                actor=episode.user,
-                action_object=episode,
-                recipient=mapped_user,
-                timestamp=episode.created_at,
-            )
-
-            cls.send_new_notification_to_websocket(mapped_user.id)
+                    "sender": episode.user,
+                    "action_object": episode,
+                    "recipient": mapped_users,
+                    "timestamp": episode.created_at,
+                }
+            ]
+        )
+
+        cls.send_new_notification_to_websockets(
+            [mapped_user.id for mapped_user in mapped_users]
+        )
@@ -1,20 +1,177 @@
+import asyncio
+import functools
+import threading
+import weakref
+
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+
+import constants
 
 
 class NotificationWebsocketMixin:
+    # user ids waiting for the current transaction to be committed and the
+    # flush scheduled for them, by class: every class flushes its own ids
+    # with its own `prepare_data`
+    _pending = threading.local()
+
     @classmethod
-    def prepare_data(cls):
-        return {"new_notification": True}
+    def prepare_data(cls, unread_count=None):
+        data = {"new_notification": True}
+
+        if unread_count is not None:
+            data["unread_count"] = unread_count
+
+        return data
+
+    @classmethod
+    def get_group_name(cls, user_id):
+        return "user_{}".format(user_id)
 
     @classmethod
     def send_new_notification_to_websocket(cls, user_id):
-        data = cls.prepare_data()
+        cls.send_new_notification_to_websockets([user_id])
 
-        channel_layer = get_channel_layer()
+    @classmethod
+    def send_new_notification_to_websockets(cls, user_ids):
+        """Queue a "new notification" push for every user in `user_ids`.
+
+        Pushes are coalesced per thread and only dispatched once the
+        current transaction commits (immediately in autocommit mode), so
+        the same user is notified at most once per transaction.
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+
+        if cls.is_flush_scheduled():
+            cls.get_pending_user_ids().update(user_ids)
+            return
+
+        # any leftover ids belong to a rolled back transaction
+        cls.get_pending()[cls] = set(user_ids)
+
+        flush = functools.partial(cls.flush_pending_notifications)
+        cls.get_scheduled_flushes()[cls] = weakref.ref(flush)
+        transaction.on_commit(flush)
+
+    @classmethod
+    def is_flush_scheduled(cls):
+        # only the on commit hooks of the connection hold the flush, they
+        # are dropped with it when the transaction is rolled back
+        flush = cls.get_scheduled_flushes().get(cls)
+
+        return flush is not None and flush() is not None
+
+    @classmethod
+    def get_pending(cls):
+        if not hasattr(cls._pending, "user_ids"):
+            cls._pending.user_ids = {}
+
+        return cls._pending.user_ids
+
+    @classmethod
+    def get_scheduled_flushes(cls):
+        if not hasattr(cls._pending, "flushes"):
+            cls._pending.flushes = {}
+
+        return cls._pending.flushes
 
-        group_name = "user_{}".format(user_id)
+    @classmethod
+    def get_pending_user_ids(cls):
+        return cls.get_pending().setdefault(cls, set())
+
+    @classmethod
+    def get_class_path(cls):
+        return "{}.{}".format(cls.__module__, cls.__qualname__)
+
+    @classmethod
+    def flush_pending_notifications(cls):
+        cls.get_scheduled_flushes().pop(cls, None)
+        user_ids = cls.get_pending().pop(cls, None)
+        if not user_ids:
+            return
+
+        user_ids = sorted(user_ids)
+
+        if settings.WEBSOCKET_NOTIFICATION_USE_CELERY:
+            from tasks import websocket
+
+            websocket.send_new_notifications_to_websockets.delay(
+                user_ids, cls.get_class_path()
+            )
+            return
+
+        cls.dispatch_new_notifications(user_ids)
+
+    @classmethod
+    def dispatch_new_notifications(cls, user_ids):
+        unread_counts = cls.get_unread_counts(user_ids)
+
+        async_to_sync(cls.group_send_many)(
+            [
+                (
+                    cls.get_group_name(user_id),
+                    {
+                        "type": "send_message",
+                        "data": cls.prepare_data(
+                            unread_count=unread_counts.get(user_id, 0)
+                        ),
+                    },
+                )
+                for user_id in user_ids
+            ]
+        )
+
+    @classmethod
+    def get_unread_counts(cls, user_ids):
+        """Unread notification counts as listed by `/notifications/unread`,
+        computed for all users at once."""
+        from main.models import User
+
+        users = (
+            User.objects.filter(pk__in=user_ids)
+            .annotate(
+                normal_unread_count=Count(
+                    "notifications",
+                    filter=Q(
+                        notifications__unread=True,
+                        notifications__verb__in=(
+                            constants.Activity.NORMAL_VERBS
+                        ),
+                    ),
+                ),
+                dlp_unread_count=Count(
+                    "notifications",
+                    filter=Q(
+                        notifications__unread=True,
+                        notifications__verb__in=constants.Activity.DLP_VERBS,
+                    ),
+                ),
+            )
+            .values_list(
+                "id", "role", "normal_unread_count", "dlp_unread_count"
+            )
+        )
+
+        unread_counts = {}
+        for user_id, role, normal_unread_count, dlp_unread_count in users:
+            unread_counts[user_id] = normal_unread_count
+            if role == constants.Role.EXPERIMENTAL_TEACHER:
+                unread_counts[user_id] = dlp_unread_count
+
+        return unread_counts
+
+    @classmethod
+    async def group_send_many(cls, messages):
+        channel_layer = get_channel_layer()
 
-        async_to_sync(channel_layer.group_send)(
-            group_name, {"type": "send_message", "data": data}
+        await asyncio.gather(
+            *(
+                channel_layer.group_send(group_name, message)
+                for group_name, message in messages
+            )
         )
@@ -40,6 +40,11 @@ class ExampleAdmin(ImportExportModelAdmin, CompareVersionAdmin):
         "is_bookmarked",
     )
     search_fields = ("description", "tip__title")
+    readonly_fields = (
+        "rating_count",
+        "clarity_average_rating",
+        "recommended_average_rating",
+    )
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
@@ -21,6 +21,7 @@ from .filters import (
 class TipResource(SelectFieldResourceMixin, ModelResource):
     class Meta:
         model = Tip
+        exclude = ("search_vector",)
 
 
 @admin.register(Tip)
@@ -61,6 +62,12 @@ class TipAdmin(
         ("created_at", DateRangeFilter),
         TagSelect2Filter,
     )
+    readonly_fields = (
+        "rating_count",
+        "clarity_average_rating",
+        "relevance_average_rating",
+        "uniqueness_average_rating",
+    )
 
     resource_class = TipResource
     export_filterset_class = TipExportFilterset
@@ -2,14 +2,18 @@ from django.contrib import admin
 from rangefilter.filters import DateRangeFilter
 
 from libs.import_export import BaseImportExportModelAdmin
+from libs.import_export.mixin import BackgroundExportModelAdminMixin
 from libs.import_export.resources import TipRatingResource
+from tasks import export_tip_ratings
 
 from ..models import TipRating
 from .filters import TipRatingExportFilterset
 
 
 @admin.register(TipRating)
-class TipRatingAdmin(BaseImportExportModelAdmin):
+class TipRatingAdmin(
+    BackgroundExportModelAdminMixin, BaseImportExportModelAdmin
+):
     list_display = (
         "id",
         "tip",
@@ -54,6 +58,7 @@ class TipRatingAdmin(BaseImportExportModelAdmin):
 
     resource_class = TipRatingResource
     export_filterset_class = TipRatingExportFilterset
+    export_task = export_tip_ratings
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from main.models import User, UserActivitySummary
+
+
+class Command(BaseCommand):
+    help = "Rebuild the user activity summaries from the notifications"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of users rebuilt per transaction",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        user_ids = list(
+            User.objects.order_by("id").values_list("id", flat=True)
+        )
+        for start in range(0, len(user_ids), batch_size):
+            UserActivitySummary.objects.rebuild(
+                user_ids[start : start + batch_size]
+            )
+
+        self.stdout.write(
+            "Rebuilt {} activity summaries".format(len(user_ids))
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.models import Example, Tip
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full text search vectors of tips and examples"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows updated per transaction",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model in (Tip, Example):
+            updated = self.backfill(model, batch_size)
+            self.stdout.write(
+                "Updated {} {} rows".format(updated, model._meta.model_name)
+            )
+
+    def backfill(self, model, batch_size):
+        ids = list(model.objects.order_by("id").values_list("id", flat=True))
+
+        updated = 0
+        for start in range(0, len(ids), batch_size):
+            batch_ids = ids[start : start + batch_size]
+            with transaction.atomic():
+                updated += model.objects.filter(
+                    id__in=batch_ids
+                ).update_search_vector()
+
+        return updated
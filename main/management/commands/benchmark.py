@@ -0,0 +1,215 @@
+import importlib
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from notifications.models import Notification
+
+from main.models import Example, Student, StudentTip, Tip, TipRating, User
+
+
+def load_benchmark():
+    """The benchmark harness, it seeds with the test factories which need
+    the dev requirements, missing from the deployed images."""
+    try:
+        return importlib.import_module("tests.benchmark")
+    except ImportError as e:
+        raise CommandError(
+            "The benchmark needs the dev requirements, install "
+            "requirements.dev.txt first ({})".format(e)
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the hot endpoints and Celery tasks, recording the latency "
+        "percentiles and query counts to a JSON baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Insert the benchmark volumes before running",
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Do not ask before seeding the database",
+        )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplier of the default seeded volumes",
+        )
+        try:
+            volumes = load_benchmark().BenchmarkSeeder.VOLUMES
+        except CommandError:
+            # handle reports the missing requirements
+            volumes = {}
+        for name in volumes:
+            parser.add_argument(
+                "--{}".format(name.replace("_", "-")),
+                type=int,
+                dest=name,
+                help="Number of {} to seed".format(name.replace("_", " ")),
+            )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted per query when seeding",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Number of measured runs of every scenario",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="Number of runs of every scenario before measuring",
+        )
+        parser.add_argument(
+            "--label",
+            default="",
+            help="Label stored in the baseline, e.g. the commit",
+        )
+        parser.add_argument(
+            "--output", help="Path of the JSON baseline to write"
+        )
+        parser.add_argument(
+            "--compare", help="Path of a JSON baseline to compare with"
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10,
+            help="Latency growth (percent) reported as a regression",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when a scenario regressed",
+        )
+
+    def handle(self, *args, **options):
+        self.benchmark = load_benchmark()
+
+        if options["seed"]:
+            self.seed(options)
+
+        user = self.benchmark.BenchmarkSeeder.get_benchmark_user()
+        if user is None:
+            raise CommandError("No benchmark data, run with --seed first")
+
+        runner = self.benchmark.BenchmarkRunner(
+            user,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+        )
+        try:
+            results = runner.run()
+        except self.benchmark.BenchmarkError as e:
+            raise CommandError(str(e))
+
+        baseline = {
+            "label": options["label"],
+            "created_at": timezone.now().isoformat(),
+            "volumes": self.get_volumes(),
+            "results": results,
+        }
+        self.write_results(results)
+
+        if options["output"]:
+            self.benchmark.Baseline.dump(baseline, options["output"])
+            self.stdout.write(
+                "Baseline written to {}".format(options["output"])
+            )
+
+        if options["compare"]:
+            regressions = self.compare(
+                self.benchmark.Baseline.load(options["compare"]),
+                baseline,
+                options["threshold"],
+            )
+            if regressions and options["fail_on_regression"]:
+                raise CommandError(
+                    "{} metrics regressed".format(len(regressions))
+                )
+
+    def seed(self, options):
+        seeder_class = self.benchmark.BenchmarkSeeder
+        volumes = seeder_class.get_volumes(
+            scale=options["scale"],
+            **{name: options[name] for name in seeder_class.VOLUMES},
+        )
+
+        if options["interactive"]:
+            answer = input(
+                "This inserts {} into the database, type 'yes' to "
+                "continue: ".format(
+                    ", ".join(
+                        "{} {}".format(volume, name)
+                        for name, volume in volumes.items()
+                    )
+                )
+            )
+            if answer != "yes":
+                raise CommandError("Seeding cancelled")
+
+        seeder = seeder_class(
+            volumes, batch_size=options["batch_size"], stdout=self.stdout
+        )
+        seeder.seed()
+
+    def get_volumes(self):
+        models = [User, Student, Tip, Example, StudentTip, TipRating]
+        volumes = {
+            model._meta.model_name: model.objects.count() for model in models
+        }
+        volumes["notification"] = Notification.objects.count()
+
+        return volumes
+
+    def write_results(self, results):
+        self.stdout.write(
+            "{:<45} {:>10} {:>10} {:>10} {:>8}".format(
+                "scenario", "p50 ms", "p90 ms", "p99 ms", "queries"
+            )
+        )
+        for name, summary in results.items():
+            self.stdout.write(
+                "{:<45} {:>10.2f} {:>10.2f} {:>10.2f} {:>8}".format(
+                    name,
+                    summary["p50_ms"],
+                    summary["p90_ms"],
+                    summary["p99_ms"],
+                    summary["queries"],
+                )
+            )
+
+    def compare(self, old, new, threshold):
+        self.stdout.write(
+            "Compared with {} ({})".format(
+                old.get("label") or "baseline", old.get("created_at")
+            )
+        )
+
+        regressions = []
+        for row in self.benchmark.Baseline.compare(old, new, threshold):
+            name, metric, old_value, new_value, change, is_regression = row
+            line = "{:<45} {:<8} {:>10} -> {:<10} {:+.1f}%".format(
+                name, metric, old_value, new_value, change
+            )
+            if is_regression:
+                regressions.append(line)
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        return regressions
@@ -52,17 +52,36 @@ class UserManager(BaseUserManager):
         return queryset
 
     def managers(self):
-        key_name = constants.Cache.MANAGER_USERS_CACHE_KEY
-        value = cache.get(key_name)
+        return self.get_queryset().filter(role__in=constants.Role.MANAGERS)
 
-        if value:
-            return value
+    def manager_ids(self):
+        """Ids of the manager users, cached until a user becomes or stops
+        being a manager."""
+        key_name = constants.Cache.MANAGER_USER_IDS_CACHE_KEY
+        manager_ids = cache.get(key_name)
 
-        queryset = self.get_queryset().filter(role__in=constants.Role.MANAGERS)
+        if manager_ids is None:
+            manager_ids = list(
+                self.managers().order_by("id").values_list("id", flat=True)
+            )
+            cache.set(
+                key_name, manager_ids, timeout=constants.Cache.TIMEOUT_A_DAY
+            )
 
-        cache.set(key_name, queryset, timeout=constants.Cache.TIMEOUT_A_DAY)
+        return manager_ids
 
-        return queryset
+    def invalidate_manager_ids(self, user):
+        """Drop the cached manager ids when `user` joined or left them."""
+        key_name = constants.Cache.MANAGER_USER_IDS_CACHE_KEY
+        manager_ids = cache.get(key_name)
+        if manager_ids is None:
+            return
+
+        is_manager = (
+            user.pk is not None and user.role in constants.Role.MANAGERS
+        )
+        if is_manager != (user.pk in manager_ids):
+            cache.delete(key_name)
 
     def annotate_full_name(self):
         queryset = self.get_queryset().annotate(
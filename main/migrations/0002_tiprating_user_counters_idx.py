@@ -0,0 +1,78 @@
+# Generated by Django 3.2.13 on 2026-10-18 19:04
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_ratings_without_student(apps, schema_editor):
+    """Keep the latest rating of every (user, tip) pair without a student,
+    adding up the counters of the duplicates."""
+    TipRating = apps.get_model("main", "TipRating")
+
+    ratings = TipRating.objects.filter(student__isnull=True)
+    duplicates = (
+        ratings.values("added_by_id", "tip_id")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+
+    for duplicate in duplicates:
+        kept, *others = ratings.filter(
+            added_by_id=duplicate["added_by_id"], tip_id=duplicate["tip_id"]
+        ).order_by("-updated_at", "-id")
+
+        for other in others:
+            kept.read_count += other.read_count
+            kept.try_count += other.try_count
+            kept.helpful_count += other.helpful_count
+        kept.save(update_fields=["read_count", "try_count", "helpful_count"])
+
+        TipRating.objects.filter(
+            id__in=[other.id for other in others]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0001_initial"),
+    ]
+
+    operations = [
+        # the user counters join expects at most one rating without student
+        # per (user, tip), which the old constraint never enforced because
+        # NULL students do not conflict
+        migrations.RemoveConstraint(
+            model_name="tiprating",
+            name="unique_3_fields_together_with_conditions",
+        ),
+        migrations.RunPython(
+            merge_ratings_without_student,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="tiprating",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("student__isnull", True)),
+                fields=("added_by", "tip"),
+                name="unique_user_tip_without_student",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tiprating",
+            index=models.Index(
+                fields=["added_by", "tip", "student"],
+                include=(
+                    "read_count",
+                    "try_count",
+                    "helpful_count",
+                    "retry_later",
+                    "clarity",
+                    "relevance",
+                    "uniqueness",
+                ),
+                name="tiprating_user_counters_idx",
+            ),
+        ),
+    ]
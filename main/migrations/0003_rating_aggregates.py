@@ -0,0 +1,48 @@
+# Generated by Django 3.2.13 on 2026-10-18 19:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0002_tiprating_user_counters_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="example",
+            name="clarity_average_rating",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="example",
+            name="rating_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="example",
+            name="recommended_average_rating",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tip",
+            name="clarity_average_rating",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tip",
+            name="rating_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tip",
+            name="relevance_average_rating",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tip",
+            name="uniqueness_average_rating",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 3.2.13 on 2026-10-18 19:11
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchConfig,
+    SearchVector,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db import migrations
+from django.db.models import Func
+
+
+class JSONSearchVector(SearchVectorCombinable, Func):
+    template = (
+        "setweight(COALESCE(jsonb_to_tsvector(%(expressions)s, "
+        "'[\"string\"]'), ''::tsvector), '%(weight)s')"
+    )
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, config, weight):
+        super().__init__(
+            SearchConfig.from_parameter(config), expression, weight=weight
+        )
+
+
+def backfill_search_vectors(apps, schema_editor):
+    """Fill the new columns, searches only match rows with a vector."""
+    config = settings.SEARCH_CONFIG
+
+    Tip = apps.get_model("main", "Tip")
+    Tip.objects.update(
+        search_vector=(
+            SearchVector("title", weight="A", config=config)
+            + SearchVector(
+                "description", "tip_summary", weight="B", config=config
+            )
+            + SearchVector("sub_goal", weight="C", config=config)
+            + JSONSearchVector("child_context", config, "D")
+            + JSONSearchVector("environment_context", config, "D")
+        )
+    )
+
+    Example = apps.get_model("main", "Example")
+    Example.objects.update(
+        search_vector=SearchVector("description", weight="A", config=config)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0003_rating_aggregates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="example",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="tip",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="example",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="example_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tip",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="tip_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(
+            backfill_search_vectors,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("main", "0004_search_vectors"),
+        ("notifications", "0008_index_together_recipient_unread"),
+    ]
+
+    operations = [
+        # serves the (timestamp, id) keyset pages of a user's notifications,
+        # built concurrently not to lock the writes to the table
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "notification_recipient_timestamp_idx "
+                "ON notifications_notification "
+                "(recipient_id, timestamp DESC, id DESC);"
+            ),
+            reverse_sql=(
+                "DROP INDEX CONCURRENTLY IF EXISTS "
+                "notification_recipient_timestamp_idx;"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.13 on 2026-10-18 19:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_notification_recipient_timestamp_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserActivitySummary",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="activity_summary",
+                        serialize=False,
+                        to="main.user",
+                    ),
+                ),
+                (
+                    "last_activity",
+                    models.DateTimeField(
+                        null=True, verbose_name="Last activity"
+                    ),
+                ),
+                ("recent_tips", models.JSONField(default=list)),
+                ("recent_examples", models.JSONField(default=list)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -13,6 +13,7 @@ from .timeline import Timeline
 from .tip import Tip
 from .tip_rating import TipRating
 from .user import User
+from .user_activity_summary import UserActivitySummary
 from .user_student_mapping import UserStudentMapping
 
 __all__ = [
@@ -27,6 +28,7 @@ __all__ = [
     "Timeline",
     "Tip",
     "User",
+    "UserActivitySummary",
     "UserStudentMapping",
     "TipRating",
     "ExampleRating",
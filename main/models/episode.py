@@ -10,6 +10,15 @@ from ..querysets import EpisodeQuerySet
 
 
 class Episode(BaseModel):
+    # columns that can be hundreds of KB, left out of list pages
+    LARGE_TEXT_FIELDS = [
+        "description_html",
+        "description_ids",
+        "transcript_html",
+        "transcript",
+        "transcript_ids",
+    ]
+
     objects = EpisodeQuerySet.as_manager()
 
     tags = TaggableManager()
@@ -73,11 +82,15 @@ class Episode(BaseModel):
 
     @cached_property
     def writers(self):
-        examples = self.example_set.all()
-
-        added_bys = set([example.added_by for example in examples])
+        """Users that added the examples of the episode, reads the
+        `example_set` prefetched by `EpisodeQuerySet.prefetch_writers`
+        when there is one."""
+        writers = {}
+        for example in self.example_set.all():
+            if example.added_by_id is not None:
+                writers.setdefault(example.added_by_id, example.added_by)
 
-        return list(added_bys)
+        return list(writers.values())
 
     @cached_property
     def contributors(self):
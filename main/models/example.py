@@ -1,7 +1,8 @@
 import reversion
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Avg
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
@@ -13,7 +14,15 @@ from ..querysets import ExampleQuerySet
 from .notification import ExampleNotification
 
 
-@reversion.register()
+@reversion.register(
+    # kept in sync by the signals, a revert must not bring back old values
+    exclude=[
+        "rating_count",
+        "clarity_average_rating",
+        "recommended_average_rating",
+        "search_vector",
+    ]
+)
 class Example(BaseModel, ExampleNotification):
     objects = ExampleQuerySet.as_manager()
 
@@ -81,42 +90,44 @@ class Example(BaseModel, ExampleNotification):
         null=True,
     )
 
+    # rating aggregates, kept in sync by the example rating signals
+    rating_count = models.IntegerField(default=0)
+    clarity_average_rating = models.FloatField(null=True, blank=True)
+    recommended_average_rating = models.FloatField(null=True, blank=True)
+
+    # kept in sync by the example signals,
+    # see ExampleQuerySet.update_search_vector
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         unique_together = [("tip", "description")]
+        indexes = [
+            GinIndex(
+                fields=["search_vector"], name="example_search_vector_idx"
+            ),
+        ]
 
     @property
     def updated_by_username(self):
         return self.updated_by.username
 
-    @cached_property
+    @property
     def average_ratings(self):
-        average_ratings = self.examplerating_set.aggregate(
-            clarity_average_rating=Avg("clarity"),
-            recommended_average_rating=Avg("recommended"),
-        )
-        average_ratings["average_rating"] = None
-        if average_ratings["clarity_average_rating"] is not None:
-            average_ratings["average_rating"] = (
-                average_ratings["clarity_average_rating"]
-                + average_ratings["recommended_average_rating"]
-            ) / 2.0
-            average_ratings["average_rating"] = round(
-                average_ratings["average_rating"], 2
-            )
-
-        return average_ratings
-
-    @cached_property
-    def clarity_average_rating(self):
-        return self.average_ratings["clarity_average_rating"]
-
-    @cached_property
-    def recommended_average_rating(self):
-        return self.average_ratings["recommended_average_rating"]
+        return {
+            "clarity_average_rating": self.clarity_average_rating,
+            "recommended_average_rating": self.recommended_average_rating,
+            "average_rating": self.average_rating,
+        }
 
-    @cached_property
+    @property
     def average_rating(self):
-        return self.average_ratings["average_rating"]
+        if self.clarity_average_rating is None:
+            return None
+
+        average_rating = (
+            self.clarity_average_rating + self.recommended_average_rating
+        ) / 2.0
+        return round(average_rating, 2)
 
     @cached_property
     def episode_student_id(self):
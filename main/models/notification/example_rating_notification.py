@@ -12,7 +12,7 @@ class ExampleRatingNotification:
         if not added_by:
             return []
 
-        manager_users = User.objects.managers()
+        manager_ids = User.objects.manager_ids()
 
         notifications = [
             {
@@ -35,7 +35,7 @@ class ExampleRatingNotification:
             notifications.append(
                 {
                     "sender": added_by,
-                    "recipient": manager_users,
+                    "recipient": manager_ids,
                     "description": format_lazy(
                         _(
                             "Teacher {user_fullname} has rated example "
@@ -12,7 +12,7 @@ class StudentNotification:
         if not added_by:
             return []
 
-        manager_users = User.objects.managers()
+        manager_ids = User.objects.manager_ids()
 
         notifications = [
             {
@@ -33,7 +33,7 @@ class StudentNotification:
             notifications.append(
                 {
                     "sender": added_by,
-                    "recipient": manager_users,
+                    "recipient": manager_ids,
                     "description": format_lazy(
                         _(
                             "A new student {student_fullname} is created by "
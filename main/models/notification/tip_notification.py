@@ -12,7 +12,7 @@ class TipNotification:
         if not added_by:
             return []
 
-        manager_users = User.objects.managers()
+        manager_ids = User.objects.manager_ids()
 
         notifications = [
             {
@@ -32,7 +32,7 @@ class TipNotification:
             notifications.append(
                 {
                     "sender": added_by,
-                    "recipient": manager_users,
+                    "recipient": manager_ids,
                     "description": format_lazy(
                         _(
                             "Teacher {user_fullname} has created "
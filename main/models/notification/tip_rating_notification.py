@@ -10,7 +10,7 @@ class TipRatingNotification:
 
         added_by = self.added_by
 
-        manager_users = User.objects.managers()
+        manager_ids = User.objects.manager_ids()
 
         notifications = [
             {
@@ -32,7 +32,7 @@ class TipRatingNotification:
             notifications.append(
                 {
                     "sender": added_by,
-                    "recipient": manager_users,
+                    "recipient": manager_ids,
                     "description": format_lazy(
                         _(
                             "Teacher {user_fullname} has rated tip "
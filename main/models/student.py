@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import CharField, F, Q, Value
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
@@ -11,6 +13,13 @@ from .notification import StudentNotification
 
 
 class Student(BaseModel, StudentNotification):
+    # activity type: (related manager, title field, user field)
+    ACTIVITY_SOURCES = {
+        "episode": ("episode_set", "title", "user"),
+        "example": ("examples", "headline", "added_by"),
+        "tip": ("tips", "title", "added_by"),
+    }
+
     objects = StudentQuerySet.as_manager()
 
     tags = TaggableManager()
@@ -42,34 +51,13 @@ class Student(BaseModel, StudentNotification):
 
     @property
     def heads_up(self):
-        heads_up_list = []
-        for episode in self.episode_set.order_by("-id"):
-            if not episode.heads_up_json:
-                continue
-            heads_up = episode.heads_up_json
-            heads_up["date"] = episode.date
-            heads_up["episode"] = episode.id
-            heads_up_list.append(heads_up)
-
-        return heads_up_list
+        return list(self.episode_set.heads_up())
 
     @property
     def last_month_heads_up(self):
         last_month = timezone.localtime() - timezone.timedelta(days=30)
-        last_month_episodes = self.episode_set.filter(
-            date__gte=last_month
-        ).order_by("-id")
-
-        heads_up_list = []
-        for episode in last_month_episodes:
-            if not episode.heads_up_json:
-                continue
-            heads_up = episode.heads_up_json
-            heads_up["date"] = episode.date
-            heads_up["episode"] = episode.id
-            heads_up_list.append(heads_up)
 
-        return heads_up_list
+        return list(self.episode_set.heads_up(start_date=last_month))
 
     @property
     def last_episode(self):
@@ -77,8 +65,13 @@ class Student(BaseModel, StudentNotification):
 
     @property
     def monitoring(self):
-        if self.last_episode:
-            return self.last_episode.heads_up_json.get("monitoring")
+        heads_up = (
+            self.episode_set.order_by("-id")
+            .values_list("heads_up_json", flat=True)
+            .first()
+        )
+        if heads_up:
+            return heads_up.get("monitoring")
 
         return None
 
@@ -91,9 +84,98 @@ class Student(BaseModel, StudentNotification):
         return self.get_full_name()
 
     def dequeue_tips(self, number_of_tips):
-        queued_tips = self.studenttip_set.filter(is_queued=True).order_by("?")[
-            :number_of_tips
+        return self.studenttip_set.dequeue(number_of_tips)
+
+    def get_activities(
+        self, start_date=None, end_date=None, before=None, limit=None
+    ):
+        """Episodes, examples and tips of the student updated in the date
+        window, newest first, as `type, id, title, updated_at, user` dicts.
+
+        The three tables are read with a single UNION of those columns
+        ordered and limited in SQL. `before` is the
+        `(updated_at, type, id)` of the last activity already returned.
+        """
+        activities = None
+        for activity_type in self.ACTIVITY_SOURCES:
+            queryset = self.get_activities_of_type(
+                activity_type, start_date, end_date, before
+            )
+            activities = (
+                queryset if activities is None else activities.union(queryset)
+            )
+
+        activities = activities.order_by(
+            "-activity_updated_at", "-activity_type", "-activity_id"
+        )
+        if limit:
+            activities = activities[:limit]
+
+        activities = [
+            {
+                "type": activity_type,
+                "id": activity_id,
+                "title": title,
+                "updated_at": updated_at,
+                "user": user_id,
+            }
+            for updated_at, activity_type, activity_id, title, user_id in (
+                activities
+            )
         ]
-        queued_tips = [queued_tip.id for queued_tip in queued_tips]
 
-        self.studenttip_set.filter(id__in=queued_tips).update(is_queued=False)
+        users = get_user_model().objects.in_bulk(
+            {activity["user"] for activity in activities} - {None}
+        )
+        for activity in activities:
+            activity["user"] = users.get(activity["user"])
+
+        return activities
+
+    def get_activities_of_type(
+        self, activity_type, start_date=None, end_date=None, before=None
+    ):
+        related_name, title_field, user_field = self.ACTIVITY_SOURCES[
+            activity_type
+        ]
+        queryset = getattr(self, related_name).order_by()
+
+        if start_date:
+            queryset = queryset.filter(updated_at__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(updated_at__lt=end_date)
+        if before:
+            queryset = queryset.filter(
+                self.get_activities_before_filter(activity_type, *before)
+            )
+
+        # annotations only, so every part of the UNION selects the same
+        # columns in the same order
+        return queryset.annotate(
+            activity_updated_at=F("updated_at"),
+            activity_type=Value(activity_type, output_field=CharField()),
+            activity_id=F("id"),
+            activity_title=F(title_field),
+            activity_user=F(user_field),
+        ).values_list(
+            "activity_updated_at",
+            "activity_type",
+            "activity_id",
+            "activity_title",
+            "activity_user",
+        )
+
+    @classmethod
+    def get_activities_before_filter(
+        cls, activity_type, updated_at, before_type, before_id
+    ):
+        """Activities of `activity_type` that come after the
+        `(updated_at, before_type, before_id)` position in the newest
+        first ordering."""
+        if activity_type < before_type:
+            return Q(updated_at__lte=updated_at)
+        if activity_type == before_type:
+            return Q(updated_at__lt=updated_at) | Q(
+                updated_at=updated_at, id__lt=before_id
+            )
+        return Q(updated_at__lt=updated_at)
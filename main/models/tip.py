@@ -1,8 +1,8 @@
 import reversion
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Avg
-from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
 
@@ -13,7 +13,16 @@ from ..querysets import TipQuerySet
 from .notification import TipNotification
 
 
-@reversion.register()
+@reversion.register(
+    # kept in sync by the signals, a revert must not bring back old values
+    exclude=[
+        "rating_count",
+        "clarity_average_rating",
+        "relevance_average_rating",
+        "uniqueness_average_rating",
+        "search_vector",
+    ]
+)
 class Tip(BaseModel, TipNotification):
     objects = TipQuerySet.as_manager()
 
@@ -99,53 +108,50 @@ class Tip(BaseModel, TipNotification):
 
     helpful_count = models.IntegerField(default=0)
 
+    # rating aggregates, kept in sync by the tip rating signals
+    rating_count = models.IntegerField(default=0)
+    clarity_average_rating = models.FloatField(null=True, blank=True)
+    relevance_average_rating = models.FloatField(null=True, blank=True)
+    uniqueness_average_rating = models.FloatField(null=True, blank=True)
+
     tip_summary = models.TextField(null=True, blank=True)
 
+    # kept in sync by the tip signals, see TipQuerySet.update_search_vector
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return "Tip: %s" % self.title
 
     class Meta:
         unique_together = ["state", "substate", "levels", "title"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="tip_search_vector_idx"),
+        ]
 
     @property
     def updated_by_username(self):
         return self.updated_by.username
 
-    @cached_property
+    @property
     def average_ratings(self):
-        average_ratings = self.tiprating_set.aggregate(
-            clarity_average_rating=Avg("clarity"),
-            relevance_average_rating=Avg("relevance"),
-            uniqueness_average_rating=Avg("uniqueness"),
-        )
-        average_ratings["average_rating"] = None
-        if average_ratings["clarity_average_rating"] is not None:
-            average_ratings["average_rating"] = (
-                average_ratings["clarity_average_rating"]
-                + average_ratings["relevance_average_rating"]
-                + average_ratings["uniqueness_average_rating"]
-            ) / 3.0
-            average_ratings["average_rating"] = round(
-                average_ratings["average_rating"], 2
-            )
-
-        return average_ratings
-
-    @cached_property
-    def clarity_average_rating(self):
-        return self.average_ratings["clarity_average_rating"]
-
-    @cached_property
-    def relevance_average_rating(self):
-        return self.average_ratings["relevance_average_rating"]
-
-    @cached_property
-    def uniqueness_average_rating(self):
-        return self.average_ratings["uniqueness_average_rating"]
-
-    @cached_property
+        return {
+            "clarity_average_rating": self.clarity_average_rating,
+            "relevance_average_rating": self.relevance_average_rating,
+            "uniqueness_average_rating": self.uniqueness_average_rating,
+            "average_rating": self.average_rating,
+        }
+
+    @property
     def average_rating(self):
-        return self.average_ratings["average_rating"]
+        if self.clarity_average_rating is None:
+            return None
+
+        average_rating = (
+            self.clarity_average_rating
+            + self.relevance_average_rating
+            + self.uniqueness_average_rating
+        ) / 3.0
+        return round(average_rating, 2)
 
     def _extrace_context_values(self, context_data):
         values = []
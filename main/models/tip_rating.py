@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import Q, UniqueConstraint
+from django.db.models import Index, Q, UniqueConstraint
 from django.utils.translation import gettext_lazy as _
 
 from libs.base_model import BaseModel
@@ -69,9 +69,26 @@ class TipRating(BaseModel, TipRatingNotification):
                 fields=("added_by", "tip", "student"),
                 name="unique_3_fields_together",
             ),
+            # NULL students never conflict in the constraint above
             UniqueConstraint(
-                fields=("added_by", "tip", "student"),
+                fields=("added_by", "tip"),
                 condition=Q(student__isnull=True),
-                name="unique_3_fields_together_with_conditions",
+                name="unique_user_tip_without_student",
+            ),
+        ]
+        indexes = [
+            # lets the per-user tip counters be read from the index only
+            Index(
+                fields=("added_by", "tip", "student"),
+                include=(
+                    "read_count",
+                    "try_count",
+                    "helpful_count",
+                    "retry_later",
+                    "clarity",
+                    "relevance",
+                    "uniqueness",
+                ),
+                name="tiprating_user_counters_idx",
             ),
         ]
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+
+from libs.base_model import BaseModel
+
+from ..querysets import UserActivitySummaryQuerySet
+
+
+class UserActivitySummary(BaseModel):
+    """Rollup of a user's success notifications for the manager user grid,
+    maintained as notifications are written."""
+
+    objects = UserActivitySummaryQuerySet.as_manager()
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="activity_summary",
+    )
+    last_activity = models.DateTimeField(
+        verbose_name=_("Last activity"), null=True
+    )
+    # [[object id, iso timestamp], ...] newest first
+    recent_tips = models.JSONField(default=list)
+    recent_examples = models.JSONField(default=list)
+
+    def __str__(self):
+        return _("Activity summary: {user}").format(user=self.user_id)
+
+    def get_recent_activities(self, field):
+        return [
+            {object_id: parse_datetime(timestamp)}
+            for object_id, timestamp in getattr(self, field)
+        ]
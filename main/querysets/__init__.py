@@ -10,6 +10,7 @@ from .student_example import StudentExampleQuerySet
 from .student_tip import StudentTipQuerySet
 from .tip import TipQuerySet
 from .tip_rating import TipRatingQuerySet
+from .user_activity_summary import UserActivitySummaryQuerySet
 from .user_student_mapping import UserStudentMappingQuerySet
 
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
     "StudentTipQuerySet",
     "TipQuerySet",
     "TipRatingQuerySet",
+    "UserActivitySummaryQuerySet",
     "UserStudentMappingQuerySet",
     "OrganizationQuerySet",
     "RoleAssignmentQuerySet",
@@ -1,3 +1,5 @@
+from django.db.models import Prefetch
+
 import constants
 from libs.querysets import BaseQuerySet
 
@@ -19,3 +21,45 @@ class EpisodeQuerySet(BaseQuerySet):
             "values": constants.Environment.VALUES,
         },
     }
+    FULL_TEXT_SEARCH_FIELDS = {
+        "title": ("example__tip__search_vector", "A"),
+        "description": ("example__tip__search_vector", "B"),
+        "sub_goal": ("example__tip__search_vector", "C"),
+        "child_context": ("example__tip__search_vector", "D"),
+        "environment_context": ("example__tip__search_vector", "D"),
+        "example_description": ("example__search_vector", "A"),
+    }
+
+    def prefetch_writers(self):
+        """Prefetch the examples with their `added_by` user, reading only
+        the example columns needed to compute `Episode.writers`."""
+        from main.models import Example
+
+        examples = Example.objects.only(
+            "id", "episode_id", "added_by"
+        ).select_related("added_by")
+
+        return self.prefetch_related(Prefetch("example_set", examples))
+
+    def heads_up(self, start_date=None, end_date=None, limit=None):
+        """Yield the heads up of the episodes, newest first, reading only
+        the id, date and heads_up_json columns."""
+        queryset = self.filter(heads_up_json__isnull=False).exclude(
+            heads_up_json={}
+        )
+
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lt=end_date)
+
+        queryset = queryset.order_by("-id").values_list(
+            "id", "date", "heads_up_json"
+        )
+        if limit:
+            queryset = queryset[:limit]
+
+        for episode_id, date, heads_up in queryset.iterator():
+            heads_up["date"] = date
+            heads_up["episode"] = episode_id
+            yield heads_up
@@ -1,3 +1,7 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
 from django.db.models import Count, Q
 from django.db.models.functions import TruncDate
 from django.utils import timezone
@@ -6,6 +10,11 @@ from libs.querysets import BaseQuerySet
 
 
 class ExampleQuerySet(BaseQuerySet):
+    FULL_TEXT_SEARCH_FIELDS = {
+        "description": ("search_vector", "A"),
+    }
+    FULL_TEXT_SEARCH_RANK_VECTOR = "search_vector"
+
     def contributions(self, days=91, user_id=None):
         queryset = self
 
@@ -28,6 +37,43 @@ class ExampleQuerySet(BaseQuerySet):
 
         return queryset
 
+    @classmethod
+    def get_search_vector(cls):
+        return SearchVector(
+            "description", weight="A", config=settings.SEARCH_CONFIG
+        )
+
+    def update_search_vector(self):
+        return self.update(search_vector=self.get_search_vector())
+
+    def update_rating_aggregates(self):
+        from main.models import ExampleRating
+
+        return super().update_rating_aggregates(
+            ExampleRating.objects.all(),
+            "example",
+            {
+                "clarity_average_rating": "clarity",
+                "recommended_average_rating": "recommended",
+            },
+        )
+
+    def clarity_averages_by_tip(self, tip_ids):
+        """`(headline, clarity average)` of the rated examples of every tip
+        of `tip_ids` (ids or a subquery), read in one query from the
+        stored rating aggregates."""
+        examples = (
+            self.filter(tip_id__in=tip_ids, rating_count__gt=0)
+            .order_by("tip_id", "id")
+            .values_list("tip_id", "headline", "clarity_average_rating")
+        )
+
+        clarity_averages = defaultdict(list)
+        for tip_id, headline, clarity_average in examples:
+            clarity_averages[tip_id].append((headline, clarity_average))
+
+        return clarity_averages
+
     def by_user_id(self, user_id):
         queryset = self.filter(
             Q(updated_by_id=user_id) | Q(added_by_id=user_id)
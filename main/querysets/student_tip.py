@@ -1,5 +1,6 @@
-from django.db.models import Case, Exists, OuterRef, Value, When
-from django.db.models.functions import Coalesce
+from django.db import connections
+from django.db.models import Case, Exists, F, OuterRef, Value, When, Window
+from django.db.models.functions import Coalesce, Random, RowNumber
 
 import constants
 from libs.querysets import BaseQuerySet
@@ -23,6 +24,16 @@ class StudentTipQuerySet(BaseQuerySet):
             "values": constants.Environment.VALUES,
         },
     }
+    FULL_TEXT_SEARCH_FIELDS = {
+        "title": ("tip__search_vector", "A"),
+        "description": ("tip__search_vector", "B"),
+        "tip_summary": ("tip__search_vector", "B"),
+        "sub_goal": ("tip__search_vector", "C"),
+        "child_context": ("tip__search_vector", "D"),
+        "environment_context": ("tip__search_vector", "D"),
+        "example_description": ("tip__example__search_vector", "A"),
+    }
+    FULL_TEXT_SEARCH_RANK_VECTOR = "tip__search_vector"
 
     def annotate_browse_tips(self, user, student_id):
         from main.models import Example, TipRating
@@ -82,3 +93,31 @@ class StudentTipQuerySet(BaseQuerySet):
 
     def by_dlp(self, user_id):
         return self.filter(student__experimental_student__user_id=user_id)
+
+    def dequeue(self, number_of_tips):
+        """Unqueue up to `number_of_tips` random queued tips of every student
+        with a single UPDATE, returns the number of tips dequeued."""
+        queued_tips = (
+            self.filter(is_queued=True)
+            .order_by()
+            .annotate(
+                position=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("student_id")],
+                    order_by=Random().asc(),
+                )
+            )
+            .values("id", "position")
+        )
+        queued_tips_sql, params = queued_tips.query.sql_with_params()
+
+        table = self.model._meta.db_table
+        sql = (
+            "UPDATE {table} SET is_queued = false WHERE id IN ("
+            "SELECT id FROM ({queued_tips}) AS queued_tips "
+            "WHERE position <= %s)"
+        ).format(table=table, queued_tips=queued_tips_sql)
+
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql, (*params, number_of_tips))
+            return cursor.rowcount
@@ -1,10 +1,22 @@
+from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
-from django.db.models import Count, Exists, OuterRef, Q
+from django.contrib.postgres.search import SearchVector
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    Exists,
+    FilteredRelation,
+    OuterRef,
+    Q,
+    Value,
+    When,
+)
 from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 
 import constants
-from libs.querysets import BaseQuerySet
+from libs.querysets import BaseQuerySet, JSONSearchVector
 
 
 class TipQuerySet(BaseQuerySet):
@@ -25,6 +37,16 @@ class TipQuerySet(BaseQuerySet):
             "values": constants.Environment.VALUES,
         },
     }
+    FULL_TEXT_SEARCH_FIELDS = {
+        "title": ("search_vector", "A"),
+        "description": ("search_vector", "B"),
+        "tip_summary": ("search_vector", "B"),
+        "sub_goal": ("search_vector", "C"),
+        "child_context": ("search_vector", "D"),
+        "environment_context": ("search_vector", "D"),
+        "example_description": ("example__search_vector", "A"),
+    }
+    FULL_TEXT_SEARCH_RANK_VECTOR = "search_vector"
 
     def contributions(self, days=91, user_id=None):
         queryset = self
@@ -68,28 +90,84 @@ class TipQuerySet(BaseQuerySet):
 
         return queryset
 
-    def by_dlp(self, user):
-        from main.models import StudentTip, TipRating
+    def annotate_user_rating(self, user_id, **conditions):
+        """Annotate the user's own (student-less) rating counters.
 
-        queryset = self.filter(
-            studenttip__is_queued=False,
-            studenttip__student__experimental_student__user_id=user.id,
+        All counters come from a single LEFT JOIN on the rating, which is
+        unique per user and tip when there is no student.
+        """
+        rating_conditions = {
+            "tiprating__added_by_id": user_id,
+            "tiprating__student_id__isnull": True,
+        }
+        for field, value in conditions.items():
+            rating_conditions["tiprating__{}".format(field)] = value
+
+        queryset = self.annotate(
+            user_rating=FilteredRelation(
+                "tiprating", condition=Q(**rating_conditions)
+            )
+        ).annotate(
+            read_count=Coalesce("user_rating__read_count", 0),
+            try_count=Coalesce("user_rating__try_count", 0),
+            helpful_count_by_user=Coalesce("user_rating__helpful_count", 0),
+            is_rated=Case(
+                When(
+                    user_rating__clarity__gt=0,
+                    user_rating__relevance__gt=0,
+                    user_rating__uniqueness__gt=0,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
         )
 
-        tip_ratings = TipRating.objects.filter(
-            added_by_id=user.id,
-            tip_id=OuterRef("pk"),
-            student_id__isnull=True,
-            retry_later=True,
+        return queryset
+
+    @classmethod
+    def get_search_vector(cls):
+        config = settings.SEARCH_CONFIG
+
+        return (
+            SearchVector("title", weight="A", config=config)
+            + SearchVector(
+                "description", "tip_summary", weight="B", config=config
+            )
+            + SearchVector("sub_goal", weight="C", config=config)
+            + JSONSearchVector("child_context", config, "D")
+            + JSONSearchVector("environment_context", config, "D")
+        )
+
+    def update_search_vector(self):
+        return self.update(search_vector=self.get_search_vector())
+
+    def update_rating_aggregates(self):
+        from main.models import TipRating
+
+        return super().update_rating_aggregates(
+            TipRating.objects.all(),
+            "tip",
+            {
+                "clarity_average_rating": "clarity",
+                "relevance_average_rating": "relevance",
+                "uniqueness_average_rating": "uniqueness",
+            },
         )
 
-        is_rated = Exists(
-            tip_ratings.filter(
-                clarity__gt=0,
-                relevance__gt=0,
-                uniqueness__gt=0,
+    def by_dlp(self, user):
+        from main.models import StudentTip, TipRating
+
+        queryset = self.filter(
+            Exists(
+                StudentTip.objects.filter(
+                    tip_id=OuterRef("pk"),
+                    is_queued=False,
+                    student__experimental_student__user_id=user.id,
+                )
             )
         )
+
         student_tips = (
             StudentTip.objects.filter(
                 tip_id=OuterRef("pk"),
@@ -105,46 +183,15 @@ class TipQuerySet(BaseQuerySet):
                     retry_later=False, added_by_id=user.id
                 ).values_list("tip_id", flat=True)
             )
+            .annotate_user_rating(user.id, retry_later=True)
             .annotate(
-                read_count=Coalesce(tip_ratings.values("read_count")[:1], 0),
-                try_count=Coalesce(tip_ratings.values("try_count")[:1], 0),
-                helpful_count_by_user=Coalesce(
-                    tip_ratings.values("helpful_count")[:1], 0
-                ),
-                is_rated=is_rated,
                 graduated_for=Coalesce(
                     student_tips.values("graduated_for")[:1], []
                 ),
             )
-            .distinct()
         )
 
         return queryset
 
     def annotate_count_value(self, user_id):
-        from main.models import TipRating
-
-        tip_ratings = TipRating.objects.filter(
-            added_by_id=user_id,
-            student_id__isnull=True,
-            tip_id=OuterRef("pk"),
-        )
-
-        is_rated = Exists(
-            tip_ratings.filter(
-                clarity__gt=0,
-                relevance__gt=0,
-                uniqueness__gt=0,
-            )
-        )
-
-        queryset = self.annotate(
-            read_count=Coalesce(tip_ratings.values("read_count")[:1], 0),
-            try_count=Coalesce(tip_ratings.values("try_count")[:1], 0),
-            helpful_count_by_user=Coalesce(
-                tip_ratings.values("helpful_count")[:1], 0
-            ),
-            is_rated=is_rated,
-        )
-
-        return queryset
+        return self.annotate_user_rating(user_id)
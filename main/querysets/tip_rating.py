@@ -1,7 +1,14 @@
-from django.db import models
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections, models
 from django.db.models import Avg, F
 from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from libs.cache import TipReadBuffer
 
 
 class TipRatingQuerySet(models.QuerySet):
@@ -72,32 +79,217 @@ class TipRatingQuerySet(models.QuerySet):
         return instance
 
     def get_or_update_read_count(self, user, tip, student=None):
-        instance, _ = self.get_or_create(
-            added_by=user, tip=tip, student=student
+        return self.upsert(user, tip, student, increments=["read_count"])
+
+    def get_or_update_try_count(self, user, tip, student=None):
+        return self.upsert(user, tip, student, increments=["try_count"])
+
+    def get_or_update_retry_later(self, user, tip, retry_later, student=None):
+        return self.upsert(
+            user, tip, student, values={"retry_later": retry_later}
         )
 
-        instance.read_count += 1
-        instance.save(update_fields=["read_count"])
+    def record_read(self, user, tip, student=None):
+        """Count a read of `tip` and notify about it, either right away or
+        through the read buffer flushed by the `flush_tip_reads` task."""
+        if settings.TIP_READ_BUFFER_ENABLED:
+            TipReadBuffer.add(user.id, tip.id, student.id if student else None)
+            return
 
-        return instance
+        from tasks import notification
 
-    def get_or_update_try_count(self, user, tip, student=None):
-        instance, _ = self.get_or_create(
-            added_by=user, tip=tip, student=student
+        tip_rating = self.get_or_update_read_count(
+            user=user, tip=tip, student=student
+        )
+
+        notification.send_notifications(
+            tip_rating.generate_read_tip_rating_notification()
         )
 
-        instance.try_count += 1
-        instance.save(update_fields=["try_count"])
+    def flush_reads(self, reads):
+        """Add buffered `reads` to the read counters and write their
+        notifications in bulk."""
+        from django.contrib.auth import get_user_model
 
-        return instance
+        from libs.notification import NotificationBulkWriter
+        from main.models import Student, Tip
 
-    def get_or_update_retry_later(self, user, tip, retry_later, student=None):
-        instance, _ = self.get_or_create(
-            added_by=user, tip=tip, student=student
+        read_counts = defaultdict(int)
+        for read in reads:
+            read_counts[(read["user"], read["tip"], read["student"])] += 1
+
+        users = get_user_model().objects.in_bulk(
+            {read["user"] for read in reads}
+        )
+        tips = Tip.objects.in_bulk({read["tip"] for read in reads})
+        students = Student.objects.in_bulk(
+            {read["student"] for read in reads if read["student"]}
         )
 
-        instance.retry_later = retry_later
-        instance.save(update_fields=["retry_later"])
+        instances = [
+            self.model(
+                added_by=users[user_id],
+                tip=tips[tip_id],
+                student=students[student_id] if student_id else None,
+                read_count=count,
+            )
+            for (user_id, tip_id, student_id), count in read_counts.items()
+            if user_id in users
+            and tip_id in tips
+            and (student_id is None or student_id in students)
+        ]
+        tip_ratings = {
+            (
+                tip_rating.added_by_id,
+                tip_rating.tip_id,
+                tip_rating.student_id,
+            ): tip_rating
+            for tip_rating in self.bulk_upsert(
+                instances, increments=["read_count"]
+            )
+        }
+
+        notifications = []
+        for read in reads:
+            tip_rating = tip_ratings.get(
+                (read["user"], read["tip"], read["student"])
+            )
+            if tip_rating is None:
+                continue
+
+            for (
+                notification
+            ) in tip_rating.generate_read_tip_rating_notification():
+                notification["timestamp"] = parse_datetime(read["timestamp"])
+                notifications.append(notification)
+
+        NotificationBulkWriter.write(notifications)
+
+    def upsert(self, user, tip, student=None, increments=(), values=None):
+        values = values or {}
+
+        instance = self.model(
+            added_by=user,
+            tip=tip,
+            student=student,
+            **values,
+            **{counter: 1 for counter in increments},
+        )
+
+        [instance] = self.bulk_upsert(
+            [instance], increments=increments, fields=list(values)
+        )
+
+        return instance
+
+    def bulk_upsert(self, instances, increments=(), fields=()):
+        """Insert `instances` or update their existing (user, tip, student)
+        ratings with one INSERT ... ON CONFLICT DO UPDATE statement per
+        unique constraint.
+
+        The `increments` counters of an existing rating are increased by
+        the instance values and its `fields` overwritten. `post_save` is
+        only sent for the inserted rows. Each (user, tip, student) may
+        only appear once.
+        """
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        meta = self.model._meta
+        table = quote_name(meta.db_table)
+
+        insert_fields = [
+            field for field in meta.concrete_fields if not field.primary_key
+        ]
+        attnames = [field.attname for field in meta.concrete_fields]
+
+        updates = [
+            "{column} = {table}.{column} + EXCLUDED.{column}".format(
+                table=table, column=quote_name(meta.get_field(name).column)
+            )
+            for name in increments
+        ] + [
+            "{column} = EXCLUDED.{column}".format(
+                column=quote_name(meta.get_field(name).column)
+            )
+            for name in ["updated_at", *fields]
+        ]
+
+        # the arbiter has to match one of the unique constraints, the rows
+        # without a student are covered by a partial one
+        conflict_targets = {
+            True: "(added_by_id, tip_id) WHERE student_id IS NULL",
+            False: "(added_by_id, tip_id, student_id)",
+        }
+        instances_by_target = defaultdict(list)
+        for instance in instances:
+            instances_by_target[instance.student_id is None].append(instance)
+
+        results = []
+        for without_student, target_instances in instances_by_target.items():
+            params = []
+            for instance in target_instances:
+                params.extend(
+                    field.get_db_prep_save(
+                        field.pre_save(instance, add=True),
+                        connection=connection,
+                    )
+                    for field in insert_fields
+                )
+
+            placeholders = "({})".format(
+                ", ".join(["%s"] * len(insert_fields))
+            )
+            sql = (
+                "INSERT INTO {table} ({columns}) VALUES {values} "
+                "ON CONFLICT {conflict_target} DO UPDATE SET {updates} "
+                "RETURNING {returning}, (xmax = 0) AS inserted"
+            ).format(
+                table=table,
+                columns=", ".join(
+                    quote_name(field.column) for field in insert_fields
+                ),
+                values=", ".join([placeholders] * len(target_instances)),
+                conflict_target=conflict_targets[without_student],
+                updates=", ".join(updates),
+                returning=", ".join(
+                    quote_name(field.column) for field in meta.concrete_fields
+                ),
+            )
+
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+
+            # keep the related objects the instances were built with
+            fields_caches = {
+                (
+                    instance.added_by_id,
+                    instance.tip_id,
+                    instance.student_id,
+                ): instance._state.fields_cache
+                for instance in target_instances
+            }
+            for *row, inserted in rows:
+                result = self.model.from_db(self.db, attnames, row)
+                result._state.fields_cache = dict(
+                    fields_caches[
+                        (result.added_by_id, result.tip_id, result.student_id)
+                    ]
+                )
+                results.append((result, inserted))
+
+        for result, inserted in results:
+            if inserted:
+                post_save.send(
+                    sender=self.model,
+                    instance=result,
+                    created=True,
+                    update_fields=None,
+                    raw=False,
+                    using=self.db,
+                )
+
+        return [result for result, _ in results]
 
     def get_tips_tried(self, user):
         queryset = self.filter(added_by=user, try_count__gt=0)
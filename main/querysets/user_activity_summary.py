@@ -0,0 +1,163 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Max
+from django.utils.dateparse import parse_datetime
+from notifications.models import Notification
+
+
+class UserActivitySummaryQuerySet(models.QuerySet):
+    RECENT_ACTIVITIES_LIMIT = 20
+
+    def get_content_type_fields(self):
+        from main.models import Example, Tip
+
+        content_types = ContentType.objects.get_for_models(Tip, Example)
+
+        return {
+            content_types[Tip].id: "recent_tips",
+            content_types[Example].id: "recent_examples",
+        }
+
+    def for_users(self, user_ids):
+        """Summaries of `user_ids` keyed by user id, users without one get
+        an empty unsaved summary. Missing summaries are built by the
+        `backfill_activity_summaries` command, or with the next
+        notification of the user."""
+        summaries = self.in_bulk(user_ids)
+
+        for user_id in set(user_ids) - set(summaries):
+            summaries[user_id] = self.model(user_id=user_id)
+
+        return summaries
+
+    def add_notifications(self, notifications):
+        notifications_by_user = defaultdict(list)
+        for notification in notifications:
+            if notification.level != "success":
+                continue
+            notifications_by_user[notification.recipient_id].append(
+                notification
+            )
+
+        if not notifications_by_user:
+            return
+
+        content_type_fields = self.get_content_type_fields()
+        with transaction.atomic():
+            summaries = self.select_for_update().in_bulk(
+                list(notifications_by_user)
+            )
+            for user_id, summary in summaries.items():
+                touches = defaultdict(dict)
+                for notification in notifications_by_user[user_id]:
+                    if (
+                        summary.last_activity is None
+                        or summary.last_activity < notification.timestamp
+                    ):
+                        summary.last_activity = notification.timestamp
+
+                    field = content_type_fields.get(
+                        notification.action_object_content_type_id
+                    )
+                    if field and notification.action_object_object_id:
+                        touches[field][
+                            int(notification.action_object_object_id)
+                        ] = notification.timestamp
+
+                for field, timestamps in touches.items():
+                    self.merge_touches(summary, field, timestamps)
+
+            self.bulk_update(
+                summaries.values(),
+                ["last_activity", "recent_tips", "recent_examples"],
+            )
+
+        # users without a summary yet get it built from all their
+        # notifications, the new ones included
+        missing_user_ids = set(notifications_by_user) - set(summaries)
+        if missing_user_ids:
+            self.rebuild(missing_user_ids)
+
+    def merge_touches(self, summary, field, timestamps):
+        touches = {
+            object_id: parse_datetime(timestamp)
+            for object_id, timestamp in getattr(summary, field)
+        }
+        for object_id, timestamp in timestamps.items():
+            if object_id not in touches or touches[object_id] < timestamp:
+                touches[object_id] = timestamp
+
+        setattr(summary, field, self.serialize_touches(touches))
+
+    def serialize_touches(self, touches):
+        touches = sorted(
+            touches.items(), key=lambda touch: touch[1], reverse=True
+        )
+
+        return [
+            [object_id, timestamp.isoformat()]
+            for object_id, timestamp in touches[: self.RECENT_ACTIVITIES_LIMIT]
+        ]
+
+    def rebuild(self, user_ids):
+        content_type_fields = self.get_content_type_fields()
+        notifications = Notification.objects.filter(
+            recipient_id__in=user_ids, level="success"
+        )
+
+        last_activities = dict(
+            notifications.values("recipient_id")
+            .annotate(last_activity=Max("timestamp"))
+            .values_list("recipient_id", "last_activity")
+            .order_by()
+        )
+
+        latest_touches = (
+            notifications.filter(
+                action_object_content_type_id__in=content_type_fields,
+                action_object_object_id__isnull=False,
+            )
+            .order_by(
+                "recipient_id",
+                "action_object_content_type_id",
+                "action_object_object_id",
+                "-timestamp",
+            )
+            .distinct(
+                "recipient_id",
+                "action_object_content_type_id",
+                "action_object_object_id",
+            )
+            .values_list(
+                "recipient_id",
+                "action_object_content_type_id",
+                "action_object_object_id",
+                "timestamp",
+            )
+        )
+
+        touches = defaultdict(lambda: defaultdict(dict))
+        for user_id, content_type_id, object_id, timestamp in latest_touches:
+            field = content_type_fields[content_type_id]
+            touches[user_id][field][int(object_id)] = timestamp
+
+        summaries = {}
+        for user_id in user_ids:
+            summaries[user_id] = self.model(
+                user_id=user_id,
+                last_activity=last_activities.get(user_id),
+                recent_tips=self.serialize_touches(
+                    touches[user_id]["recent_tips"]
+                ),
+                recent_examples=self.serialize_touches(
+                    touches[user_id]["recent_examples"]
+                ),
+            )
+
+        with transaction.atomic():
+            self.filter(user_id__in=user_ids).delete()
+            self.bulk_create(summaries.values(), ignore_conflicts=True)
+
+        return summaries
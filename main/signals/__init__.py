@@ -1,24 +1,40 @@
 from .episode import episode_post_save
-from .example import post_updating_example
-from .example_rating import example_rating_post_save
+from .example import post_updating_example, update_example_search_vector
+from .example_rating import (
+    example_rating_post_save,
+    update_example_rating_aggregates,
+)
 from .student import student_post_save
 from .student_example import updating_studentexample
 from .student_tip import student_tip_post_save
-from .tip import tip_post_save, updating_tip
-from .tip_rating import tip_rating_post_save
-from .user import creating_user, password_reset_token_created
+from .tip import tip_post_save, update_tip_search_vector, updating_tip
+from .tip_rating import tip_rating_post_save, update_tip_rating_aggregates
+from .user import (
+    creating_user,
+    invalidate_manager_ids_on_delete,
+    invalidate_manager_ids_on_save,
+    invalidate_user_cache,
+    password_reset_token_created,
+)
 from .user_student_mapping import user_student_mapping_post_save
 
 __all__ = [
     "updating_tip",
     "tip_post_save",
+    "update_tip_search_vector",
     "post_updating_example",
+    "update_example_search_vector",
     "updating_studentexample",
     "creating_user",
+    "invalidate_user_cache",
+    "invalidate_manager_ids_on_save",
+    "invalidate_manager_ids_on_delete",
     "student_post_save",
     "student_tip_post_save",
     "tip_rating_post_save",
+    "update_tip_rating_aggregates",
     "example_rating_post_save",
+    "update_example_rating_aggregates",
     "episode_post_save",
     "user_student_mapping_post_save",
     "password_reset_token_created",
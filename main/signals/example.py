@@ -6,7 +6,13 @@ import constants
 from libs.websocket import ExampleNotificationWebsocket
 from tasks import notification
 
-from ..models import Example, StudentExample, StudentTip
+from ..models import Example, StudentExample, StudentTip, Tip
+
+RATING_AGGREGATE_FIELDS = {
+    "rating_count",
+    "clarity_average_rating",
+    "recommended_average_rating",
+}
 
 
 @receiver(post_save, sender=Example)
@@ -27,44 +33,66 @@ def post_updating_example(sender, instance, created, **kwargs):
 
     # Notifications
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_example_creation_notification()
         )
         if instance.tip_id:
             ExampleNotificationWebsocket.send_example_notification_to_tip_owner(
                 instance, updated=False
             )
-            notification.create_notifications.delay(
+            notification.send_notifications(
                 instance.generate_attach_tip_notifications(instance.tip)
             )
     else:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_example_updating_notification()
         )
 
 
+@receiver(post_save, sender=Example)
+def update_example_search_vector(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "description" not in update_fields:
+        return
+
+    Example.objects.filter(id=instance.id).update_search_vector()
+
+
+@receiver(post_save, sender=Example)
+def refresh_example_rating_aggregates(sender, instance, created, **kwargs):
+    # a full save writes back the aggregates loaded with the instance,
+    # which are stale when a rating was saved in the meantime
+    update_fields = kwargs.get("update_fields")
+    if created or (
+        update_fields
+        and not RATING_AGGREGATE_FIELDS.intersection(update_fields)
+    ):
+        return
+
+    Example.objects.filter(id=instance.id).update_rating_aggregates()
+    instance.refresh_from_db(fields=RATING_AGGREGATE_FIELDS)
+
+
 @receiver(pre_save, sender=Example)
 def example_pre_save(sender, instance, **kwargs):
     if instance.id is not None:
-        old_example = Example.objects.get(id=instance.id)
-        if old_example.tip_id != instance.tip_id:
+        tip_changed = instance.has_changed("tip")
+        if tip_changed:
             ExampleNotificationWebsocket.send_example_notification_to_tip_owner(
                 instance, updated=True
             )
             if instance.tip_id:
-                notification.create_notifications.delay(
+                notification.send_notifications(
                     instance.generate_attach_tip_notifications(instance.tip)
                 )
             else:
-                notification.create_notifications.delay(
-                    instance.generate_detach_tip_notifications(old_example.tip)
+                notification.send_notifications(
+                    instance.generate_detach_tip_notifications(
+                        Tip.objects.get(id=instance.get_loaded_value("tip"))
+                    )
                 )
 
-        if (
-            instance.tip_id
-            and instance.episode_id
-            and old_example.tip_id != instance.tip_id
-        ):
+        if instance.tip_id and instance.episode_id and tip_changed:
             StudentTip.objects.filter(
                 student_id=instance.episode.student_id, tip_id=instance.tip_id
             ).update(last_used_at=timezone.localtime())
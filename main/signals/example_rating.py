@@ -1,14 +1,26 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from tasks import notification
 
-from ..models import ExampleRating
+from ..models import Example, ExampleRating
+
+RATING_FIELDS = {"clarity", "recommended"}
 
 
 @receiver(post_save, sender=ExampleRating)
 def example_rating_post_save(sender, instance, created, **kwargs):
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_example_rating_creation_notification()
         )
+
+
+@receiver(post_save, sender=ExampleRating)
+@receiver(post_delete, sender=ExampleRating)
+def update_example_rating_aggregates(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not RATING_FIELDS.intersection(update_fields):
+        return
+
+    Example.objects.filter(id=instance.example_id).update_rating_aggregates()
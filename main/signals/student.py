@@ -9,6 +9,6 @@ from ..models import Student
 @receiver(post_save, sender=Student)
 def student_post_save(sender, instance, created, **kwargs):
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_student_creation_notification()
         )
@@ -25,7 +25,7 @@ def updating_studentexample(sender, instance, created, **kwargs):
             task_type=constants.TaskType.EXAMPLE,
         )
         tasks.delete()
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_student_example_creation_notification()
         )
 
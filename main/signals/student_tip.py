@@ -17,7 +17,7 @@ def student_tip_pre_save(sender, instance, **kwargs):
 @receiver(post_save, sender=StudentTip)
 def student_tip_post_save(sender, instance, created, **kwargs):
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_student_tip_creation_notification()
         )
         StudentTipNotificationWebsocket.send_student_tip_notification_to_mapped_users(
@@ -6,28 +6,53 @@ from tasks import notification
 
 from ..models import Tip
 
+SEARCH_FIELDS = {
+    "title",
+    "description",
+    "tip_summary",
+    "sub_goal",
+    "child_context",
+    "environment_context",
+}
+
+COUNTER_FIELDS = {"helpful_count"}
+
+RATING_AGGREGATE_FIELDS = {
+    "rating_count",
+    "clarity_average_rating",
+    "relevance_average_rating",
+    "uniqueness_average_rating",
+}
+
 
 @receiver(pre_save, sender=Tip)
 def updating_tip(sender, instance, **kwargs):
     # To fix: null description raises error on the old ui
     if instance.description is None:
         instance.description = ""
-    if instance.id is not None:
-        old_tip = Tip.objects.get(id=instance.id)
-        if not old_tip.marked_for_editing and instance.marked_for_editing:
-            TipNotificationWebsocket.send_editing_notification_to_tip_owner(
-                instance
-            )
+    if (
+        instance.id is not None
+        and instance.marked_for_editing
+        and instance.has_changed("marked_for_editing")
+    ):
+        TipNotificationWebsocket.send_editing_notification_to_tip_owner(
+            instance
+        )
 
-            notification.create_notifications.delay(
-                instance.generate_set_tip_edit_mark_notification()
-            )
+        notification.send_notifications(
+            instance.generate_set_tip_edit_mark_notification()
+        )
 
 
 @receiver(post_save, sender=Tip)
 def tip_post_save(sender, instance, created, **kwargs):
+    # counter bumps are not edits of the tip
+    update_fields = kwargs.get("update_fields")
+    if update_fields and COUNTER_FIELDS.issuperset(update_fields):
+        return
+
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_tip_creation_notification()
         )
         if instance.linked_tips.values_list("id", flat=True):
@@ -35,18 +60,42 @@ def tip_post_save(sender, instance, created, **kwargs):
                 instance
             )
     else:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_tip_updating_notification()
         )
 
 
+@receiver(post_save, sender=Tip)
+def update_tip_search_vector(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not SEARCH_FIELDS.intersection(update_fields):
+        return
+
+    Tip.objects.filter(id=instance.id).update_search_vector()
+
+
+@receiver(post_save, sender=Tip)
+def refresh_tip_rating_aggregates(sender, instance, created, **kwargs):
+    # a full save writes back the aggregates loaded with the instance,
+    # which are stale when a rating was saved in the meantime
+    update_fields = kwargs.get("update_fields")
+    if created or (
+        update_fields
+        and not RATING_AGGREGATE_FIELDS.intersection(update_fields)
+    ):
+        return
+
+    Tip.objects.filter(id=instance.id).update_rating_aggregates()
+    instance.refresh_from_db(fields=RATING_AGGREGATE_FIELDS)
+
+
 def linked_tips_changed(sender, instance, action, pk_set, **kwargs):
     if action == "pre_add":
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_attach_tip_notifications(attached_tip_ids=pk_set)
         )
     if action == "pre_remove":
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_detach_tip_notifications(detached_tip_ids=pk_set)
         )
 
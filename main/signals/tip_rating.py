@@ -1,14 +1,27 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from tasks import notification
 
-from ..models import TipRating
+from ..models import Tip, TipRating
+
+RATING_FIELDS = {"clarity", "relevance", "uniqueness"}
 
 
 @receiver(post_save, sender=TipRating)
 def tip_rating_post_save(sender, instance, created, **kwargs):
     if created:
-        notification.create_notifications.delay(
+        notification.send_notifications(
             instance.generate_tip_rating_creation_notification()
         )
+
+
+@receiver(post_save, sender=TipRating)
+@receiver(post_delete, sender=TipRating)
+def update_tip_rating_aggregates(sender, instance, **kwargs):
+    # read/try counter updates leave the ratings untouched
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not RATING_FIELDS.intersection(update_fields):
+        return
+
+    Tip.objects.filter(id=instance.tip_id).update_rating_aggregates()
@@ -1,11 +1,12 @@
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django_rest_passwordreset.signals import reset_password_token_created
 
 import constants
+from libs.cache import UserCache
 from libs.messaging.email import Mailer
 
 from ..models import Profile
@@ -26,6 +27,24 @@ def creating_user(sender, instance, created, **kwargs):
         )
 
 
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    UserCache.invalidate(instance.id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_manager_ids_on_save(sender, instance, **kwargs):
+    User.objects.invalidate_manager_ids(instance)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_manager_ids_on_delete(sender, instance, **kwargs):
+    # the deleted user still has its id, it would look unchanged
+    if instance.role in constants.Role.MANAGERS:
+        cache.delete(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
+
+
 @receiver(reset_password_token_created)
 def password_reset_token_created(
     sender, instance, reset_password_token, *args, **kwargs
@@ -1,10 +1,11 @@
 from .base import add
 from .notification import create_notifications
 from .student_tip import dequeue_student_tips
-from .tip_rating import rating_reminder
+from .tip_rating import export_tip_ratings, flush_tip_reads, rating_reminder
 from .user import update_last_login, update_user_ip
 from .user_tip import dequeue_tips
 from .version import delete_versions
+from .websocket import send_new_notifications_to_websockets
 
 __all__ = [
     "add",
@@ -14,5 +15,8 @@ __all__ = [
     "dequeue_tips",
     "update_user_ip",
     "rating_reminder",
+    "flush_tip_reads",
+    "export_tip_ratings",
     "dequeue_student_tips",
+    "send_new_notifications_to_websockets",
 ]
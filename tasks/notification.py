@@ -1,24 +1,24 @@
 # -*- coding: utf-8 -*-
 from celery import shared_task
-from notifications.signals import notify
+from django.db import transaction
 
-from libs.cache import ActivityCache
+from libs.notification import NotificationBulkWriter, NotificationDescriptor
 
 
-@shared_task
-def create_notifications(notifications_info):
-    unique_cache_users = set()
-
-    for notification_info in notifications_info:
-        notify.send(**notification_info)
+def send_notifications(notifications_info):
+    """Queue the `notify.send` style `notifications_info` to be written by a
+    worker, only their ids are sent to the broker.
 
-        if notification_info.get("level") != "success":
-            continue
+    The task is queued once the transaction commits, otherwise the worker
+    could look the objects up before they are visible and drop them.
+    """
+    if not notifications_info:
+        return
 
-        if not hasattr(notification_info["recipient"], "id"):
-            continue
+    descriptors = NotificationDescriptor.encode(notifications_info)
+    transaction.on_commit(lambda: create_notifications.delay(descriptors))
 
-        unique_cache_users.add(notification_info["recipient"].id)
 
-    for user_id in unique_cache_users:
-        ActivityCache.refresh(user_id)
+@shared_task
+def create_notifications(descriptors):
+    NotificationBulkWriter.write(NotificationDescriptor.decode(descriptors))
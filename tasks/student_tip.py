@@ -1,11 +1,8 @@
 from celery import shared_task
 
-from main.models import Student
+from main.models import StudentTip
 
 
 @shared_task
 def dequeue_student_tips(number_of_tips=2):
-    students = Student.objects.all()
-
-    for student in students:
-        student.dequeue_tips(number_of_tips)
+    return StudentTip.objects.dequeue(number_of_tips)
@@ -1,26 +1,163 @@
+import logging
+import tempfile
+import time
+from itertools import islice
+
 from celery import shared_task
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files import File
+from django.db import transaction
+from django.http import QueryDict
+from django.utils import timezone
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 from notifications.models import Notification
 
 import constants
-from main.models import User
+from main.models import TipRating, User
+from libs.cache import TipReadBuffer
+from libs.import_export import (
+    ExportFileWriter,
+    TipRatingResource,
+    get_export_storage,
+)
+from libs.messaging.email import Mailer
 from libs.websocket.notification_websocket import NotificationWebsocketMixin
 
+logger = logging.getLogger(__name__)
+
+REMINDER_BATCH_SIZE = 500
+
 
 @shared_task
-def rating_reminder():
-    users = User.objects.annotate_number_tip_rating_reminder()
-
-    for user in users:
-        Notification.objects.create(
-            verb=constants.Activity.RATING_REMINDER,
-            description=format_lazy(
-                _("You have {number} tips awaiting your review."),
-                number=user.number_of_tips,
-            ),
-            actor=user,
-            recipient=user,
+def rating_reminder(batch_size=REMINDER_BATCH_SIZE):
+    """Remind users of the tips they read but did not rate.
+
+    Users are read in chunks of `batch_size`, every chunk is written with
+    one bulk INSERT and pushed to the websockets in one batch. Returns the
+    rows written and the seconds spent in each phase.
+    """
+    metrics = {
+        "notifications": 0,
+        "query_seconds": 0.0,
+        "write_seconds": 0.0,
+        "websocket_seconds": 0.0,
+    }
+
+    users = (
+        User.objects.annotate_number_tip_rating_reminder()
+        .order_by("id")
+        .values_list("id", "number_of_tips")
+        .iterator(chunk_size=batch_size)
+    )
+    user_content_type = ContentType.objects.get_for_model(User)
+
+    while True:
+        started_at = time.monotonic()
+        chunk = list(islice(users, batch_size))
+        metrics["query_seconds"] += time.monotonic() - started_at
+        if not chunk:
+            break
+
+        started_at = time.monotonic()
+        timestamp = timezone.now()
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(
+                    verb=constants.Activity.RATING_REMINDER,
+                    description=format_lazy(
+                        _("You have {number} tips awaiting your review."),
+                        number=number_of_tips,
+                    ),
+                    actor_content_type=user_content_type,
+                    actor_object_id=user_id,
+                    recipient_id=user_id,
+                    timestamp=timestamp,
+                )
+                for user_id, number_of_tips in chunk
+            ]
         )
+        metrics["notifications"] += len(notifications)
+        metrics["write_seconds"] += time.monotonic() - started_at
+
+        started_at = time.monotonic()
+        NotificationWebsocketMixin.send_new_notification_to_websockets(
+            [user_id for user_id, _number_of_tips in chunk]
+        )
+        metrics["websocket_seconds"] += time.monotonic() - started_at
+
+    logger.info("rating_reminder %s", metrics)
+
+    return metrics
+
+
+@shared_task
+def flush_tip_reads():
+    """Count the buffered tip reads, at most
+    `TIP_READ_BUFFER_MAX_BATCHES` batches per run so a run ends before
+    the next beat one even when reads keep coming.
+
+    Every batch is claimed from the buffer, so overlapping runs share the
+    reads out. It is acknowledged once written, a database error puts it
+    back for the next run.
+    """
+    for _batch in range(settings.TIP_READ_BUFFER_MAX_BATCHES):
+        batch_key, reads = TipReadBuffer.claim(
+            settings.TIP_READ_BUFFER_BATCH_SIZE
+        )
+        if not reads:
+            break
+
+        try:
+            with transaction.atomic():
+                TipRating.objects.flush_reads(reads)
+        except Exception:
+            TipReadBuffer.release(batch_key)
+            raise
+
+        TipReadBuffer.ack(batch_key)
+
+
+@shared_task
+def export_tip_ratings(
+    user_id, file_format, filter_query, name, download_link
+):
+    """Export the tip ratings matching `filter_query`, the urlencoded data
+    of the admin export filterset, and email the download link to the
+    user.
+
+    Rows are streamed from the database to a temporary file which is then
+    saved as `name` to the private export storage, `download_link` points
+    to the staff only admin view serving it. Returns the name of the
+    saved file.
+    """
+    from main.admin.filters import TipRatingExportFilterset
+
+    user = User.objects.get(id=user_id)
+    queryset = TipRatingExportFilterset(
+        QueryDict(filter_query), TipRating.objects.order_by("id")
+    ).qs
+
+    started_at = time.monotonic()
+    with tempfile.TemporaryFile() as file:
+        ExportFileWriter.write(
+            TipRatingResource().iter_export(queryset), file_format, file
+        )
+        file.seek(0)
+        name = get_export_storage().save(name, File(file))
+
+    logger.info(
+        "export_tip_ratings %s in %.2f seconds",
+        name,
+        time.monotonic() - started_at,
+    )
+
+    Mailer.send_html_mail(
+        subject=_("Your tip ratings export is ready"),
+        to_email=user.email,
+        template_name="export_ready.html",
+        context={"download_link": download_link},
+    )
 
-        NotificationWebsocketMixin.send_new_notification_to_websocket(user.id)
+    return name
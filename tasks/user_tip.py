@@ -1,12 +1,16 @@
 from celery import shared_task
 
 import constants
-from main.models import User
+from main.models import StudentTip, User, UserStudentMapping
 
 
 @shared_task
 def dequeue_tips(number_of_tips=2):
     users = User.objects.by_role(role=constants.Role.EXPERIMENTAL_TEACHER)
+    student_ids = UserStudentMapping.objects.filter(user__in=users).values(
+        "student_id"
+    )
 
-    for user in users:
-        user.dequeue_tips(number_of_tips)
+    return StudentTip.objects.filter(student_id__in=student_ids).dequeue(
+        number_of_tips
+    )
@@ -0,0 +1,15 @@
+from celery import shared_task
+from django.utils.module_loading import import_string
+
+from libs.websocket.notification_websocket import NotificationWebsocketMixin
+
+
+@shared_task
+def send_new_notifications_to_websockets(user_ids, websocket_class=None):
+    """Push the new notifications through `websocket_class`, the import
+    path of a `NotificationWebsocketMixin` class."""
+    websocket = NotificationWebsocketMixin
+    if websocket_class:
+        websocket = import_string(websocket_class)
+
+    websocket.dispatch_new_notifications(user_ids)
@@ -1,7 +1,10 @@
 import copy
+from contextlib import contextmanager
 
 from django.contrib.auth.models import Group
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
 
@@ -169,6 +172,25 @@ class BaseTestCase(TestCase):
     def not_login_client(self):
         return Client()
 
+    @contextmanager
+    def assertMaxQueries(self, max_queries):
+        """Fails when the block runs more than `max_queries` queries,
+        listing the queries that were run."""
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+        if executed > max_queries:
+            queries = "\n".join(
+                "{}. {}".format(index, query["sql"])
+                for index, query in enumerate(context.captured_queries, 1)
+            )
+            self.fail(
+                "{} queries executed, budget is {}\n{}".format(
+                    executed, max_queries, queries
+                )
+            )
+
     def make_deep_copy(self, data):
         return copy.deepcopy(data)
 
@@ -0,0 +1,10 @@
+from .baseline import Baseline
+from .runner import BenchmarkError, BenchmarkRunner
+from .seeder import BenchmarkSeeder
+
+__all__ = [
+    "Baseline",
+    "BenchmarkError",
+    "BenchmarkRunner",
+    "BenchmarkSeeder",
+]
@@ -0,0 +1,87 @@
+import json
+import math
+
+
+class Baseline:
+    """JSON baseline of the benchmark results, diffable between commits.
+
+    Results map a scenario name to its latency percentiles (ms), the
+    median database time and the highest query count of the samples.
+    """
+
+    PERCENTILES = [50, 90, 99]
+
+    # metrics compared by `compare`, lower is better for all of them
+    METRICS = ["p50_ms", "p90_ms", "p99_ms", "queries"]
+
+    @classmethod
+    def percentile(cls, values, percent):
+        """Nearest rank percentile of `values`."""
+        values = sorted(values)
+        rank = max(math.ceil(percent / 100 * len(values)), 1)
+        return values[rank - 1]
+
+    @classmethod
+    def summarize(cls, samples):
+        """Summary of the `RequestStats` counters of the samples."""
+        total_ms = [sample["total_ms"] for sample in samples]
+
+        summary = {"iterations": len(samples)}
+        for percent in cls.PERCENTILES:
+            summary["p{}_ms".format(percent)] = round(
+                cls.percentile(total_ms, percent), 3
+            )
+        summary.update(
+            {
+                "max_ms": round(max(total_ms), 3),
+                "mean_ms": round(sum(total_ms) / len(total_ms), 3),
+                "db_p50_ms": round(
+                    cls.percentile(
+                        [sample["db_ms"] for sample in samples], 50
+                    ),
+                    3,
+                ),
+                "queries": max(sample["queries"] for sample in samples),
+            }
+        )
+        return summary
+
+    @classmethod
+    def dump(cls, baseline, path):
+        with open(path, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            return json.load(file)
+
+    @classmethod
+    def compare(cls, old, new, threshold=10):
+        """Rows `(scenario, metric, old, new, change %, is regression)` for
+        the scenarios of both baselines.
+
+        A metric regressed when it grew by more than `threshold` percent,
+        any added query is a regression.
+        """
+        rows = []
+        for name in sorted(set(old["results"]) & set(new["results"])):
+            for metric in cls.METRICS:
+                old_value = old["results"][name][metric]
+                new_value = new["results"][name][metric]
+                change = (
+                    (new_value - old_value) / old_value * 100
+                    if old_value
+                    else 0.0
+                )
+                if metric == "queries":
+                    is_regression = new_value > old_value
+                else:
+                    is_regression = change > threshold
+
+                rows.append(
+                    (name, metric, old_value, new_value, change, is_regression)
+                )
+
+        return rows
@@ -0,0 +1,102 @@
+import time
+
+from django.db import connection, transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from libs.request_stats import RequestStats
+from main.models import UserStudentMapping
+from tasks import dequeue_student_tips, dequeue_tips, rating_reminder
+
+from .baseline import Baseline
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+class BenchmarkRunner:
+    """Replays the hot endpoints and Celery tasks as the benchmark user.
+
+    Every sample runs under a `RequestStats` execute wrapper, so the
+    baseline records the query count and database time next to the
+    latency. Tasks run synchronously in a rolled back transaction, every
+    sample starts from the same data.
+    """
+
+    def __init__(self, user, iterations=20, warmup=2):
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=user)
+
+    def get_endpoints(self):
+        student_id = (
+            UserStudentMapping.objects.filter(user=self.user)
+            .order_by("student_id")
+            .values_list("student_id", flat=True)
+            .first()
+        )
+
+        endpoints = [
+            reverse("v1:tips-list"),
+            reverse("v1:managers-users-grid"),
+            reverse("v1:notifications-unread"),
+            reverse("v1:recent-activities"),
+        ]
+        if student_id is not None:
+            endpoints.append(
+                reverse("v1:student-tips-list", args=[student_id])
+            )
+
+        return endpoints
+
+    def get_tasks(self):
+        return [rating_reminder, dequeue_student_tips, dequeue_tips]
+
+    def run(self):
+        results = {}
+
+        for url in self.get_endpoints():
+            results["GET {}".format(url)] = self.measure(
+                lambda url=url: self.request(url)
+            )
+
+        for task in self.get_tasks():
+            results["task {}".format(task.name)] = self.measure(
+                task, rollback=True
+            )
+
+        return results
+
+    def request(self, url):
+        response = self.client.get(url)
+        if response.status_code != status.HTTP_200_OK:
+            raise BenchmarkError(
+                "GET {} returned {}".format(url, response.status_code)
+            )
+
+    def measure(self, func, rollback=False):
+        for _ in range(self.warmup):
+            self.sample(func, rollback)
+
+        return Baseline.summarize(
+            [self.sample(func, rollback) for _ in range(self.iterations)]
+        )
+
+    def sample(self, func, rollback=False):
+        stats = RequestStats()
+        token = stats.activate()
+        started_at = time.monotonic()
+        try:
+            with connection.execute_wrapper(stats), transaction.atomic():
+                func()
+                transaction.set_rollback(rollback)
+        finally:
+            RequestStats.deactivate(token)
+        stats.total_seconds = time.monotonic() - started_at
+
+        return stats.get_counters()
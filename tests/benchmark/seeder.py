@@ -0,0 +1,316 @@
+import random
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from notifications.models import Notification
+
+import constants
+from main.models import (
+    Example,
+    Student,
+    StudentTip,
+    Tip,
+    TipRating,
+    User,
+    UserActivitySummary,
+    UserStudentMapping,
+)
+from tests.factories import (
+    ExampleFactory,
+    StudentFactory,
+    StudentTipFactory,
+    TipFactory,
+    TipNotificationFactory,
+    TipRatingFactory,
+    UserFactory,
+)
+
+BENCHMARK_USERNAME = "benchmark_manager"
+
+
+class BenchmarkSeeder:
+    """Bulk inserts benchmark volumes built with the test factories.
+
+    Rows are built with the factories and written with `bulk_create`, so
+    the model signals do not run: the rating aggregates, search vectors
+    and user activity summaries are backfilled once at the end instead.
+    """
+
+    VOLUMES = {
+        "users": 2000,
+        "students": 1000,
+        "tips": 20000,
+        "examples": 20000,
+        "student_tips": 50000,
+        "ratings": 1000000,
+        "notifications": 1000000,
+    }
+
+    # share of the seeded users by role, the rest are educators
+    ROLES = [
+        (constants.Role.EXPERIMENTAL_TEACHER, 0.3),
+        (constants.Role.MANAGER, 0.02),
+        (constants.Role.GUEST, 0.05),
+    ]
+
+    # students mapped to the benchmark user
+    BENCHMARK_STUDENTS = 20
+
+    # users whose activity summaries are rebuilt per query
+    SUMMARY_BATCH_SIZE = 500
+
+    def __init__(self, volumes, batch_size=5000, seed=0, stdout=None):
+        self.volumes = volumes
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.stdout = stdout
+        self.now = timezone.now()
+
+    @classmethod
+    def get_volumes(cls, scale=1.0, **overrides):
+        volumes = {
+            name: max(int(volume * scale), 1)
+            for name, volume in cls.VOLUMES.items()
+        }
+        volumes.update(
+            (name, volume)
+            for name, volume in overrides.items()
+            if volume is not None
+        )
+        return volumes
+
+    @classmethod
+    def get_benchmark_user(cls):
+        return User.objects.filter(username=BENCHMARK_USERNAME).first()
+
+    def seed(self):
+        users = self.seed_users()
+        students = self.seed_students(users)
+        tips = self.seed_tips(users)
+        self.seed_examples(users, tips)
+        self.seed_student_tips(users, students, tips)
+        self.seed_ratings(users, tips)
+        self.seed_notifications(users, tips)
+
+        call_command("backfill_rating_aggregates", stdout=self.stdout)
+        call_command("backfill_search_vectors", stdout=self.stdout)
+        # measure the users grid reads, not the lazy summary rebuilds
+        self.rebuild_activity_summaries(users)
+
+        # the users were inserted without their post_save signal
+        cache.delete(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
+
+    def seed_users(self):
+        last_id = User.objects.aggregate(Max("id"))["id__max"] or 0
+        UserFactory.reset_sequence(last_id + 1)
+
+        users = (
+            UserFactory.build(role=self.get_random_role())
+            for _ in range(self.volumes["users"])
+        )
+        self.bulk_create(User, users, self.volumes["users"])
+
+        benchmark_user = self.get_benchmark_user()
+        if benchmark_user is None:
+            benchmark_user = UserFactory.create(
+                username=BENCHMARK_USERNAME,
+                email="{}@example.com".format(BENCHMARK_USERNAME),
+                role=constants.Role.MANAGER,
+            )
+
+        return list(
+            User.objects.filter(id__gt=last_id)
+            .exclude(id=benchmark_user.id)
+            .only("id", "role")
+        )
+
+    def seed_students(self, users):
+        count = self.volumes["students"]
+        last_id = Student.objects.aggregate(Max("id"))["id__max"] or 0
+
+        students = (
+            StudentFactory.build(added_by=self.random.choice(users))
+            for _ in range(count)
+        )
+        self.bulk_create(Student, students, count)
+
+        students = list(Student.objects.filter(id__gt=last_id).only("id"))
+
+        teachers = [
+            user
+            for user in users
+            if user.role == constants.Role.EXPERIMENTAL_TEACHER
+        ]
+        pairs = {
+            (self.random.choice(teachers), student)
+            for student in students
+            for _ in range(2)
+            if teachers
+        }
+        benchmark_user = self.get_benchmark_user()
+        pairs.update(
+            (benchmark_user, student)
+            for student in students[: self.BENCHMARK_STUDENTS]
+        )
+        mappings = (
+            UserStudentMapping(user=user, student=student, added_by=user)
+            for user, student in pairs
+        )
+        self.bulk_create(UserStudentMapping, mappings, len(pairs))
+
+        return students
+
+    def seed_tips(self, users):
+        count = self.volumes["tips"]
+        last_id = Tip.objects.aggregate(Max("id"))["id__max"] or 0
+
+        tips = (
+            TipFactory.build(
+                added_by=self.random.choice(users),
+                updated_by=self.random.choice(users),
+            )
+            for _ in range(count)
+        )
+        self.bulk_create(Tip, tips, count)
+
+        return list(Tip.objects.filter(id__gt=last_id).only("id"))
+
+    def seed_examples(self, users, tips):
+        count = self.volumes["examples"]
+
+        examples = (
+            ExampleFactory.build(
+                tip=self.random.choice(tips),
+                # (tip, description) is unique
+                description="benchmark example {}".format(index),
+                added_by=self.random.choice(users),
+                updated_by=self.random.choice(users),
+                episode=None,
+            )
+            for index in range(count)
+        )
+        self.bulk_create(Example, examples, count)
+
+    def seed_student_tips(self, users, students, tips):
+        pairs = self.get_random_pairs(
+            students, tips, self.volumes["student_tips"]
+        )
+
+        student_tips = (
+            StudentTipFactory.build(
+                student=student,
+                tip=tip,
+                added_by=self.random.choice(users),
+                is_queued=self.random.random() < 0.2,
+                last_used_at=self.get_random_datetime(),
+            )
+            for student, tip in pairs
+        )
+        self.bulk_create(StudentTip, student_tips, len(pairs))
+
+    def seed_ratings(self, users, tips):
+        # one rating without student per (user, tip)
+        pairs = self.get_random_pairs(users, tips, self.volumes["ratings"])
+
+        ratings = (
+            TipRatingFactory.build(
+                added_by=user,
+                tip=tip,
+                read_count=self.random.randint(0, 5),
+                try_count=self.random.randint(0, 2),
+                helpful_count=self.random.randint(0, 1),
+            )
+            for user, tip in pairs
+        )
+        self.bulk_create(TipRating, ratings, len(pairs))
+
+    def seed_notifications(self, users, tips):
+        count = self.volumes["notifications"]
+        verbs = [
+            constants.Activity.CREATE_TIP,
+            constants.Activity.UPDATE_TIP,
+            constants.Activity.READ_TIP,
+            constants.Activity.RATE_TIP,
+        ]
+        recipients = users + [self.get_benchmark_user()]
+
+        notifications = (
+            TipNotificationFactory.build(
+                recipient=self.random.choice(recipients),
+                actor=self.random.choice(users),
+                action_object=self.random.choice(tips),
+                verb=self.random.choice(verbs),
+                level="success",
+                unread=self.random.random() < 0.3,
+                timestamp=self.get_random_datetime(),
+            )
+            for _ in range(count)
+        )
+        self.bulk_create(Notification, notifications, count)
+
+    def rebuild_activity_summaries(self, users):
+        user_ids = [user.id for user in users]
+        user_ids.append(self.get_benchmark_user().id)
+
+        for start in range(0, len(user_ids), self.SUMMARY_BATCH_SIZE):
+            UserActivitySummary.objects.rebuild(
+                user_ids[start : start + self.SUMMARY_BATCH_SIZE]
+            )
+
+        self.log("Rebuilt {} user activity summaries".format(len(user_ids)))
+
+    def bulk_create(self, model, objs, count):
+        created = 0
+        batch = []
+        for obj in objs:
+            batch.append(obj)
+            if len(batch) == self.batch_size:
+                created += self.write_batch(model, batch)
+                batch = []
+                self.log("{} {}/{}".format(model.__name__, created, count))
+
+        if batch:
+            created += self.write_batch(model, batch)
+
+        self.log("Created {} {} rows".format(created, model.__name__))
+
+    def write_batch(self, model, batch):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=self.batch_size)
+
+        return len(batch)
+
+    def get_random_pairs(self, first_objs, second_objs, count):
+        count = min(count, len(first_objs) * len(second_objs))
+
+        pairs = set()
+        while len(pairs) < count:
+            pairs.add(
+                (
+                    self.random.choice(first_objs),
+                    self.random.choice(second_objs),
+                )
+            )
+
+        return pairs
+
+    def get_random_role(self):
+        value = self.random.random()
+        for role, share in self.ROLES:
+            if value < share:
+                return role
+            value -= share
+
+        return self.random.choice(constants.Role.EDUCATORS)
+
+    def get_random_datetime(self, days=90):
+        return self.now - timezone.timedelta(
+            seconds=self.random.randint(0, days * 24 * 3600)
+        )
+
+    def log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
@@ -2,6 +2,7 @@ from .activity import ActivityFactory
 from .episode import EpisodeFactory
 from .example import ExampleFactory
 from .example_rating import ExampleRatingFactory
+from .notification import TipNotificationFactory
 from .organization import OrganizationFactory
 from .profile import ProfileFactory
 from .role_assignment import RoleAssignmentFactory
@@ -32,6 +33,7 @@ __all__ = [
     "StudentExampleFactory",
     "TaskFactory",
     "TipRatingFactory",
+    "TipNotificationFactory",
     "ExampleRatingFactory",
     "UserStudentMappingFactory",
     "ProfileFactory",
@@ -4,6 +4,7 @@ from django.contrib.contenttypes.models import ContentType
 from model_utils import Choices
 from notifications.models import Notification
 
+from .tip import TipFactory
 from .user import UserFactory
 
 
@@ -26,3 +27,11 @@ class NotificationFactory(factory.django.DjangoModelFactory):
     class Meta:
         exclude = ["action_object"]
         abstract = True
+
+
+class TipNotificationFactory(NotificationFactory):
+    action_object = factory.SubFactory(TipFactory)
+
+    class Meta:
+        model = Notification
+        exclude = ["action_object"]
@@ -1,6 +1,15 @@
+import csv
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core import mail
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from libs.import_export import get_export_storage
+from tasks import export_tip_ratings
 from tests.base_api_test import BaseAPITestCase
 from tests.factories import TipRatingFactory
 
@@ -44,6 +53,41 @@ class TestTipRating(BaseAPITestCase):
         cls.list_url = reverse("admin:main_tiprating_changelist")
         cls.export_url = reverse("admin:main_tiprating_export")
 
+    def setUp(self):
+        super().setUp()
+
+        export_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, export_root)
+
+        settings_override = override_settings(EXPORT_ROOT=export_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def start_export(self, data):
+        with mock.patch.object(export_tip_ratings, "delay") as delay:
+            response = self.super_user_client.post(self.export_url, data=data)
+
+        self.assertEqual(response.status_code, 302)
+        delay.assert_called_once()
+
+        return export_tip_ratings(*delay.call_args.args)
+
+    def export(self, data):
+        name = self.start_export(data)
+        with get_export_storage().open(name) as file:
+            return file.read().decode().splitlines()
+
+    def _assert_export_rows(
+        self, lines, field_name, include_records, exclude_records
+    ):
+        result = [row[field_name] for row in csv.DictReader(lines)]
+
+        self.assertEqual(len(include_records), len(result))
+        for record in include_records:
+            self.assertIn(record, result)
+        for record in exclude_records:
+            self.assertNotIn(record, result)
+
     def test_get_list_view_success(self):
         response = self.super_user_client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
@@ -62,7 +106,7 @@ class TestTipRating(BaseAPITestCase):
             "file_format": "0",  # CSV
         }
 
-        response = self.super_user_client.post(self.export_url, data=data)
+        lines = self.export(data)
 
         include_records = [
             self.tip_rating1.comment,
@@ -70,8 +114,8 @@ class TestTipRating(BaseAPITestCase):
             self.tip_rating3.comment,
         ]
         exclude_records = []
-        self._assert_export_data(
-            response, "comment", include_records, exclude_records
+        self._assert_export_rows(
+            lines, "comment", include_records, exclude_records
         )
 
     def test_post_export_data_with_filter_by_new_comment_first(self):
@@ -82,7 +126,7 @@ class TestTipRating(BaseAPITestCase):
             "created_1": (self.now + timezone.timedelta(days=1)).isoformat(),
         }
 
-        response = self.super_user_client.post(self.export_url, data=data)
+        lines = self.export(data)
 
         include_records = [
             self.tip_rating3.comment,
@@ -90,8 +134,8 @@ class TestTipRating(BaseAPITestCase):
             self.tip_rating1.comment,
         ]
         exclude_records = []
-        self._assert_export_data(
-            response, "comment", include_records, exclude_records
+        self._assert_export_rows(
+            lines, "comment", include_records, exclude_records
         )
 
     def test_post_export_data_with_filter_by_commented(self):
@@ -101,10 +145,71 @@ class TestTipRating(BaseAPITestCase):
             "commented_1": (self.now + timezone.timedelta(days=1)).isoformat(),
         }
 
-        response = self.super_user_client.post(self.export_url, data=data)
+        lines = self.export(data)
 
         include_records = [self.tip_rating3.comment]
         exclude_records = [self.tip_rating1.comment, self.tip_rating2.comment]
-        self._assert_export_data(
-            response, "comment", include_records, exclude_records
+        self._assert_export_rows(
+            lines, "comment", include_records, exclude_records
+        )
+
+    def test_post_export_data_send_download_link(self):
+        data = {
+            "file_format": "0",  # CSV
+        }
+
+        name = self.start_export(data)
+
+        self.assertRegex(name, r"^tiprating_\d{14}_\w{32}\.csv$")
+        download_url = reverse(
+            "admin:main_tiprating_export_download", args=[name]
         )
+        self.assertEqual(1, len(mail.outbox))
+        self.assertEqual([self.super_user.email], mail.outbox[0].to)
+        self.assertIn(
+            "http://testserver{}".format(download_url), mail.outbox[0].body
+        )
+
+    def test_get_export_download(self):
+        name = self.start_export({"file_format": "0"})
+        download_url = reverse(
+            "admin:main_tiprating_export_download", args=[name]
+        )
+
+        response = self.super_user_client.get(download_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("attachment", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self._assert_export_rows(
+            lines,
+            "comment",
+            [tip_rating.comment for tip_rating in self.all_tip_ratings],
+            [],
+        )
+
+    def test_get_export_download_not_staff(self):
+        name = self.start_export({"file_format": "0"})
+        download_url = reverse(
+            "admin:main_tiprating_export_download", args=[name]
+        )
+
+        response = self.client.get(download_url)
+
+        # redirected to the admin login
+        self.assertEqual(response.status_code, 302)
+
+        self.client.force_login(self.normal_user)
+        response = self.client.get(download_url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_get_export_download_not_found(self):
+        download_url = reverse(
+            "admin:main_tiprating_export_download",
+            args=["tiprating_unknown.csv"],
+        )
+
+        response = self.super_user_client.get(download_url)
+
+        self.assertEqual(response.status_code, 404)
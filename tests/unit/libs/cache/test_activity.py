@@ -1,4 +1,7 @@
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.utils import timezone
 from notifications.models import Notification
 
@@ -13,20 +16,19 @@ class TestActivity(BaseAPITestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        content_types = ContentType.objects.get_for_models(
-            Tip, Example
-        )
+        content_types = ContentType.objects.get_for_models(Tip, Example)
         cls.tip_content_type = content_types[Tip].id
         cls.example_content_type = content_types[Example].id
 
         cls.user_ids = [cls.normal_user.id, cls.manager_user.id]
 
-        cls.tip1 = TipFactory.create(
-            title="tip 1",
-            description="description 1",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip1 = TipFactory.create(
+                title="tip 1",
+                description="description 1",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
         cls.tip1.created_at -= timezone.timedelta(hours=24)
         cls.tip1.save()
 
@@ -43,20 +45,21 @@ class TestActivity(BaseAPITestCase):
         cls.tip1_notification.timestamp -= timezone.timedelta(hours=24)
         cls.tip1_notification.save()
 
-        cls.tip2 = TipFactory.create(
-            title="tip 2",
-            description="description 2",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip2 = TipFactory.create(
+                title="tip 2",
+                description="description 2",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
 
-        cls.example1 = ExampleFactory.create(
-            description="example 1",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example1 = ExampleFactory.create(
+                description="example 1",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example1.created_at -= timezone.timedelta(hours=24)
         cls.example1.save()
 
@@ -73,17 +76,21 @@ class TestActivity(BaseAPITestCase):
         cls.example1_notification.timestamp -= timezone.timedelta(hours=24)
         cls.example1_notification.save()
 
-        cls.example2 = ExampleFactory.create(
-            description="example 2",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example2 = ExampleFactory.create(
+                description="example 2",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example = ExampleFactory.create(
-            added_by=cls.normal_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example = ExampleFactory.create(
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example.created_at -= timezone.timedelta(days=365)
         cls.old_example.save()
 
@@ -101,12 +108,13 @@ class TestActivity(BaseAPITestCase):
         cls.old_example_notification.save()
 
         # of admin and manager
-        cls.tip3 = TipFactory.create(
-            title="tip 3 of admin and manager",
-            description="description 3 of admin and manager",
-            added_by=cls.manager_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip3 = TipFactory.create(
+                title="tip 3 of admin and manager",
+                description="description 3 of admin and manager",
+                added_by=cls.manager_user,
+                updated_by=None,
+            )
         cls.tip3.created_at -= timezone.timedelta(hours=24)
         cls.tip3.save()
         cls.tip3_notification = (
@@ -122,20 +130,21 @@ class TestActivity(BaseAPITestCase):
         cls.tip3_notification.timestamp -= timezone.timedelta(hours=24)
         cls.tip3_notification.save()
 
-        cls.tip4 = TipFactory.create(
-            title="tip 4 of admin and manager",
-            description="description 4 of admin and manager",
-            added_by=cls.manager_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip4 = TipFactory.create(
+                title="tip 4 of admin and manager",
+                description="description 4 of admin and manager",
+                added_by=cls.manager_user,
+                updated_by=None,
+            )
 
-        cls.example3 = ExampleFactory.create(
-            description="example 3 of admin and manager",
-            added_by=cls.manager_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example3 = ExampleFactory.create(
+                description="example 3 of admin and manager",
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example3.created_at -= timezone.timedelta(hours=24)
         cls.example3.save()
 
@@ -152,17 +161,21 @@ class TestActivity(BaseAPITestCase):
         cls.example3_notification.timestamp -= timezone.timedelta(hours=24)
         cls.example3_notification.save()
 
-        cls.example4 = ExampleFactory.create(
-            description="example 4 of admin and manager",
-            added_by=cls.manager_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example4 = ExampleFactory.create(
+                description="example 4 of admin and manager",
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example1 = ExampleFactory.create(
-            added_by=cls.manager_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example1 = ExampleFactory.create(
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example1.created_at -= timezone.timedelta(days=365)
         cls.old_example1.save()
 
@@ -248,7 +261,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example2.id, example_ids)
         self.assertNotIn(self.old_example.id, example_ids)
 
-
         # check with manager
         self.assertNotIn(self.tip3.id, tip_ids)
         self.assertNotIn(self.tip4.id, tip_ids)
@@ -257,7 +269,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids)
         self.assertNotIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_normal_user_and_filter_end_date(self):
         activities = ActivityCache.get_activities_by_user(
             user_id=self.normal_user.id,
@@ -277,7 +288,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids)
         self.assertIn(self.old_example.id, example_ids)
 
-
         # check with manager
         self.assertNotIn(self.tip3.id, tip_ids)
         self.assertNotIn(self.tip4.id, tip_ids)
@@ -286,7 +296,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids)
         self.assertNotIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_normal_user_and_filter_date(self):
         activities = ActivityCache.get_activities_by_user(
             user_id=self.normal_user.id,
@@ -307,7 +316,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids)
         self.assertNotIn(self.old_example.id, example_ids)
 
-
         # check with manager
         self.assertNotIn(self.tip3.id, tip_ids)
         self.assertNotIn(self.tip4.id, tip_ids)
@@ -316,7 +324,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids)
         self.assertNotIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_manager_user(self):
         activities = ActivityCache.get_activities_by_user(self.manager_user.id)
 
@@ -341,7 +348,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example4.id, example_ids)
         self.assertIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_manager_user_and_filter_start_date(
         self,
     ):
@@ -371,7 +377,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example4.id, example_ids)
         self.assertNotIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_manager_user_and_filter_end_date(
         self,
     ):
@@ -393,7 +398,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids)
         self.assertNotIn(self.old_example.id, example_ids)
 
-
         # check with manager
         self.assertNotIn(self.tip3.id, tip_ids)
         self.assertNotIn(self.tip4.id, tip_ids)
@@ -402,7 +406,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids)
         self.assertIn(self.old_example1.id, example_ids)
 
-
     def test_get_activities_by_user_with_manager_user_and_filter_date(self):
         activities = ActivityCache.get_activities_by_user(
             user_id=self.manager_user.id,
@@ -423,7 +426,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids)
         self.assertNotIn(self.old_example.id, example_ids)
 
-
         # check with manager
         self.assertIn(self.tip3.id, tip_ids)
         self.assertNotIn(self.tip4.id, tip_ids)
@@ -432,7 +434,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids)
         self.assertNotIn(self.old_example1.id, example_ids)
 
-
     def test_get_user_activities_check_mount_timestamp(self):
         activities = ActivityCache.get_user_activities(user_ids=self.user_ids)
 
@@ -485,7 +486,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example2.id, example_ids_by_normal_user)
         self.assertIn(self.old_example.id, example_ids_by_normal_user)
 
-
         tip_ids_by_manager_user = self.get_ids_user_activities(
             activities, self.manager_user.id, self.tip_content_type
         )
@@ -501,7 +501,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example4.id, example_ids_by_manager_user)
         self.assertIn(self.old_example1.id, example_ids_by_manager_user)
 
-
     def test_get_user_activities_check_filter_user_ids(self):
         activities = ActivityCache.get_user_activities(user_ids=[])
 
@@ -547,7 +546,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example2.id, example_ids_by_normal_user)
         self.assertNotIn(self.old_example.id, example_ids_by_normal_user)
 
-
         tip_ids_by_manager_user = self.get_ids_user_activities(
             activities, self.manager_user.id, self.tip_content_type
         )
@@ -563,7 +561,6 @@ class TestActivity(BaseAPITestCase):
         self.assertIn(self.example4.id, example_ids_by_manager_user)
         self.assertNotIn(self.old_example1.id, example_ids_by_manager_user)
 
-
     def test_get_user_activities_with_filter_end_date(self):
         activities = ActivityCache.get_user_activities(
             user_ids=self.user_ids,
@@ -585,7 +582,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids_by_normal_user)
         self.assertIn(self.old_example.id, example_ids_by_normal_user)
 
-
         tip_ids_by_manager_user = self.get_ids_user_activities(
             activities, self.manager_user.id, self.tip_content_type
         )
@@ -601,7 +597,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids_by_manager_user)
         self.assertIn(self.old_example1.id, example_ids_by_manager_user)
 
-
     def test_get_user_activities_with_filter_date(self):
         activities = ActivityCache.get_user_activities(
             user_ids=self.user_ids,
@@ -624,7 +619,6 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example2.id, example_ids_by_normal_user)
         self.assertNotIn(self.old_example.id, example_ids_by_normal_user)
 
-
         tip_ids_by_manager_user = self.get_ids_user_activities(
             activities, self.manager_user.id, self.tip_content_type
         )
@@ -640,3 +634,113 @@ class TestActivity(BaseAPITestCase):
         self.assertNotIn(self.example4.id, example_ids_by_manager_user)
         self.assertNotIn(self.old_example1.id, example_ids_by_manager_user)
 
+    def test_add_notifications_with_warm_cache(self):
+        ActivityCache.get_activities_by_user(self.normal_user.id)
+
+        key_name = ActivityCache.ACTIVITIES_CACHE_KEY.format(
+            self.normal_user.id
+        )
+        self.assertIsNotNone(cache.get(key_name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=self.normal_user, updated_by=None)
+
+        # without Redis the cached activities are dropped
+        self.assertIsNone(cache.get(key_name))
+
+        activities = ActivityCache.get_activities_by_user(self.normal_user.id)
+        tip_ids = self.get_ids_by_user(activities, self.tip_content_type)
+        self.assertIn(tip.id, tip_ids)
+        self.assertIn(self.tip1.id, tip_ids)
+
+    def test_add_notifications_with_redis(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=self.normal_user, updated_by=None)
+        notification = Notification.objects.filter(
+            recipient=self.normal_user,
+            level="success",
+            action_object_object_id=tip.id,
+            action_object_content_type_id=self.tip_content_type,
+        ).latest("timestamp")
+
+        with mock.patch.object(ActivityCache, "get_connection") as connection:
+            ActivityCache.add_notifications([notification])
+
+        merge = connection.return_value.register_script.return_value
+        timestamp = ActivityCache.format_timestamp(notification.timestamp)
+        merge.assert_called_once_with(
+            keys=[
+                cache.make_key(
+                    ActivityCache.ACTIVITIES_CACHE_KEY.format(
+                        self.normal_user.id
+                    )
+                )
+            ],
+            args=[
+                "1",
+                0,
+                ActivityCache.LAST_ACTIVITY_FIELD,
+                timestamp,
+                "{}:{}".format(self.tip_content_type, tip.id),
+                timestamp,
+            ],
+        )
+
+    def test_get_activities_by_user_with_redis(self):
+        timestamp = timezone.now()
+        fields = {
+            ActivityCache.COMPLETE_FIELD: "1",
+            ActivityCache.LAST_ACTIVITY_FIELD: ActivityCache.format_timestamp(
+                timestamp
+            ),
+            "{}:{}".format(
+                self.tip_content_type, self.tip1.id
+            ): ActivityCache.format_timestamp(timestamp),
+        }
+
+        with mock.patch.object(ActivityCache, "get_connection") as connection:
+            connection.return_value.hgetall.return_value = {
+                field.encode(): value.encode()
+                for field, value in fields.items()
+            }
+
+            with self.assertNumQueries(0):
+                activities = ActivityCache.get_activities_by_user(
+                    self.normal_user.id
+                )
+                last_activity = ActivityCache.get_last_activity_by_user(
+                    self.normal_user.id
+                )
+
+        self.assertEqual(
+            {self.tip_content_type: [{self.tip1.id: timestamp}]}, activities
+        )
+        self.assertEqual(timestamp, last_activity)
+
+    def test_add_notifications_with_cold_cache(self):
+        key_name = ActivityCache.ACTIVITIES_CACHE_KEY.format(
+            self.normal_user.id
+        )
+        cache.delete(key_name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=self.normal_user, updated_by=None)
+
+        self.assertIsNone(cache.get(key_name))
+
+        activities = ActivityCache.get_activities_by_user(self.normal_user.id)
+        tip_ids = self.get_ids_by_user(activities, self.tip_content_type)
+        self.assertIn(tip.id, tip_ids)
+        self.assertIsNotNone(cache.get(key_name))
+
+    def test_add_notifications_ignore_not_success_level(self):
+        ActivityCache.get_activities_by_user(self.manager_user.id)
+
+        # managers only get an info notification for a teacher's new tip
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=self.normal_user, updated_by=None)
+
+        activities = ActivityCache.get_activities_by_user(self.manager_user.id)
+        tip_ids = self.get_ids_by_user(activities, self.tip_content_type)
+        self.assertNotIn(tip.id, tip_ids)
+        self.assertIn(self.tip3.id, tip_ids)
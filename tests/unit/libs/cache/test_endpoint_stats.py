@@ -0,0 +1,52 @@
+from unittest import mock
+
+from libs.cache import EndpointStats
+from tests.base_test import BaseTestCase
+
+
+class TestEndpointStats(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.object(EndpointStats, "get_connection")
+        self.connection = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_record(self):
+        EndpointStats.record("GET v1:tips-list", {"requests": 1, "queries": 4})
+
+        pipeline = self.connection.pipeline.return_value
+        pipeline.hincrbyfloat.assert_has_calls(
+            [
+                mock.call("ENDPOINT_STATS", "GET v1:tips-list|requests", 1),
+                mock.call("ENDPOINT_STATS", "GET v1:tips-list|queries", 4),
+            ]
+        )
+        pipeline.execute.assert_called_once_with()
+
+    def test_get_all(self):
+        self.connection.hgetall.return_value = {
+            b"GET v1:tips-list|requests": b"2",
+            b"GET v1:tips-list|queries": b"10",
+            b"GET v1:tips-list|total_ms": b"50",
+            b"GET v1:tips-list|cache_hits": b"3",
+            b"GET v1:tasks-list|requests": b"1",
+            b"GET v1:tasks-list|total_ms": b"200",
+        }
+
+        stats = EndpointStats.get_all()
+
+        self.assertEqual(
+            ["GET v1:tasks-list", "GET v1:tips-list"],
+            [endpoint_stats["endpoint"] for endpoint_stats in stats],
+        )
+        self.assertEqual(2, stats[1]["requests"])
+        self.assertEqual(5, stats[1]["avg_queries"])
+        self.assertEqual(25, stats[1]["avg_total_ms"])
+        self.assertEqual(3, stats[1]["cache_hits"])
+        self.assertEqual(0, stats[1]["cache_misses"])
+
+    def test_reset(self):
+        EndpointStats.reset()
+
+        self.connection.delete.assert_called_once_with("ENDPOINT_STATS")
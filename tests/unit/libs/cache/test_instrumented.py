@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from libs.cache.instrumented import InstrumentedCacheMixin
+from libs.request_stats import RequestStats
+from tests.base_test import BaseTestCase
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
+
+
+class TestInstrumentedCache(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.cache = InstrumentedLocMemCache("instrumented", {})
+        self.cache.set("key", "value")
+
+        self.stats = RequestStats()
+        token = self.stats.activate()
+        self.addCleanup(RequestStats.deactivate, token)
+
+    def test_get(self):
+        self.assertEqual("value", self.cache.get("key"))
+        self.assertEqual("default", self.cache.get("other", "default"))
+
+        self.assertEqual(1, self.stats.cache_hits)
+        self.assertEqual(1, self.stats.cache_misses)
+
+    def test_get_many(self):
+        values = self.cache.get_many(["key", "other", "another"])
+
+        self.assertEqual({"key": "value"}, values)
+        self.assertEqual(1, self.stats.cache_hits)
+        self.assertEqual(2, self.stats.cache_misses)
+
+    def test_get_many_with_native_get_many(self):
+        with mock.patch.object(
+            LocMemCache, "get_many", return_value={"key": "value"}
+        ):
+            self.cache.get_many(["key", "other"])
+
+        self.assertEqual(1, self.stats.cache_hits)
+        self.assertEqual(1, self.stats.cache_misses)
+
+
+class TestInstrumentedCacheWithoutRequestStats(BaseTestCase):
+    def test_get(self):
+        cache = InstrumentedLocMemCache("instrumented", {})
+        cache.set("key", "value")
+
+        self.assertIsNone(RequestStats.current())
+        self.assertEqual("value", cache.get("key"))
+        self.assertEqual({"key": "value"}, cache.get_many(["key"]))
@@ -0,0 +1,50 @@
+import json
+from unittest import mock
+
+from libs.cache import TipReadBuffer
+from tests.base_test import BaseTestCase
+
+
+class TestTipReadBuffer(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.object(TipReadBuffer, "get_connection")
+        self.connection = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_claim(self):
+        read = {"user": 1, "tip": 2, "student": None, "timestamp": "now"}
+        script = self.connection.register_script
+        script.return_value.return_value = [json.dumps(read).encode()]
+
+        batch_key, reads = TipReadBuffer.claim(10)
+
+        self.assertEqual([read], reads)
+        self.assertTrue(batch_key.startswith("TIP_READS_PROCESSING_"))
+        script.assert_called_once_with(TipReadBuffer.CLAIM_SCRIPT)
+        script.return_value.assert_called_once_with(
+            keys=[TipReadBuffer.TIP_READS_KEY, batch_key], args=[10]
+        )
+
+    def test_claim_new_processing_list_every_time(self):
+        self.connection.register_script.return_value.return_value = []
+
+        first_batch_key, _reads = TipReadBuffer.claim(10)
+        second_batch_key, _reads = TipReadBuffer.claim(10)
+
+        self.assertNotEqual(first_batch_key, second_batch_key)
+
+    def test_ack(self):
+        TipReadBuffer.ack("batch")
+
+        self.connection.delete.assert_called_once_with("batch")
+
+    def test_release(self):
+        TipReadBuffer.release("batch")
+
+        script = self.connection.register_script
+        script.assert_called_once_with(TipReadBuffer.RELEASE_SCRIPT)
+        script.return_value.assert_called_once_with(
+            keys=[TipReadBuffer.TIP_READS_KEY, "batch"]
+        )
@@ -0,0 +1,51 @@
+from django.core.cache import cache
+
+from libs.cache import UserCache
+from tests.base_test import BaseTestCase
+
+
+class TestUserCache(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+        UserCache.invalidate(self.normal_user.id)
+
+    def test_get_user(self):
+        user = UserCache.get_user(self.normal_user.id)
+
+        self.assertEqual(self.normal_user, user)
+        self.assertIsNotNone(
+            cache.get(UserCache.USER_CACHE_KEY.format(self.normal_user.id))
+        )
+
+        with self.assertNumQueries(0):
+            user = UserCache.get_user(self.normal_user.id)
+
+        self.assertEqual(self.normal_user, user)
+
+    def test_get_user_with_not_existed_user(self):
+        self.assertIsNone(UserCache.get_user(0))
+
+    def test_get_local_user_expired(self):
+        UserCache.get_user(self.normal_user.id)
+        self.assertIsNotNone(UserCache.get_local_user(self.normal_user.id))
+
+        expires_at, user = UserCache._local_users[self.normal_user.id]
+        UserCache._local_users[self.normal_user.id] = (0, user)
+
+        self.assertIsNone(UserCache.get_local_user(self.normal_user.id))
+
+    def test_invalidate_when_user_saved(self):
+        UserCache.get_user(self.normal_user.id)
+
+        self.normal_user.first_name = "new first name"
+        self.normal_user.save()
+
+        self.assertIsNone(UserCache.get_local_user(self.normal_user.id))
+        self.assertIsNone(
+            cache.get(UserCache.USER_CACHE_KEY.format(self.normal_user.id))
+        )
+        self.assertEqual(
+            "new first name",
+            UserCache.get_user(self.normal_user.id).first_name,
+        )
@@ -0,0 +1,91 @@
+import io
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from openpyxl import load_workbook
+
+from libs.import_export import ExportFileWriter, TipRatingResource
+from main.models import TipRating
+from tests.base_test import BaseTestCase
+from tests.factories import (
+    ExampleFactory,
+    ExampleRatingFactory,
+    TipFactory,
+    TipRatingFactory,
+)
+
+
+class TestTipRatingResource(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.tip = TipFactory.create()
+        cls.example1 = ExampleFactory.create(tip=cls.tip, headline="first")
+        cls.example2 = ExampleFactory.create(tip=cls.tip, headline="second")
+        ExampleFactory.create(tip=cls.tip, headline="not rated")
+
+        ExampleRatingFactory.create(example=cls.example1, clarity=2)
+        ExampleRatingFactory.create(example=cls.example1, clarity=4)
+        ExampleRatingFactory.create(example=cls.example2, clarity=5)
+
+        cls.tip_rating = TipRatingFactory.create(tip=cls.tip)
+
+    def export_rows(self):
+        rows = TipRatingResource().iter_export(TipRating.objects.all())
+        headers = next(rows)
+
+        return [dict(zip(headers, row)) for row in rows]
+
+    def test_iter_export(self):
+        rows = self.export_rows()
+
+        self.assertEqual(1, len(rows))
+        self.assertEqual(self.tip_rating.added_by_id, rows[0]["user_id"])
+        self.assertEqual(self.tip.title, rows[0]["title"])
+        self.assertEqual(
+            '"first":3.0, "second":5.0', rows[0]["clarity_examples"]
+        )
+
+    def test_iter_export_queries_do_not_grow(self):
+        with CaptureQueriesContext(connection) as context:
+            self.export_rows()
+        queries_count = len(context.captured_queries)
+
+        TipRatingFactory.create_batch(5, tip=self.tip)
+        TipRatingFactory.create_batch(5)
+
+        with CaptureQueriesContext(connection) as context:
+            rows = self.export_rows()
+
+        self.assertEqual(11, len(rows))
+        self.assertEqual(queries_count, len(context.captured_queries))
+
+
+class TestExportFileWriter(BaseTestCase):
+    rows = [["id", "comment"], [1, "first"], [2, "second\x00"]]
+
+    def test_write_csv(self):
+        file = io.BytesIO()
+
+        ExportFileWriter.write(iter(self.rows), "csv", file)
+
+        self.assertEqual(
+            "id,comment\r\n1,first\r\n2,second\x00\r\n",
+            file.getvalue().decode(),
+        )
+
+    def test_write_xlsx(self):
+        file = io.BytesIO()
+
+        ExportFileWriter.write(iter(self.rows), "xlsx", file)
+
+        sheet = load_workbook(file).active
+        self.assertEqual(
+            [("id", "comment"), (1, "first"), (2, "second")],
+            list(sheet.values),
+        )
+
+    def test_write_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            ExportFileWriter.write(iter(self.rows), "ods", io.BytesIO())
@@ -16,18 +16,17 @@ class TestBaseManager(BaseTestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        content_types = ContentType.objects.get_for_models(
-            Tip, Example
-        )
+        content_types = ContentType.objects.get_for_models(Tip, Example)
         cls.tip_content_type = content_types[Tip].id
         cls.example_content_type = content_types[Example].id
 
-        cls.tip1 = TipFactory.create(
-            title="tip 1",
-            description="description 1",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip1 = TipFactory.create(
+                title="tip 1",
+                description="description 1",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
         cls.tip1.created_at -= timezone.timedelta(hours=24)
         cls.tip1.save()
 
@@ -43,20 +42,21 @@ class TestBaseManager(BaseTestCase):
         cls.tip1_notification.timestamp -= timezone.timedelta(hours=24)
         cls.tip1_notification.save()
 
-        cls.tip2 = TipFactory.create(
-            title="tip 2",
-            description="description 2",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip2 = TipFactory.create(
+                title="tip 2",
+                description="description 2",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
 
-        cls.example1 = ExampleFactory.create(
-            description="example 1",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example1 = ExampleFactory.create(
+                description="example 1",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example1.created_at -= timezone.timedelta(hours=24)
         cls.example1.save()
 
@@ -72,17 +72,21 @@ class TestBaseManager(BaseTestCase):
         cls.example1_notification.timestamp -= timezone.timedelta(hours=24)
         cls.example1_notification.save()
 
-        cls.example2 = ExampleFactory.create(
-            description="example 2",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example2 = ExampleFactory.create(
+                description="example 2",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example = ExampleFactory.create(
-            added_by=cls.normal_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example = ExampleFactory.create(
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example.created_at -= timezone.timedelta(days=365)
         cls.old_example.save()
 
@@ -188,3 +192,8 @@ class TestBaseManager(BaseTestCase):
         result = StudentTip.objects.count_by_days(days=365)
         self.assertEqual(result[student_tip1.student_id], 1)
         self.assertEqual(result[student_tip2.student_id], 1)
+
+        result = StudentTip.objects.count_by_days(
+            days=365, student_ids=[student_tip1.student_id]
+        )
+        self.assertDictEqual({student_tip1.student_id: 1}, result)
@@ -0,0 +1,116 @@
+import re
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from redis.exceptions import ConnectionError
+from rest_framework.test import APIClient
+
+from libs.cache import EndpointStats
+from libs.middleware import RequestStatsMiddleware
+from tests.base_api_test import BaseAPITestCase
+from tests.factories import EpisodeFactory, StudentFactory, TipFactory
+
+
+@override_settings(REQUEST_STATS_ENABLED=True)
+class TestRequestStatsMiddleware(BaseAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        TipFactory.create()
+
+        cls.url = reverse("v1:tips-list")
+
+    def get(self, url, user=None):
+        # a new client, the handler loads the middleware on its first request
+        client = APIClient()
+        client.force_authenticate(user=user or self.super_user)
+        return client.get(url)
+
+    def test_server_timing_header(self):
+        response = self.get(self.url)
+
+        self.assertEqual(200, response.status_code)
+
+        server_timing = response["Server-Timing"]
+        self.assertRegex(server_timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(server_timing, r'cache;desc="\d+ hits, \d+ misses"')
+        self.assertRegex(server_timing, r"app;dur=[\d.]+")
+        self.assertRegex(server_timing, r"total;dur=[\d.]+")
+
+    def test_server_timing_header_not_staff(self):
+        response = self.get(self.url, user=self.normal_user)
+
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    def test_show_server_timing(self):
+        middleware = RequestStatsMiddleware(lambda request: None)
+        request = RequestFactory().get(self.url)
+        request.user = AnonymousUser()
+
+        self.assertFalse(middleware.show_server_timing(request))
+        with override_settings(DEBUG=True):
+            self.assertTrue(middleware.show_server_timing(request))
+
+        request.user = self.super_user
+        self.assertTrue(middleware.show_server_timing(request))
+
+    @override_settings(REQUEST_STATS_ENABLED=False)
+    def test_disabled(self):
+        response = self.get(self.url)
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @override_settings(REQUEST_STATS_AGGREGATE_ENABLED=True)
+    def test_aggregate(self):
+        with mock.patch.object(EndpointStats, "record") as mock_record:
+            self.get(self.url)
+            self.get("/admin/")
+
+        mock_record.assert_called_once()
+        endpoint, counters = mock_record.call_args.args
+        self.assertEqual("GET v1:tips-list", endpoint)
+        self.assertEqual(1, counters["requests"])
+        self.assertGreater(counters["queries"], 0)
+
+    def test_not_aggregated_by_default(self):
+        with mock.patch.object(EndpointStats, "record") as mock_record:
+            self.get(self.url)
+
+        mock_record.assert_not_called()
+
+    @override_settings(REQUEST_STATS_AGGREGATE_ENABLED=True)
+    def test_aggregate_streaming_response(self):
+        student = StudentFactory.create()
+        EpisodeFactory.create(student=student, heads_up_json={"test": 1})
+        url = reverse("v1:students-heads-up", args=[student.id])
+
+        with mock.patch.object(EndpointStats, "record") as mock_record:
+            response = self.get(url)
+
+            # recorded once the body is streamed
+            mock_record.assert_not_called()
+            b"".join(response.streaming_content)
+
+        mock_record.assert_called_once()
+        endpoint, counters = mock_record.call_args.args
+        self.assertEqual("GET v1:students-heads-up", endpoint)
+
+        # the header only covers the view, the episodes are read while
+        # streaming
+        view_queries = int(
+            re.search(r"(\d+) queries", response["Server-Timing"]).group(1)
+        )
+        self.assertEqual(view_queries + 1, counters["queries"])
+
+    @override_settings(REQUEST_STATS_AGGREGATE_ENABLED=True)
+    def test_aggregate_redis_error(self):
+        with mock.patch.object(
+            EndpointStats, "record", side_effect=ConnectionError
+        ), self.assertLogs("libs.middleware.request_stats", "WARNING"):
+            response = self.get(self.url)
+
+        self.assertEqual(200, response.status_code)
@@ -0,0 +1,54 @@
+from asgiref.sync import async_to_sync
+from rest_framework_simplejwt.state import token_backend
+
+from libs.cache import UserCache
+from libs.jwt_auth import custom_jwt_payload_handler
+from libs.middleware.token_auth import get_user, get_user_from_payload
+from tests.base_test import BaseTestCase
+
+
+class TestTokenAuth(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+        UserCache.invalidate(self.normal_user.id)
+
+    def test_get_user_from_payload(self):
+        payload = custom_jwt_payload_handler(self.normal_user)
+
+        user = get_user_from_payload(payload)
+
+        self.assertEqual(self.normal_user, user)
+        self.assertIsNotNone(UserCache.get_local_user(self.normal_user.id))
+
+    def test_get_user_from_payload_without_user_id_claim(self):
+        payload = custom_jwt_payload_handler(self.normal_user)
+        payload.pop("user_id")
+
+        user = get_user_from_payload(payload)
+
+        self.assertEqual(self.normal_user, user)
+
+    def test_get_user_from_payload_with_not_existed_user(self):
+        payload = custom_jwt_payload_handler(self.normal_user)
+        payload["user_id"] = 0
+
+        user = get_user_from_payload(payload)
+
+        self.assertTrue(user.is_anonymous)
+
+    def test_get_user_with_local_cache(self):
+        UserCache.get_user(self.normal_user.id)
+        token = token_backend.encode(
+            custom_jwt_payload_handler(self.normal_user)
+        )
+
+        with self.assertNumQueries(0):
+            user = async_to_sync(get_user)(token)
+
+        self.assertEqual(self.normal_user, user)
+
+    def test_get_user_with_invalid_token(self):
+        user = async_to_sync(get_user)("invalid token")
+
+        self.assertTrue(user.is_anonymous)
@@ -0,0 +1,72 @@
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from libs.pagination import KeysetPagination
+from main.models import Tip
+from tests.base_test import BaseTestCase
+from tests.factories import TipFactory
+
+
+class TestKeysetPagination(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.tips = TipFactory.create_batch(5)
+        # two tips sharing the same created_at exercise the pk tie break
+        created_at = timezone.localtime()
+        Tip.objects.filter(id__in=[cls.tips[1].id, cls.tips[2].id]).update(
+            created_at=created_at
+        )
+
+    def paginate(self, url, queryset):
+        paginator = KeysetPagination(page_size=2)
+        request = Request(APIRequestFactory().get(url))
+        items = paginator.paginate_queryset(queryset, request)
+
+        return paginator, [item.id for item in items]
+
+    def test_paginate_queryset(self):
+        queryset = Tip.objects.order_by("-created_at")
+        expected_ids = list(
+            queryset.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+
+        ids = []
+        url = "/tips/?cursor="
+        while url:
+            paginator, page_ids = self.paginate(url, queryset)
+            ids.extend(page_ids)
+            url = paginator.get_next_link()
+
+        self.assertEqual(expected_ids, ids)
+
+        # walk back from the last page
+        url = paginator.get_previous_link()
+        paginator, page_ids = self.paginate(url, queryset)
+        self.assertEqual(expected_ids[2:4], page_ids)
+
+        paginator, page_ids = self.paginate(
+            paginator.get_previous_link(), queryset
+        )
+        self.assertEqual(expected_ids[:2], page_ids)
+        self.assertIsNone(paginator.get_previous_link())
+
+    def test_paginate_queryset_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate("/tips/?cursor=invalid", Tip.objects.all())
+
+    def test_get_paginated_response(self):
+        paginator, _ = self.paginate("/tips/?cursor=", Tip.objects.all())
+
+        response = paginator.get_paginated_response([])
+
+        self.assertEqual(
+            ["count", "next", "previous", "results"], list(response.data)
+        )
+        self.assertIsNone(response.data["count"])
+        self.assertIsNone(response.data["previous"])
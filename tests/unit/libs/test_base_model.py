@@ -0,0 +1,86 @@
+from django.db.models import F
+
+from main.models import Example, Tip
+from tests.base_test import BaseTestCase
+from tests.factories import ExampleFactory, TipFactory
+
+
+class TestBaseModel(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.tip = TipFactory.create(title="tip title")
+        cls.example = ExampleFactory.create(tip=cls.tip, episode=None)
+
+    def test_has_changed(self):
+        tip = Tip.objects.get(id=self.tip.id)
+        self.assertFalse(tip.has_changed("title"))
+
+        tip.title = "tip title updated"
+        self.assertTrue(tip.has_changed("title"))
+        self.assertEqual("tip title", tip.get_loaded_value("title"))
+
+        tip.save()
+        self.assertFalse(tip.has_changed("title"))
+
+    def test_has_changed_foreign_key(self):
+        example = Example.objects.get(id=self.example.id)
+        self.assertFalse(example.has_changed("tip"))
+
+        example.tip = None
+        self.assertTrue(example.has_changed("tip"))
+        self.assertEqual(self.tip.id, example.get_loaded_value("tip"))
+
+    def test_has_changed_new_instance(self):
+        self.assertTrue(Tip(title="new tip").has_changed("title"))
+
+    def test_has_changed_deferred_field(self):
+        tip = Tip.objects.only("id").get(id=self.tip.id)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(tip.has_changed("title"))
+
+        tip.title = "tip title updated"
+        with self.assertNumQueries(1):
+            self.assertTrue(tip.has_changed("title"))
+
+    def test_has_changed_without_query(self):
+        tip = Tip.objects.get(id=self.tip.id)
+        tip.marked_for_editing = True
+
+        with self.assertNumQueries(0):
+            self.assertTrue(tip.has_changed("marked_for_editing"))
+
+    def test_save_with_expression(self):
+        tip = Tip.objects.get(id=self.tip.id)
+
+        tip.helpful_count = F("helpful_count") + 1
+        tip.save(update_fields=["helpful_count"])
+        tip.refresh_from_db(fields=["helpful_count"])
+
+        self.assertEqual(1, tip.helpful_count)
+        self.assertFalse(tip.has_changed("helpful_count"))
+
+    def test_save_with_update_fields_keep_other_changes(self):
+        tip = Tip.objects.get(id=self.tip.id)
+
+        tip.title = "tip title updated"
+        tip.marked_for_editing = True
+        tip.save(update_fields=["marked_for_editing"])
+
+        self.assertFalse(tip.has_changed("marked_for_editing"))
+        self.assertTrue(tip.has_changed("title"))
+        self.assertEqual("tip title", tip.get_loaded_value("title"))
+
+    def test_has_changed_json_field_mutated_in_place(self):
+        tip = Tip.objects.get(id=self.tip.id)
+        tip.child_context = {"motivator": {"order": 1, "value": "trains"}}
+        tip.save()
+
+        tip.child_context["motivator"]["value"] = "dinosaurs"
+        self.assertTrue(tip.has_changed("child_context"))
+
+        tip = Tip.objects.get(id=self.tip.id)
+        tip.child_context["motivator"]["value"] = "dinosaurs"
+        self.assertTrue(tip.has_changed("child_context"))
@@ -2,6 +2,7 @@ from notifications.models import Notification
 
 import constants
 from libs.websocket import ExampleNotificationWebsocket
+from main.models import UserActivitySummary
 from tests.base_test import BaseTestCase
 from tests.factories import ExampleFactory, TipFactory
 
@@ -78,3 +79,17 @@ class TestExampleNotificationWebsocket(BaseTestCase):
             verb=constants.Activity.ATTACH_TIP_WITH_EXAMPLE
         ).count()
         self.assertEqual(old_count, new_count)
+
+    def test_send_example_notification_updates_activity_summary(self):
+        UserActivitySummary.objects.rebuild([self.manager_user.id])
+
+        ExampleNotificationWebsocket.send_example_notification_to_tip_owner(
+            self.example1, updated=False
+        )
+
+        notification = Notification.objects.filter(
+            verb=constants.Activity.ATTACH_TIP_WITH_EXAMPLE
+        ).latest("id")
+        summary = UserActivitySummary.objects.get(user=self.manager_user)
+        self.assertEqual(notification.timestamp, summary.last_activity)
+        self.assertEqual(self.example1.id, summary.recent_examples[0][0])
@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+from django.db import DatabaseError, transaction
+from django.test import override_settings
+from notifications.models import Notification
+
+import constants
+from libs.websocket.notification_websocket import NotificationWebsocketMixin
+from tests.base_test import BaseTestCase
+
+
+class TestNotificationWebsocketMixin(BaseTestCase):
+    @patch.object(NotificationWebsocketMixin, "dispatch_new_notifications")
+    def test_send_new_notification_to_websockets_after_commit(
+        self, mock_dispatch
+    ):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationWebsocketMixin.send_new_notification_to_websockets(
+                [self.normal_user.id, self.manager_user.id]
+            )
+            NotificationWebsocketMixin.send_new_notification_to_websocket(
+                self.normal_user.id
+            )
+
+            mock_dispatch.assert_not_called()
+
+        mock_dispatch.assert_called_once_with(
+            sorted([self.normal_user.id, self.manager_user.id])
+        )
+
+    @patch.object(NotificationWebsocketMixin, "dispatch_new_notifications")
+    def test_send_new_notification_to_websockets_after_rollback(
+        self, mock_dispatch
+    ):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    NotificationWebsocketMixin.send_new_notification_to_websocket(
+                        self.normal_user.id
+                    )
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+
+            NotificationWebsocketMixin.send_new_notification_to_websocket(
+                self.manager_user.id
+            )
+
+        self.assertEqual(1, len(callbacks))
+        mock_dispatch.assert_called_once_with([self.manager_user.id])
+
+    @patch.object(NotificationWebsocketMixin, "dispatch_new_notifications")
+    def test_send_new_notification_to_websockets_without_users(
+        self, mock_dispatch
+    ):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            NotificationWebsocketMixin.send_new_notification_to_websockets(
+                [None]
+            )
+
+        self.assertEqual(0, len(callbacks))
+        mock_dispatch.assert_not_called()
+
+    @override_settings(WEBSOCKET_NOTIFICATION_USE_CELERY=True)
+    @patch("tasks.websocket.send_new_notifications_to_websockets.delay")
+    def test_send_new_notification_to_websockets_with_celery(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationWebsocketMixin.send_new_notification_to_websockets(
+                [self.normal_user.id, self.normal_user.id]
+            )
+
+        mock_delay.assert_called_once_with(
+            [self.normal_user.id],
+            "libs.websocket.notification_websocket.NotificationWebsocketMixin",
+        )
+
+    @patch.object(NotificationWebsocketMixin, "group_send_many")
+    def test_send_new_notification_to_websockets_by_class(
+        self, mock_group_send_many
+    ):
+        class CustomNotificationWebsocket(NotificationWebsocketMixin):
+            @classmethod
+            def prepare_data(cls, unread_count=None):
+                return {"custom": True}
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            NotificationWebsocketMixin.send_new_notification_to_websocket(
+                self.normal_user.id
+            )
+            CustomNotificationWebsocket.send_new_notification_to_websocket(
+                self.manager_user.id
+            )
+
+        self.assertEqual(2, len(callbacks))
+
+        messages = {}
+        for call in mock_group_send_many.call_args_list:
+            messages.update(call[0][0])
+        self.assertEqual(
+            {"type": "send_message", "data": {"custom": True}},
+            messages["user_{}".format(self.manager_user.id)],
+        )
+        self.assertEqual(
+            {
+                "type": "send_message",
+                "data": {"new_notification": True, "unread_count": 0},
+            },
+            messages["user_{}".format(self.normal_user.id)],
+        )
+
+    @patch.object(NotificationWebsocketMixin, "group_send_many")
+    def test_dispatch_new_notifications_with_unread_count(
+        self, mock_group_send_many
+    ):
+        Notification.objects.create(
+            recipient=self.normal_user,
+            verb=constants.Activity.ASSIGN_STUDENT,
+            actor=self.manager_user,
+        )
+        Notification.objects.create(
+            recipient=self.experimental_user,
+            verb=constants.Activity.ASSIGN_STUDENT,
+            actor=self.manager_user,
+        )
+
+        NotificationWebsocketMixin.dispatch_new_notifications(
+            [self.normal_user.id, self.experimental_user.id]
+        )
+
+        messages = dict(mock_group_send_many.call_args[0][0])
+        self.assertEqual(
+            {
+                "type": "send_message",
+                "data": {"new_notification": True, "unread_count": 1},
+            },
+            messages["user_{}".format(self.normal_user.id)],
+        )
+        # DLP users only see suggested tips in their notifications
+        self.assertEqual(
+            {
+                "type": "send_message",
+                "data": {"new_notification": True, "unread_count": 0},
+            },
+            messages["user_{}".format(self.experimental_user.id)],
+        )
@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from main.models import User, UserActivitySummary
+from tests.base_test import BaseTestCase
+from tests.factories import TipFactory
+
+
+class TestBackfillActivitySummaries(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip = TipFactory.create(
+                added_by=cls.normal_user, updated_by=None
+            )
+
+    def test_handle(self):
+        UserActivitySummary.objects.all().delete()
+
+        call_command(
+            "backfill_activity_summaries", batch_size=1, stdout=StringIO()
+        )
+
+        self.assertEqual(
+            User.objects.count(), UserActivitySummary.objects.count()
+        )
+        summary = UserActivitySummary.objects.get(user=self.normal_user)
+        self.assertEqual(self.tip.id, summary.recent_tips[0][0])
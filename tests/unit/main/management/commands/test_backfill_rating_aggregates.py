@@ -0,0 +1,45 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from main.models import Example, Tip
+from tests.base_test import BaseTestCase
+from tests.factories import (
+    ExampleFactory,
+    ExampleRatingFactory,
+    TipFactory,
+    TipRatingFactory,
+)
+
+
+class TestBackfillRatingAggregates(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.tip = TipFactory.create()
+        TipRatingFactory.create(
+            tip=cls.tip, clarity=4, relevance=2, uniqueness=3
+        )
+        cls.example = ExampleFactory.create()
+        ExampleRatingFactory.create(
+            example=cls.example, clarity=4, recommended=2
+        )
+
+    def test_handle(self):
+        Tip.objects.update(rating_count=0, clarity_average_rating=None)
+        Example.objects.update(rating_count=0, clarity_average_rating=None)
+
+        call_command(
+            "backfill_rating_aggregates", batch_size=1, stdout=StringIO()
+        )
+
+        self.tip.refresh_from_db()
+        self.assertEqual(1, self.tip.rating_count)
+        self.assertEqual(4, self.tip.clarity_average_rating)
+        self.assertEqual(3, self.tip.average_rating)
+
+        self.example.refresh_from_db()
+        self.assertEqual(1, self.example.rating_count)
+        self.assertEqual(4, self.example.clarity_average_rating)
+        self.assertEqual(3, self.example.average_rating)
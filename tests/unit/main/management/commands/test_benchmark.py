@@ -0,0 +1,139 @@
+import json
+import os
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from notifications.models import Notification
+
+from main.models import TipRating, User, UserActivitySummary
+from tests.base_test import BaseTestCase
+from tests.benchmark import Baseline, BenchmarkSeeder
+
+
+class TestBenchmark(BaseTestCase):
+    volumes = {
+        "users": 20,
+        "students": 5,
+        "tips": 10,
+        "examples": 10,
+        "student_tips": 20,
+        "ratings": 30,
+        "notifications": 40,
+    }
+
+    def setUp(self):
+        super().setUp()
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output = os.path.join(directory.name, "baseline.json")
+
+    def benchmark(self, **options):
+        call_command(
+            "benchmark",
+            seed=True,
+            interactive=False,
+            iterations=2,
+            warmup=0,
+            stdout=StringIO(),
+            **self.volumes,
+            **options,
+        )
+
+    def test_handle(self):
+        ratings_count = TipRating.objects.count()
+        notifications_count = Notification.objects.count()
+        last_user_id = User.objects.order_by("id").last().id
+
+        self.benchmark(output=self.output, label="test")
+
+        self.assertIsNotNone(BenchmarkSeeder.get_benchmark_user())
+        self.assertEqual(ratings_count + 30, TipRating.objects.count())
+        self.assertGreaterEqual(
+            Notification.objects.count(), notifications_count + 40
+        )
+        # the seeded users have their summaries, the grid reads them only
+        seeded_users = User.objects.filter(id__gt=last_user_id)
+        self.assertEqual(21, seeded_users.count())
+        self.assertEqual(
+            21,
+            UserActivitySummary.objects.filter(user__in=seeded_users).count(),
+        )
+
+        baseline = Baseline.load(self.output)
+        self.assertEqual("test", baseline["label"])
+        self.assertEqual(User.objects.count(), baseline["volumes"]["user"])
+        self.assertEqual(
+            [
+                "GET /v1/managers/users-grid/",
+                "GET /v1/notifications/unread/",
+                "GET /v1/recent-activities/",
+                "GET /v1/students/{}/tips/".format(
+                    BenchmarkSeeder.get_benchmark_user()
+                    .experimental_user.order_by("student_id")
+                    .first()
+                    .student_id
+                ),
+                "GET /v1/tips/",
+                "task tasks.student_tip.dequeue_student_tips",
+                "task tasks.tip_rating.rating_reminder",
+                "task tasks.user_tip.dequeue_tips",
+            ],
+            sorted(baseline["results"]),
+        )
+        for summary in baseline["results"].values():
+            self.assertEqual(2, summary["iterations"])
+            self.assertLessEqual(summary["p50_ms"], summary["p99_ms"])
+            self.assertGreater(summary["queries"], 0)
+
+    def test_handle_without_benchmark_data(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark", stdout=StringIO())
+
+    def test_handle_without_dev_requirements(self):
+        with mock.patch.dict(sys.modules, {"tests.benchmark": None}):
+            with self.assertRaisesMessage(
+                CommandError, "requirements.dev.txt"
+            ):
+                call_command("benchmark", stdout=StringIO())
+
+    def test_handle_fail_on_regression(self):
+        self.benchmark(output=self.output)
+
+        baseline = Baseline.load(self.output)
+        for summary in baseline["results"].values():
+            summary["queries"] = 0
+        with open(self.output, "w") as file:
+            json.dump(baseline, file)
+
+        with self.assertRaises(CommandError):
+            self.benchmark(compare=self.output, fail_on_regression=True)
+
+
+class TestBaseline(BaseTestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(50, Baseline.percentile(values, 50))
+        self.assertEqual(99, Baseline.percentile(values, 99))
+        self.assertEqual(7, Baseline.percentile([7], 90))
+
+    def test_compare(self):
+        old = {"results": {"GET /v1/tips/": self.get_summary(10, 5)}}
+        new = {"results": {"GET /v1/tips/": self.get_summary(12, 5)}}
+
+        rows = Baseline.compare(old, new, threshold=10)
+
+        regressions = [row[1] for row in rows if row[5]]
+        self.assertEqual(["p50_ms", "p90_ms", "p99_ms"], regressions)
+
+    def get_summary(self, ms, queries):
+        return {
+            "p50_ms": ms,
+            "p90_ms": ms,
+            "p99_ms": ms,
+            "queries": queries,
+        }
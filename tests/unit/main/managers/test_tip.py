@@ -1,3 +1,4 @@
+from django.test import override_settings
 from django.utils import timezone
 
 import constants
@@ -281,6 +282,36 @@ class TestTip(BaseTestCase):
         self.assertIn(self.tip1.id, tip_ids)
         self.assertIn(self.tip2.id, tip_ids)
 
+    @override_settings(SEARCH_ENGINE=constants.SearchEngine.FULL_TEXT)
+    def test_search_full_text_by_search_fields(self):
+        tips = Tip.objects.search(None, "description1", ["title"])
+
+        self.assertFalse(tips.exists())
+
+        tips = Tip.objects.search(None, "description1", ["description"])
+
+        self.assertEqual([self.tip1.id], [tip.id for tip in tips])
+
+    @override_settings(SEARCH_ENGINE=constants.SearchEngine.FULL_TEXT)
+    def test_search_full_text_ranking(self):
+        tip = TipFactory.create(
+            title="sensory breaks", description="quiet corner"
+        )
+        other_tip = TipFactory.create(
+            title="quiet corner", description="sensory breaks"
+        )
+
+        tips = Tip.objects.search(None, "sensory", ["title", "description"])
+
+        self.assertEqual([tip.id, other_tip.id], [tip.id for tip in tips])
+        self.assertGreater(tips[0].search_rank, tips[1].search_rank)
+
+    @override_settings(SEARCH_ENGINE=constants.SearchEngine.ICONTAINS)
+    def test_search_icontains_engine(self):
+        tips = Tip.objects.search(None, "escription1", ["description"])
+
+        self.assertEqual([self.tip1.id], [tip.id for tip in tips])
+
     def test_contributions_all_users(self):
         data = Tip.objects.contributions()
 
@@ -382,3 +413,46 @@ class TestTip(BaseTestCase):
         tip_ids = [tip.id for tip in tips]
         self.assertIn(self.tip1.id, tip_ids)
         self.assertNotIn(self.tip2.id, tip_ids)
+
+    def test_annotate_count_value(self):
+        TipRatingFactory.create(
+            tip=self.tip1,
+            added_by=self.user1,
+            read_count=3,
+            try_count=2,
+            helpful_count=1,
+            clarity=1,
+            relevance=2,
+            uniqueness=3,
+        )
+        # ratings for a student or by other users are not counted
+        TipRatingFactory.create(
+            tip=self.tip1,
+            added_by=self.user1,
+            student=StudentFactory.create(),
+            read_count=10,
+        )
+        TipRatingFactory.create(
+            tip=self.tip2, added_by=self.normal_user, read_count=10
+        )
+
+        tips = Tip.objects.annotate_count_value(self.user1.id).in_bulk(
+            [self.tip1.id, self.tip2.id]
+        )
+
+        # the join does not duplicate tips
+        self.assertEqual(
+            1,
+            Tip.objects.annotate_count_value(self.user1.id)
+            .filter(id=self.tip1.id)
+            .count(),
+        )
+        self.assertEqual(3, tips[self.tip1.id].read_count)
+        self.assertEqual(2, tips[self.tip1.id].try_count)
+        self.assertEqual(1, tips[self.tip1.id].helpful_count_by_user)
+        self.assertTrue(tips[self.tip1.id].is_rated)
+
+        self.assertEqual(0, tips[self.tip2.id].read_count)
+        self.assertEqual(0, tips[self.tip2.id].try_count)
+        self.assertEqual(0, tips[self.tip2.id].helpful_count_by_user)
+        self.assertFalse(tips[self.tip2.id].is_rated)
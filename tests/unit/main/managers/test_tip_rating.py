@@ -1,3 +1,11 @@
+from unittest import mock
+
+from django.test import override_settings
+from django.utils import timezone
+from notifications.models import Notification
+
+import constants
+from libs.cache import TipReadBuffer
 from main.models import TipRating
 from tests.base_test import BaseTestCase
 from tests.factories import StudentFactory, TipFactory, TipRatingFactory
@@ -100,6 +108,102 @@ class TestTipRating(BaseTestCase):
         self.tip_rating1.refresh_from_db()
         self.assertTrue(self.tip_rating1.retry_later)
 
+    def test_get_or_update_read_count_single_query(self):
+        with self.assertNumQueries(1):
+            tip_rating = TipRating.objects.get_or_update_read_count(
+                self.normal_user, self.tip
+            )
+
+        self.assertEqual(self.tip_rating.id, tip_rating.id)
+        self.assertEqual(self.tip_rating.read_count + 1, tip_rating.read_count)
+        self.assertFalse(tip_rating.has_changed("read_count"))
+
+    def test_get_or_update_read_count_creates_rating(self):
+        tip = TipFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tip_rating = TipRating.objects.get_or_update_read_count(
+                self.normal_user, tip
+            )
+        self.assertEqual(1, tip_rating.read_count)
+        self.assertIsNone(tip_rating.student_id)
+        self.assertTrue(
+            Notification.objects.filter(
+                actor_object_id=self.normal_user.id,
+                verb=constants.Activity.RATE_TIP,
+            ).exists()
+        )
+
+        TipRating.objects.get_or_update_read_count(self.normal_user, tip)
+        TipRating.objects.get_or_update_read_count(
+            self.normal_user, tip, self.student
+        )
+
+        self.assertEqual(2, TipRating.objects.filter(tip=tip).count())
+        tip_rating.refresh_from_db()
+        self.assertEqual(2, tip_rating.read_count)
+
+    def test_record_read(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TipRating.objects.record_read(self.normal_user, self.tip)
+
+        self.tip_rating.refresh_from_db()
+        self.assertEqual(1, self.tip_rating.read_count)
+        self.assertTrue(
+            Notification.objects.filter(
+                verb=constants.Activity.READ_TIP,
+                target_object_id=self.tip_rating.id,
+            ).exists()
+        )
+
+    @override_settings(TIP_READ_BUFFER_ENABLED=True)
+    def test_record_read_buffered(self):
+        with mock.patch.object(TipReadBuffer, "add") as mock_add:
+            TipRating.objects.record_read(
+                self.normal_user, self.tip, self.student
+            )
+
+        mock_add.assert_called_once_with(
+            self.normal_user.id, self.tip.id, self.student.id
+        )
+        self.tip_rating1.refresh_from_db()
+        self.assertEqual(0, self.tip_rating1.read_count)
+
+    def test_flush_reads(self):
+        tip = TipFactory.create()
+        timestamp = timezone.now() - timezone.timedelta(minutes=1)
+        read = {
+            "user": self.normal_user.id,
+            "tip": self.tip.id,
+            "student": self.student.id,
+            "timestamp": timestamp.isoformat(),
+        }
+        reads = [
+            read,
+            read,
+            {**read, "student": None},
+            {**read, "tip": tip.id, "student": None},
+        ]
+
+        TipRating.objects.flush_reads(reads)
+
+        self.tip_rating.refresh_from_db()
+        self.assertEqual(1, self.tip_rating.read_count)
+        self.tip_rating1.refresh_from_db()
+        self.assertEqual(2, self.tip_rating1.read_count)
+        self.assertEqual(
+            1,
+            TipRating.objects.get(
+                added_by=self.normal_user, tip=tip
+            ).read_count,
+        )
+
+        notifications = Notification.objects.filter(
+            verb=constants.Activity.READ_TIP, recipient=self.normal_user
+        )
+        self.assertEqual(4, notifications.count())
+        self.assertFalse(notifications.exclude(timestamp=timestamp).exists())
+
     def test_get_tips_tried(self):
         tip1 = TipFactory.create()
         tip2 = TipFactory.create()
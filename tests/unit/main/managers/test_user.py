@@ -72,17 +72,18 @@ class TestUser(BaseTestCase):
         self.assertIn(self.manager_user.id, ids)
 
     @override_settings(DEBUG=True)
-    def test_cache_managers(self):
-        cache.delete(constants.Cache.MANAGER_USERS_CACHE_KEY)
+    def test_cache_manager_ids(self):
+        cache.delete(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
 
         # first call
-        User.objects.managers()
+        manager_ids = User.objects.manager_ids()
         current_count = len(connection.queries)
 
-        # second call
-        User.objects.managers()
+        # second call only reads the cache
+        self.assertEqual(manager_ids, User.objects.manager_ids())
         new_count = len(connection.queries)
         self.assertEqual(current_count + 1, new_count)
+        self.assertIn(self.manager_user.id, manager_ids)
 
     def test_to_dict(self):
         user_dicts = User.objects.to_dict([self.user.id])
@@ -0,0 +1,105 @@
+from django.utils import timezone
+
+from libs.notification import NotificationBulkWriter
+from main.models import UserActivitySummary
+from main.querysets import UserActivitySummaryQuerySet
+from tests.base_test import BaseTestCase
+from tests.factories import TipFactory
+
+
+class TestUserActivitySummary(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip1 = TipFactory.create(
+                added_by=cls.normal_user, updated_by=None
+            )
+            cls.tip2 = TipFactory.create(
+                added_by=cls.normal_user, updated_by=None
+            )
+
+    def write_notification(self, tip, timestamp, level="success"):
+        NotificationBulkWriter.write(
+            [
+                {
+                    "recipient": self.normal_user,
+                    "sender": self.normal_user,
+                    "verb": "updated tip",
+                    "action_object": tip,
+                    "timestamp": timestamp,
+                    "level": level,
+                }
+            ]
+        )
+
+    def test_for_users(self):
+        UserActivitySummary.objects.all().delete()
+        UserActivitySummary.objects.rebuild([self.normal_user.id])
+
+        with self.assertNumQueries(1):
+            summaries = UserActivitySummary.objects.for_users(
+                [self.normal_user.id, self.manager_user.id]
+            )
+
+        summary = summaries[self.normal_user.id]
+        tip_ids = [
+            list(activity)[0]
+            for activity in summary.get_recent_activities("recent_tips")
+        ]
+        self.assertListEqual([self.tip2.id, self.tip1.id], tip_ids)
+        self.assertIsNotNone(summary.last_activity)
+
+    def test_for_users_without_summary(self):
+        UserActivitySummary.objects.all().delete()
+
+        summaries = UserActivitySummary.objects.for_users(
+            [self.normal_user.id]
+        )
+
+        summary = summaries[self.normal_user.id]
+        self.assertIsNone(summary.last_activity)
+        self.assertListEqual([], summary.get_recent_activities("recent_tips"))
+        self.assertFalse(UserActivitySummary.objects.exists())
+
+    def test_add_notifications_merges_touches(self):
+        UserActivitySummary.objects.rebuild([self.normal_user.id])
+
+        timestamp = timezone.now() + timezone.timedelta(hours=1)
+        self.write_notification(self.tip1, timestamp)
+
+        summary = UserActivitySummary.objects.get(user=self.normal_user)
+        self.assertEqual(timestamp, summary.last_activity)
+        self.assertDictEqual(
+            {self.tip1.id: timestamp},
+            summary.get_recent_activities("recent_tips")[0],
+        )
+        self.assertEqual(2, len(summary.recent_tips))
+
+    def test_add_notifications_ignores_other_levels(self):
+        UserActivitySummary.objects.rebuild([self.normal_user.id])
+        summary = UserActivitySummary.objects.get(user=self.normal_user)
+
+        timestamp = timezone.now() + timezone.timedelta(hours=1)
+        self.write_notification(self.tip1, timestamp, level="info")
+
+        summary.refresh_from_db()
+        self.assertNotEqual(timestamp, summary.last_activity)
+
+    def test_recent_activities_limit(self):
+        UserActivitySummary.objects.rebuild([self.normal_user.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tips = TipFactory.create_batch(
+                UserActivitySummaryQuerySet.RECENT_ACTIVITIES_LIMIT,
+                added_by=self.normal_user,
+                updated_by=None,
+            )
+
+        summary = UserActivitySummary.objects.get(user=self.normal_user)
+        self.assertEqual(
+            UserActivitySummaryQuerySet.RECENT_ACTIVITIES_LIMIT,
+            len(summary.recent_tips),
+        )
+        self.assertEqual(tips[-1].id, summary.recent_tips[0][0])
@@ -30,7 +30,7 @@ class TestExampleNotification(BaseTestCase):
             },
             {
                 "sender": self.example.added_by,
-                "recipient": [self.admin_user, self.manager_user],
+                "recipient": [self.admin_user.id, self.manager_user.id],
                 "description": _(
                     "Teacher {user_fullname} has created "
                     "a new example {headline}"
@@ -33,7 +33,7 @@ class TestExampleRatingNotification(BaseTestCase):
             },
             {
                 "sender": self.example_rating.added_by,
-                "recipient": [self.admin_user, self.manager_user],
+                "recipient": [self.admin_user.id, self.manager_user.id],
                 "description": _(
                     "Teacher {user_fullname} has rated example "
                     "{headline} {stars} stars"
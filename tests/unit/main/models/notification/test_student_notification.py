@@ -26,7 +26,7 @@ class TestStudentNotification(BaseTestCase):
             },
             {
                 "sender": self.student.added_by,
-                "recipient": [self.admin_user, self.manager_user],
+                "recipient": [self.admin_user.id, self.manager_user.id],
                 "description": "A new student {} is created by teacher {}".format(
                     self.student.full_name,
                     self.student.added_by.full_name,
@@ -26,7 +26,7 @@ class TestTipNotification(BaseTestCase):
             },
             {
                 "sender": self.tip.added_by,
-                "recipient": [self.admin_user, self.manager_user],
+                "recipient": [self.admin_user.id, self.manager_user.id],
                 "description": "Teacher {} has created a new tip {}".format(
                     self.tip.added_by.full_name,
                     self.tip.title,
@@ -33,7 +33,7 @@ class TestTipRatingNotification(BaseTestCase):
             },
             {
                 "sender": self.tip_rating.added_by,
-                "recipient": [self.admin_user, self.manager_user],
+                "recipient": [self.admin_user.id, self.manager_user.id],
                 "description": _(
                     "Teacher {user_fullname} has rated tip "
                     "{title} {stars} stars"
@@ -26,6 +26,7 @@ class TestExample(BaseTestCase):
         ExampleRatingFactory.create(example=example, clarity=2, recommended=2)
         expected_average_rating = 3
 
+        example.refresh_from_db()
         average_ratings = example.average_ratings
         self.assertEqual(
             expected_average_rating, average_ratings["clarity_average_rating"]
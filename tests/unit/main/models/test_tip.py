@@ -39,6 +39,7 @@ class TestTip(BaseTestCase):
         TipRatingFactory.create(tip=tip, clarity=2, relevance=2, uniqueness=2)
         expected_average_rating = 3
 
+        tip.refresh_from_db()
         average_ratings = tip.average_ratings
         self.assertEqual(
             expected_average_rating, average_ratings["clarity_average_rating"]
@@ -16,18 +16,20 @@ class TestExample(BaseTestCase):
     @classmethod
     def setUpTestData(cls):
         super().setUpTestData()
-        cls.example = ExampleFactory.create(
-            added_by=cls.experimental_user, updated_by=None
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example = ExampleFactory.create(
+                added_by=cls.experimental_user, updated_by=None
+            )
 
-        cls.example1 = ExampleFactory.create(
-            added_by=cls.normal_user, updated_by=None
-        )
+            cls.example1 = ExampleFactory.create(
+                added_by=cls.normal_user, updated_by=None
+            )
 
     def test_post_save_signal_with_new_student_tip(self):
         old_student_tips_count = StudentTip.objects.count()
 
-        example = ExampleFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create()
 
         new_student_tips_count = StudentTip.objects.count()
         self.assertEqual(old_student_tips_count + 1, new_student_tips_count)
@@ -38,12 +40,14 @@ class TestExample(BaseTestCase):
         self.assertTrue(existed)
 
     def test_post_save_signal_with_existing_student_tip(self):
-        student_tip = StudentTipFactory.create()
-        episode = EpisodeFactory.create(student=student_tip.student)
+        with self.captureOnCommitCallbacks(execute=True):
+            student_tip = StudentTipFactory.create()
+            episode = EpisodeFactory.create(student=student_tip.student)
 
         old_student_tips_count = StudentTip.objects.count()
 
-        ExampleFactory.create(tip=student_tip.tip, episode=episode)
+        with self.captureOnCommitCallbacks(execute=True):
+            ExampleFactory.create(tip=student_tip.tip, episode=episode)
 
         new_student_tips_count = StudentTip.objects.count()
         self.assertEqual(old_student_tips_count, new_student_tips_count)
@@ -51,10 +55,12 @@ class TestExample(BaseTestCase):
     def test_post_save_signal_with_existing_student_example(self):
         old_student_tips_count = StudentTip.objects.count()
 
-        tip = TipFactory.create()
-        episode = EpisodeFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create()
+            episode = EpisodeFactory.create()
         student = episode.student
-        example = ExampleFactory.create(tip=None, episode=episode)
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create(tip=None, episode=episode)
 
         new_student_tips_count = StudentTip.objects.count()
         self.assertEqual(old_student_tips_count, new_student_tips_count)
@@ -70,7 +76,8 @@ class TestExample(BaseTestCase):
         self.assertFalse(student_tip_is_existed)
 
         example.tip_id = tip.id
-        example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            example.save()
 
         new_student_tips_count = StudentTip.objects.count()
         self.assertEqual(old_student_tips_count + 1, new_student_tips_count)
@@ -145,7 +152,8 @@ class TestExample(BaseTestCase):
 
     def test_post_update_by_owner_with_send_notification(self):
         self.example.updated_by = self.experimental_user
-        self.example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.example.save()
         self.example.refresh_from_db()
 
         expected = {
@@ -169,7 +177,8 @@ class TestExample(BaseTestCase):
 
     def test_post_update_by_other_teacher_with_send_notification(self):
         self.example.updated_by = self.other_experimental_user
-        self.example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.example.save()
         self.example.refresh_from_db()
 
         expected = {
@@ -198,11 +207,13 @@ class TestExample(BaseTestCase):
     def test_post_update_signal_with_send_notification_fail_none_modifier(
         self,
     ):
-        example = ExampleFactory.create(added_by=self.normal_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create(added_by=self.normal_user)
         old_updated_by = example.updated_by
         example.headline = "headline update"
         example.updated_by = None
-        example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            example.save()
         example.refresh_from_db()
 
         expected = {
@@ -231,35 +242,41 @@ class TestExample(BaseTestCase):
         self.assertFalse(is_existed)
 
     def test_post_save_creation_with_tip_and_check_update_last_used_at(self):
-        student_tip = StudentTipFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            student_tip = StudentTipFactory.create()
         self.assertIsNone(student_tip.last_used_at)
 
-        episode = EpisodeFactory.create(student=student_tip.student)
-        ExampleFactory.create(tip=student_tip.tip, episode=episode)
+        with self.captureOnCommitCallbacks(execute=True):
+            episode = EpisodeFactory.create(student=student_tip.student)
+            ExampleFactory.create(tip=student_tip.tip, episode=episode)
 
         student_tip.refresh_from_db()
         self.assertIsNotNone(student_tip.last_used_at)
 
     def test_post_save_with_attach_tip_and_check_update_last_used_at(self):
-        student_tip = StudentTipFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            student_tip = StudentTipFactory.create()
         self.assertIsNone(student_tip.last_used_at)
 
-        episode = EpisodeFactory.create(student=student_tip.student)
+        with self.captureOnCommitCallbacks(execute=True):
+            episode = EpisodeFactory.create(student=student_tip.student)
 
-        example = ExampleFactory.create(episode=episode)
+            example = ExampleFactory.create(episode=episode)
 
         student_tip.refresh_from_db()
         self.assertIsNone(student_tip.last_used_at)
 
         # check update something
         example.headline = "new headline"
-        example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            example.save()
         student_tip.refresh_from_db()
         self.assertIsNone(student_tip.last_used_at)
 
         # update tip
         example.tip = student_tip.tip
-        example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            example.save()
 
         student_tip.refresh_from_db()
         self.assertIsNotNone(student_tip.last_used_at)
@@ -273,12 +290,13 @@ class TestExample(BaseTestCase):
             verb=constants.Activity.ATTACH_TIP_WITH_EXAMPLE,
         ).count()
 
-        tip = TipFactory.create()
-        ExampleFactory.create(
-            tip=tip,
-            added_by=self.admin_user,
-            updated_by=None,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create()
+            ExampleFactory.create(
+                tip=tip,
+                added_by=self.admin_user,
+                updated_by=None,
+            )
 
         new_count = Notification.objects.filter(
             actor_object_id=self.admin_user.id,
@@ -295,10 +313,12 @@ class TestExample(BaseTestCase):
             verb=constants.Activity.ATTACH_TIP_WITH_EXAMPLE,
         ).count()
 
-        tip = TipFactory.create(added_by=self.normal_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=self.normal_user)
         self.example.tip = tip
         self.example.updated_by = self.admin_user
-        self.example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.example.save()
 
         new_count = Notification.objects.filter(
             actor_object_id=self.admin_user.id,
@@ -317,7 +337,8 @@ class TestExample(BaseTestCase):
 
         self.example.tip_id = None
         self.example.updated_by = self.admin_user
-        self.example.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.example.save()
 
         count2 = Notification.objects.filter(
             actor_object_id=self.admin_user.id,
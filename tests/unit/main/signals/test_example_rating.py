@@ -1,8 +1,9 @@
 from notifications.models import Notification
 
 import constants
+from main.models import Example
 from tests.base_test import BaseTestCase
-from tests.factories import ExampleRatingFactory
+from tests.factories import ExampleFactory, ExampleRatingFactory
 
 
 class TestExampleRating(BaseTestCase):
@@ -10,12 +11,13 @@ class TestExampleRating(BaseTestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        cls.example_rating = ExampleRatingFactory.create(
-            added_by=cls.experimental_user,
-        )
-        cls.example_rating1 = ExampleRatingFactory.create(
-            added_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example_rating = ExampleRatingFactory.create(
+                added_by=cls.experimental_user,
+            )
+            cls.example_rating1 = ExampleRatingFactory.create(
+                added_by=None,
+            )
 
     def test_post_save_by_teacher_check_send_notification(self):
         expected_owner_received = {
@@ -70,3 +72,41 @@ class TestExampleRating(BaseTestCase):
             description=expected["description"],
         )
         self.assertFalse(is_existed)
+
+    def test_update_example_rating_aggregates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create()
+            example_rating = ExampleRatingFactory.create(
+                example=example, clarity=4, recommended=4
+            )
+            ExampleRatingFactory.create(
+                example=example, clarity=2, recommended=2
+            )
+
+        example.refresh_from_db()
+        self.assertEqual(2, example.rating_count)
+        self.assertEqual(3, example.clarity_average_rating)
+        self.assertEqual(3, example.recommended_average_rating)
+
+        example_rating.delete()
+
+        example.refresh_from_db()
+        self.assertEqual(1, example.rating_count)
+        self.assertEqual(2, example.recommended_average_rating)
+
+    def test_save_stale_example_keep_rating_aggregates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create()
+        stale_example = Example.objects.get(id=example.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExampleRatingFactory.create(
+                example=example, clarity=4, recommended=4
+            )
+            stale_example.headline = "new headline"
+            stale_example.save()
+
+        self.assertEqual(1, stale_example.rating_count)
+        example.refresh_from_db()
+        self.assertEqual(1, example.rating_count)
+        self.assertEqual(4, example.clarity_average_rating)
@@ -15,12 +15,14 @@ from tests.factories import (
 
 class TestStudentExample(BaseTestCase):
     def test_post_save_signal_without_task(self):
-        example = ExampleFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            example = ExampleFactory.create()
 
         old_student_tips_count = StudentTip.objects.count()
         old_tasks_count = Task.objects.count()
 
-        student_example = StudentExampleFactory.create(example=example)
+        with self.captureOnCommitCallbacks(execute=True):
+            student_example = StudentExampleFactory.create(example=example)
 
         new_tasks_count = Task.objects.count()
         self.assertEqual(old_tasks_count, new_tasks_count)
@@ -33,14 +35,16 @@ class TestStudentExample(BaseTestCase):
         self.assertEqual(student_example.student, latest_student_tip.student)
 
     def test_post_save_signal_with_task(self):
-        task = TaskFactory.create(task_type=constants.TaskType.EXAMPLE)
+        with self.captureOnCommitCallbacks(execute=True):
+            task = TaskFactory.create(task_type=constants.TaskType.EXAMPLE)
         old_student_tips_count = StudentTip.objects.count()
         old_tasks_count = Task.objects.count()
 
-        episode = EpisodeFactory.create(student=task.student)
-        example = ExampleFactory.create(
-            tip=task.tip, episode=episode, added_by=task.user
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            episode = EpisodeFactory.create(student=task.student)
+            example = ExampleFactory.create(
+                tip=task.tip, episode=episode, added_by=task.user
+            )
 
         new_tasks_count = Task.objects.count()
         self.assertEqual(old_tasks_count - 1, new_tasks_count)
@@ -56,18 +60,23 @@ class TestStudentExample(BaseTestCase):
         self.assertEqual(student_example.student, latest_student_tip.student)
 
     def test_post_save_signal_without_task_with_existed_student_tip(self):
-        existed_student_tip = StudentTipFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            existed_student_tip = StudentTipFactory.create()
 
         old_student_tips_count = StudentTip.objects.count()
 
-        episode = EpisodeFactory.create(student=existed_student_tip.student)
-        ExampleFactory.create(tip=existed_student_tip.tip, episode=episode)
+        with self.captureOnCommitCallbacks(execute=True):
+            episode = EpisodeFactory.create(
+                student=existed_student_tip.student
+            )
+            ExampleFactory.create(tip=existed_student_tip.tip, episode=episode)
 
         new_student_tips_count = StudentTip.objects.count()
         self.assertEqual(old_student_tips_count, new_student_tips_count)
 
     def test_post_save_by_teacher_check_send_notification(self):
-        student_example = StudentExampleFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            student_example = StudentExampleFactory.create()
         expected = {
             "sender_id": student_example.added_by.id,
             "recipient_id": student_example.student.added_by.id,
@@ -87,8 +96,9 @@ class TestStudentExample(BaseTestCase):
         self.assertTrue(is_existed)
 
     def test_post_save_send_notification_fail_with_none_added_by(self):
-        student = StudentFactory.create(added_by=None)
-        student_example = StudentExampleFactory.create(student=student)
+        with self.captureOnCommitCallbacks(execute=True):
+            student = StudentFactory.create(added_by=None)
+            student_example = StudentExampleFactory.create(student=student)
         expected_description = (
             "A example {} is assigned to your student {}".format(
                 student_example.example.headline,
@@ -15,42 +15,43 @@ class TestStudentTip(BaseTestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        cls.student_tip = StudentTipFactory.create()
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.student_tip = StudentTipFactory.create()
 
-        cls.student1 = StudentFactory.create()
-        cls.student2 = StudentFactory.create()
+            cls.student1 = StudentFactory.create()
+            cls.student2 = StudentFactory.create()
 
-        cls.tip1 = TipFactory.create()
-        cls.tip2 = TipFactory.create()
+            cls.tip1 = TipFactory.create()
+            cls.tip2 = TipFactory.create()
 
-        cls.student_tip1 = StudentTipFactory.create(
-            student=cls.student1, tip=cls.tip1
-        )
-        cls.student_tip2 = StudentTipFactory.create(
-            student=cls.student1, tip=cls.tip2
-        )
-        cls.student_tip3 = StudentTipFactory.create(
-            student=cls.student2, tip=cls.tip1
-        )
-        cls.student_tip4 = StudentTipFactory.create(
-            student=cls.student2, tip=cls.tip2
-        )
+            cls.student_tip1 = StudentTipFactory.create(
+                student=cls.student1, tip=cls.tip1
+            )
+            cls.student_tip2 = StudentTipFactory.create(
+                student=cls.student1, tip=cls.tip2
+            )
+            cls.student_tip3 = StudentTipFactory.create(
+                student=cls.student2, tip=cls.tip1
+            )
+            cls.student_tip4 = StudentTipFactory.create(
+                student=cls.student2, tip=cls.tip2
+            )
 
-        cls.user_student_mapping1 = UserStudentMappingFactory.create(
-            user=cls.experimental_user,
-            student=cls.student1,
-            added_by=cls.manager_user,
-        )
-        cls.user_student_mapping2 = UserStudentMappingFactory.create(
-            user=cls.experimental_user,
-            student=cls.student2,
-            added_by=cls.manager_user,
-        )
-        cls.user_student_mapping3 = UserStudentMappingFactory.create(
-            user=cls.manager_user,
-            student=cls.student1,
-            added_by=cls.super_user,
-        )
+            cls.user_student_mapping1 = UserStudentMappingFactory.create(
+                user=cls.experimental_user,
+                student=cls.student1,
+                added_by=cls.manager_user,
+            )
+            cls.user_student_mapping2 = UserStudentMappingFactory.create(
+                user=cls.experimental_user,
+                student=cls.student2,
+                added_by=cls.manager_user,
+            )
+            cls.user_student_mapping3 = UserStudentMappingFactory.create(
+                user=cls.manager_user,
+                student=cls.student1,
+                added_by=cls.super_user,
+            )
 
     def test_post_save_by_teacher_check_send_notification(self):
         expected = {
@@ -71,8 +72,9 @@ class TestStudentTip(BaseTestCase):
         self.assertTrue(is_existed)
 
     def test_post_save_send_notification_fail_with_none_added_by(self):
-        student = StudentFactory.create(added_by=None)
-        student_tip = StudentTipFactory.create(student=student)
+        with self.captureOnCommitCallbacks(execute=True):
+            student = StudentFactory.create(added_by=None)
+            student_tip = StudentTipFactory.create(student=student)
         expected_description = (
             "A tip {} is assigned to your student {}".format(
                 student_tip.tip.title, student_tip.student.full_name
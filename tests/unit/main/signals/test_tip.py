@@ -1,6 +1,9 @@
+from django.db.models import F
+from django.test import override_settings
 from notifications.models import Notification
 
 import constants
+from main.models import Tip
 from tests.base_test import BaseTestCase
 from tests.factories import TipFactory
 
@@ -9,11 +12,12 @@ class TestTip(BaseTestCase):
     @classmethod
     def setUpTestData(cls):
         super().setUpTestData()
-        cls.tip = TipFactory.create(
-            title="tip by experimental teacher",
-            added_by=cls.experimental_user,
-        )
-        cls.tip1 = TipFactory.create()
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip = TipFactory.create(
+                title="tip by experimental teacher",
+                added_by=cls.experimental_user,
+            )
+            cls.tip1 = TipFactory.create()
 
     def test_post_save_by_teacher_check_send_notification(self):
         expected_experimental_received = {
@@ -52,7 +56,8 @@ class TestTip(BaseTestCase):
     def test_post_save_signal_with_send_notification_fail_none_added_by(
         self,
     ):
-        tip = TipFactory.create(added_by=None)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(added_by=None)
         expected = {
             "sender_id": self.experimental_user.id,
             "description": "You have created a new tip {}".format(
@@ -70,7 +75,8 @@ class TestTip(BaseTestCase):
     def test_post_update_by_owner_check_send_notification(self):
         self.tip.description = "description update"
         self.tip.updated_by = self.experimental_user
-        self.tip.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
 
         expected = {
             "sender_id": self.tip.updated_by.id,
@@ -92,7 +98,8 @@ class TestTip(BaseTestCase):
     def test_post_update_by_other_teacher_check_send_notification(self):
         self.tip.description = "description update"
         self.tip.updated_by = self.other_experimental_user
-        self.tip.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
 
         expected = {
             "sender_id": self.tip.updated_by.id,
@@ -117,7 +124,8 @@ class TestTip(BaseTestCase):
         self,
     ):
         self.tip1.title = "title update"
-        self.tip1.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip1.save()
         self.tip1.refresh_from_db()
 
         expected = {
@@ -150,7 +158,8 @@ class TestTip(BaseTestCase):
 
         self.tip.marked_for_editing = True
         self.tip.updated_by = self.manager_user
-        self.tip.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
 
         new_count = Notification.objects.filter(
             actor_object_id=self.tip.updated_by.id,
@@ -172,7 +181,8 @@ class TestTip(BaseTestCase):
 
         self.tip.marked_for_editing = True
         self.tip.updated_by = self.manager_user
-        self.tip.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
 
         new_count = Notification.objects.filter(
             actor_object_id=self.tip.updated_by.id,
@@ -196,7 +206,8 @@ class TestTip(BaseTestCase):
 
         self.tip.marked_for_editing = True
         self.tip.updated_by = self.experimental_user
-        self.tip.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
 
         new_count = Notification.objects.filter(
             actor_object_id=self.tip.updated_by.id,
@@ -206,11 +217,50 @@ class TestTip(BaseTestCase):
         ).count()
         self.assertEqual(old_count, new_count)
 
+    def test_pre_save_with_already_marked_for_editing_dont_send_notification(
+        self,
+    ):
+        self.tip.marked_for_editing = True
+        self.tip.updated_by = self.manager_user
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
+
+        old_count = Notification.objects.filter(
+            verb=constants.Activity.SET_TIP_EDIT_MARK
+        ).count()
+
+        self.tip.title = "title update"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save()
+
+        new_count = Notification.objects.filter(
+            verb=constants.Activity.SET_TIP_EDIT_MARK
+        ).count()
+        self.assertEqual(old_count, new_count)
+
+    def test_post_save_with_counter_update_dont_send_notification(self):
+        old_count = Notification.objects.filter(
+            verb=constants.Activity.UPDATE_TIP
+        ).count()
+
+        self.tip.helpful_count = F("helpful_count") + 1
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tip.save(update_fields=["helpful_count"])
+
+        new_count = Notification.objects.filter(
+            verb=constants.Activity.UPDATE_TIP
+        ).count()
+        self.assertEqual(old_count, new_count)
+
+        self.tip.refresh_from_db(fields=["helpful_count"])
+        self.assertEqual(1, self.tip.helpful_count)
+
     def test_pre_save_with_check_attach_tip_notifications(self):
-        tip1 = TipFactory.create()
-        tip2 = TipFactory.create()
-        tip = TipFactory.create(updated_by=self.manager_user)
-        tip.linked_tips.add(tip1, tip2)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip1 = TipFactory.create()
+            tip2 = TipFactory.create()
+            tip = TipFactory.create(updated_by=self.manager_user)
+            tip.linked_tips.add(tip1, tip2)
 
         old_count = Notification.objects.filter(
             actor_object_id=tip.updated_by.id,
@@ -218,8 +268,9 @@ class TestTip(BaseTestCase):
             verb=constants.Activity.ATTACH_RELATED_TIPS_WITH_TIP,
         ).count()
 
-        tip3 = TipFactory.create()
-        tip.linked_tips.add(tip3)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip3 = TipFactory.create()
+            tip.linked_tips.add(tip3)
 
         new_count = Notification.objects.filter(
             actor_object_id=tip.updated_by.id,
@@ -230,10 +281,11 @@ class TestTip(BaseTestCase):
         self.assertEqual(old_count + 1, new_count)
 
     def test_pre_save_with_check_detach_tip_notifications(self):
-        tip = TipFactory.create(updated_by=self.manager_user)
-        tip1 = TipFactory.create()
-        tip2 = TipFactory.create()
-        tip.linked_tips.add(tip1, tip2)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(updated_by=self.manager_user)
+            tip1 = TipFactory.create()
+            tip2 = TipFactory.create()
+            tip.linked_tips.add(tip1, tip2)
 
         old_count = Notification.objects.filter(
             actor_object_id=tip.updated_by.id,
@@ -241,7 +293,8 @@ class TestTip(BaseTestCase):
             verb=constants.Activity.DETACH_RELATED_TIPS_WITH_TIP,
         ).count()
 
-        tip.linked_tips.remove(tip2)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip.linked_tips.remove(tip2)
 
         new_count = Notification.objects.filter(
             actor_object_id=tip.updated_by.id,
@@ -250,3 +303,26 @@ class TestTip(BaseTestCase):
         ).count()
 
         self.assertEqual(old_count + 1, new_count)
+
+    @override_settings(SEARCH_ENGINE=constants.SearchEngine.FULL_TEXT)
+    def test_update_tip_search_vector(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create(
+                title="tip title",
+                child_context={
+                    constants.ChildContext.CURRENT_MOTIVATOR: {
+                        "order": 1,
+                        "value": "trains",
+                    },
+                },
+            )
+
+        self.assertTrue(Tip.objects.search(None, "trains", None).exists())
+
+        tip.title = "renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            tip.save(update_fields=["title"])
+
+        tips = Tip.objects.search(None, "renamed", ["title"])
+        self.assertEqual([tip.id], [tip.id for tip in tips])
+        self.assertFalse(Tip.objects.search(None, "order", None).exists())
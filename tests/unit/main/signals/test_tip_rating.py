@@ -1,9 +1,13 @@
+from unittest import mock
+
 from django.utils.translation import gettext as _
 from notifications.models import Notification
 
 import constants
+from main.models import Tip
+from main.querysets import TipQuerySet
 from tests.base_test import BaseTestCase
-from tests.factories import TipRatingFactory
+from tests.factories import TipFactory, TipRatingFactory
 
 
 class TestTipRating(BaseTestCase):
@@ -11,9 +15,10 @@ class TestTipRating(BaseTestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        cls.tip_rating = TipRatingFactory.create(
-            added_by=cls.experimental_user,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip_rating = TipRatingFactory.create(
+                added_by=cls.experimental_user,
+            )
 
     def test_post_save_by_teacher_check_send_notification(self):
         expected_owner_received = {
@@ -54,3 +59,62 @@ class TestTipRating(BaseTestCase):
             verb=expected_manager_user_received["verb"],
         )
         self.assertTrue(is_existed)
+
+    def test_update_tip_rating_aggregates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create()
+            tip_rating = TipRatingFactory.create(
+                tip=tip, clarity=4, relevance=4, uniqueness=4
+            )
+            TipRatingFactory.create(
+                tip=tip, clarity=2, relevance=2, uniqueness=2
+            )
+
+        tip.refresh_from_db()
+        self.assertEqual(2, tip.rating_count)
+        self.assertEqual(3, tip.clarity_average_rating)
+        self.assertEqual(3, tip.relevance_average_rating)
+        self.assertEqual(3, tip.uniqueness_average_rating)
+
+        tip_rating.clarity = 5
+        with self.captureOnCommitCallbacks(execute=True):
+            tip_rating.save()
+
+        tip.refresh_from_db()
+        self.assertEqual(3.5, tip.clarity_average_rating)
+
+        tip_rating.delete()
+
+        tip.refresh_from_db()
+        self.assertEqual(1, tip.rating_count)
+        self.assertEqual(2, tip.clarity_average_rating)
+
+    def test_save_stale_tip_keep_rating_aggregates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tip = TipFactory.create()
+        stale_tip = Tip.objects.get(id=tip.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TipRatingFactory.create(
+                tip=tip, clarity=4, relevance=4, uniqueness=4
+            )
+            stale_tip.title = "new title"
+            stale_tip.save()
+
+        self.assertEqual(1, stale_tip.rating_count)
+        tip.refresh_from_db()
+        self.assertEqual(1, tip.rating_count)
+        self.assertEqual(4, tip.clarity_average_rating)
+
+    def test_update_tip_rating_aggregates_skip_counter_updates(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tip_rating = TipRatingFactory.create()
+        tip_rating.read_count += 1
+
+        with mock.patch.object(
+            TipQuerySet, "update_rating_aggregates"
+        ) as mock_update:
+            with self.captureOnCommitCallbacks(execute=True):
+                tip_rating.save(update_fields=["read_count"])
+
+        mock_update.assert_not_called()
@@ -30,12 +30,45 @@ class TestUser(BaseTestCase):
     def test_post_save_not_remove_managers_cache_when_create_not_role_manager(
         self,
     ):
-        # cache manager
-        User.objects.managers()
-        value1 = cache.get(constants.Cache.MANAGER_USERS_CACHE_KEY)
+        # cache manager ids
+        value1 = User.objects.manager_ids()
 
         UserFactory.create(role=constants.Role.EDUCATOR_SHADOW)
 
-        value2 = cache.get(constants.Cache.MANAGER_USERS_CACHE_KEY)
+        value2 = cache.get(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
 
-        self.assertQuerysetEqual(value1, value2, ordered=False)
+        self.assertEqual(value1, value2)
+
+    def test_post_save_remove_managers_cache_when_create_role_manager(self):
+        User.objects.manager_ids()
+
+        manager = UserFactory.create(role=constants.Role.MANAGER)
+
+        self.assertIsNone(
+            cache.get(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
+        )
+        self.assertIn(manager.id, User.objects.manager_ids())
+
+    def test_post_save_remove_managers_cache_when_role_changed(self):
+        manager = UserFactory.create(role=constants.Role.MANAGER)
+        self.assertIn(manager.id, User.objects.manager_ids())
+
+        manager.role = constants.Role.EDUCATOR_SHADOW
+        manager.save()
+
+        self.assertIsNone(
+            cache.get(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
+        )
+        self.assertNotIn(manager.id, User.objects.manager_ids())
+
+    def test_post_delete_remove_managers_cache(self):
+        manager = UserFactory.create(role=constants.Role.MANAGER)
+        manager_id = manager.id
+        self.assertIn(manager_id, User.objects.manager_ids())
+
+        manager.delete()
+
+        self.assertIsNone(
+            cache.get(constants.Cache.MANAGER_USER_IDS_CACHE_KEY)
+        )
+        self.assertNotIn(manager_id, User.objects.manager_ids())
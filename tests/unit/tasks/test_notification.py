@@ -0,0 +1,183 @@
+import json
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from notifications.models import Notification
+
+import constants
+from libs.notification import NotificationDescriptor
+from main.models import Tip, User
+from tasks.notification import create_notifications, send_notifications
+from tests.base_test import BaseTestCase
+from tests.factories import TipFactory, UserFactory
+
+
+class TestNotificationTasks(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        UserFactory.create_batch(3, role=constants.Role.MANAGER)
+        cls.tip = TipFactory.create(added_by=cls.normal_user)
+        cls.other_tip = TipFactory.create(added_by=cls.normal_user)
+
+        cls.timestamp = timezone.now() - timezone.timedelta(days=2)
+
+    def get_notifications_info(self):
+        return [
+            {
+                "sender": self.normal_user,
+                "recipient": self.normal_user,
+                "description": "description",
+                "verb": constants.Activity.CREATE_TIP,
+                "action_object": self.tip,
+                "target": self.other_tip,
+                "level": "success",
+                "timestamp": self.timestamp,
+            },
+            {
+                "sender": self.normal_user,
+                "recipient": User.objects.managers(),
+                "description": "description",
+                "verb": constants.Activity.CREATE_TIP,
+                "action_object": self.tip,
+                "level": "info",
+                "timestamp": self.timestamp,
+            },
+        ]
+
+    def get_descriptors(self):
+        return NotificationDescriptor.encode(self.get_notifications_info())
+
+    def test_create_notifications(self):
+        Notification.objects.all().delete()
+
+        create_notifications(self.get_descriptors())
+
+        tip_content_type = ContentType.objects.get_for_model(Tip)
+        success_notification = Notification.objects.get(level="success")
+        self.assertEqual(
+            self.normal_user.id, success_notification.recipient_id
+        )
+        self.assertEqual(self.timestamp, success_notification.timestamp)
+        self.assertEqual(
+            tip_content_type, success_notification.action_object_content_type
+        )
+        self.assertEqual(
+            str(self.tip.id), success_notification.action_object_object_id
+        )
+        self.assertEqual(
+            tip_content_type, success_notification.target_content_type
+        )
+        self.assertEqual(
+            str(self.other_tip.id), success_notification.target_object_id
+        )
+
+        manager_ids = set(manager.id for manager in User.objects.managers())
+        recipient_ids = set(
+            Notification.objects.filter(level="info").values_list(
+                "recipient_id", flat=True
+            )
+        )
+        self.assertEqual(manager_ids, recipient_ids)
+
+    def test_create_notifications_in_one_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            create_notifications(self.get_descriptors())
+
+        inserts = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith(
+                'INSERT INTO "notifications_notification"'
+            )
+        ]
+        self.assertEqual(1, len(inserts))
+
+    def test_create_notifications_update_activity_cache(self):
+        self.normal_user.get_activities()
+        tip = TipFactory.create(added_by=self.manager_user)
+        notifications_info = self.get_notifications_info()
+        notifications_info[0]["action_object"] = tip
+
+        create_notifications(NotificationDescriptor.encode(notifications_info))
+
+        tip_content_type = ContentType.objects.get_for_model(Tip)
+        activities = self.normal_user.get_activities()
+        self.assertIn(
+            {tip.id: self.timestamp}, activities[tip_content_type.id]
+        )
+
+    def test_encode_notifications(self):
+        descriptors = self.get_descriptors()
+        tip_content_type = ContentType.objects.get_for_model(Tip)
+        user_content_type = ContentType.objects.get_for_model(User)
+
+        self.assertEqual(descriptors, json.loads(json.dumps(descriptors)))
+        self.assertEqual(
+            [user_content_type.id, self.normal_user.id],
+            descriptors[0]["sender"],
+        )
+        self.assertEqual(
+            [tip_content_type.id, self.tip.id], descriptors[0]["action_object"]
+        )
+        self.assertEqual(
+            {"users": [self.normal_user.id]}, descriptors[0]["recipient"]
+        )
+        self.assertCountEqual(
+            User.objects.managers().values_list("id", flat=True),
+            descriptors[1]["recipient"]["users"],
+        )
+        self.assertEqual(
+            self.timestamp.isoformat(), descriptors[0]["timestamp"]
+        )
+
+    def test_decode_notifications(self):
+        descriptors = self.get_descriptors()
+
+        # users and tips are loaded with one query each, recipient ids are
+        # checked with another one
+        with self.assertNumQueries(3):
+            notifications_info = NotificationDescriptor.decode(descriptors)
+
+        self.assertEqual(self.normal_user, notifications_info[0]["sender"])
+        self.assertEqual(
+            [self.normal_user.id], notifications_info[0]["recipient"]
+        )
+        self.assertEqual(self.tip, notifications_info[0]["action_object"])
+        self.assertEqual(self.other_tip, notifications_info[0]["target"])
+        self.assertEqual(self.timestamp, notifications_info[0]["timestamp"])
+
+    def test_decode_notifications_of_deleted_objects(self):
+        descriptors = self.get_descriptors()
+        self.other_tip.delete()
+
+        notifications_info = NotificationDescriptor.decode(descriptors)
+
+        self.assertEqual(1, len(notifications_info))
+        self.assertEqual("info", notifications_info[0]["level"])
+
+    def test_send_notifications(self):
+        Notification.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_notifications(self.get_notifications_info())
+
+        self.assertEqual(
+            1 + User.objects.managers().count(), Notification.objects.count()
+        )
+
+    def test_send_notifications_after_commit(self):
+        with mock.patch.object(create_notifications, "delay") as mock_delay:
+            with self.captureOnCommitCallbacks() as callbacks:
+                send_notifications(self.get_notifications_info())
+
+            mock_delay.assert_not_called()
+            self.assertEqual(1, len(callbacks))
+
+            callbacks[0]()
+
+        mock_delay.assert_called_once_with(self.get_descriptors())
@@ -1,12 +1,14 @@
 import constants
 from main.models import StudentTip
 from tasks.student_tip import dequeue_student_tips
+from tasks.user_tip import dequeue_tips
 from tests.base_test import BaseTestCase
 from tests.factories import (
     StudentFactory,
     StudentTipFactory,
     TipFactory,
     UserFactory,
+    UserStudentMappingFactory,
 )
 
 
@@ -48,7 +50,38 @@ class TestStudentTipTask(BaseTestCase):
         old_count = StudentTip.objects.filter(is_queued=True).count()
 
         # first call
-        dequeue_student_tips(number_of_tips=2)
+        dequeued_count = dequeue_student_tips(number_of_tips=2)
 
         new_count = StudentTip.objects.filter(is_queued=True).count()
         self.assertEqual(old_count - 4, new_count)
+        self.assertEqual(4, dequeued_count)
+
+        # second call, only one tip of student1 is left
+        dequeued_count = dequeue_student_tips(number_of_tips=2)
+
+        self.assertEqual(1, dequeued_count)
+        self.assertFalse(StudentTip.objects.filter(is_queued=True).exists())
+
+    def test_dequeue_tips(self):
+        UserStudentMappingFactory.create(
+            user=self.another_experimental_user,
+            student=self.student2,
+            added_by=self.manager_user,
+        )
+
+        with self.assertNumQueries(1):
+            dequeued_count = dequeue_tips(number_of_tips=1)
+
+        self.assertEqual(1, dequeued_count)
+        self.assertEqual(
+            1,
+            StudentTip.objects.filter(
+                student=self.student2, is_queued=True
+            ).count(),
+        )
+        self.assertEqual(
+            3,
+            StudentTip.objects.filter(
+                student=self.student1, is_queued=True
+            ).count(),
+        )
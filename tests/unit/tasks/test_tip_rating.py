@@ -1,9 +1,16 @@
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import override_settings
+from django.utils import timezone
 from notifications.models import Notification
 
 import constants
-from tasks.tip_rating import rating_reminder
+from libs.cache import TipReadBuffer
+from main.models import TipRating
+from tasks.tip_rating import flush_tip_reads, rating_reminder
 from tests.base_test import BaseTestCase
-from tests.factories import TipRatingFactory, UserFactory
+from tests.factories import TipFactory, TipRatingFactory, UserFactory
 
 
 class TestTipRatingTasks(BaseTestCase):
@@ -50,3 +57,96 @@ class TestTipRatingTasks(BaseTestCase):
         ).exists()
 
         self.assertTrue(is_existed)
+
+    def test_rating_reminder_in_batches(self):
+        other_user = UserFactory.create(role=constants.Role.EDUCATOR_SHADOW)
+        TipRatingFactory.create(
+            clarity=0,
+            relevance=0,
+            uniqueness=0,
+            read_count=1,
+            added_by=other_user,
+        )
+
+        metrics = rating_reminder(batch_size=1)
+
+        self.assertEqual(2, metrics["notifications"])
+        self.assertEqual(
+            1,
+            Notification.objects.filter(
+                verb=constants.Activity.RATING_REMINDER,
+                actor_object_id=other_user.id,
+                recipient=other_user,
+            ).count(),
+        )
+
+    def get_reads(self):
+        tip = TipFactory.create()
+        return tip, [
+            {
+                "user": self.user.id,
+                "tip": tip.id,
+                "student": None,
+                "timestamp": timezone.now().isoformat(),
+            }
+        ]
+
+    def test_flush_tip_reads(self):
+        tip, reads = self.get_reads()
+
+        with mock.patch.object(
+            TipReadBuffer,
+            "claim",
+            side_effect=[("batch1", reads * 2), ("batch2", reads), ("", [])],
+        ) as mock_claim, mock.patch.object(
+            TipReadBuffer, "ack"
+        ) as mock_ack, mock.patch.object(
+            TipReadBuffer, "release"
+        ) as mock_release:
+            flush_tip_reads()
+
+        self.assertEqual(3, mock_claim.call_count)
+        self.assertEqual(
+            [mock.call("batch1"), mock.call("batch2")], mock_ack.call_args_list
+        )
+        mock_release.assert_not_called()
+
+        tip_rating = TipRating.objects.get(added_by=self.user, tip=tip)
+        self.assertEqual(3, tip_rating.read_count)
+        self.assertEqual(
+            3,
+            Notification.objects.filter(
+                verb=constants.Activity.READ_TIP, recipient=self.user
+            ).count(),
+        )
+
+    @override_settings(TIP_READ_BUFFER_MAX_BATCHES=2)
+    def test_flush_tip_reads_max_batches(self):
+        tip, reads = self.get_reads()
+
+        with mock.patch.object(
+            TipReadBuffer, "claim", return_value=("batch", reads)
+        ) as mock_claim, mock.patch.object(TipReadBuffer, "ack"):
+            flush_tip_reads()
+
+        self.assertEqual(2, mock_claim.call_count)
+        tip_rating = TipRating.objects.get(added_by=self.user, tip=tip)
+        self.assertEqual(2, tip_rating.read_count)
+
+    def test_flush_tip_reads_release_reads_on_error(self):
+        _tip, reads = self.get_reads()
+
+        with mock.patch.object(
+            TipReadBuffer, "claim", return_value=("batch", reads)
+        ), mock.patch.object(
+            TipRating.objects, "flush_reads", side_effect=DatabaseError
+        ), mock.patch.object(
+            TipReadBuffer, "ack"
+        ) as mock_ack, mock.patch.object(
+            TipReadBuffer, "release"
+        ) as mock_release:
+            with self.assertRaises(DatabaseError):
+                flush_tip_reads()
+
+        mock_ack.assert_not_called()
+        mock_release.assert_called_once_with("batch")
@@ -1,17 +1,25 @@
+from django.utils import timezone
+
 from tests.base_test import BaseTestCase
-from tests.factories import StudentFactory
-from v1.serializers import StudentActivitiesSerializer
+from v1.serializers import StudentActivitySerializer
 
 
-class TestStudentActivitiesSerializer(BaseTestCase):
+class TestStudentActivitySerializer(BaseTestCase):
     @classmethod
     def setUpTestData(cls):
         super().setUpTestData()
 
-        cls.student = StudentFactory.create()
+        cls.activity = {
+            "type": "episode",
+            "id": 1,
+            "title": "episode",
+            "updated_at": timezone.localtime(),
+            "user": cls.normal_user,
+        }
 
-        cls.expected_keys = ["tips", "examples", "episodes"]
+        cls.expected_keys = ["type", "id", "title", "updated_at", "user"]
 
     def test_to_representation_check_keys(self):
-        serializer = StudentActivitiesSerializer(self.student)
+        serializer = StudentActivitySerializer(self.activity)
         self.assertListEqual(self.expected_keys, [*serializer.data])
+        self.assertEqual(self.normal_user.id, serializer.data["user"]["id"])
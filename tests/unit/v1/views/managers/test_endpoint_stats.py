@@ -0,0 +1,42 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+
+from libs.cache import EndpointStats
+from tests.base_api_test import BaseAPITestCase
+
+
+class TestManagerEndpointStatsAPI(BaseAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.url = reverse("v1:managers-endpoint-stats")
+
+        cls.endpoint_stats = [
+            {
+                "endpoint": "GET v1:tips-list",
+                "requests": 2,
+                "avg_queries": 5.0,
+                "avg_db_ms": 3.0,
+                "avg_app_ms": 20.0,
+                "avg_total_ms": 23.0,
+                "cache_hits": 4,
+                "cache_misses": 0,
+            }
+        ]
+
+    def test_get_success_with_manager(self):
+        with mock.patch.object(
+            EndpointStats, "get_all", return_value=self.endpoint_stats
+        ):
+            response = self.authenticated_manager_client.get(self.url)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(self.endpoint_stats, response.data)
+
+    def test_get_fail_with_check_permissions(self):
+        response = self.forced_authenticated_client.get(self.url)
+
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
@@ -5,7 +5,7 @@ from notifications.models import Notification
 from rest_framework import status
 
 import constants
-from main.models import Example, Tip
+from main.models import Example, Tip, UserActivitySummary
 from tests.base_api_test import BaseAPITestCase
 from tests.factories import (
     ExampleFactory,
@@ -20,22 +20,23 @@ class TestManagerUserGridAPI(BaseAPITestCase):
     def setUpTestData(cls):
         super().setUpTestData()
 
-        content_types = ContentType.objects.get_for_models(
-            Tip, Example
-        )
+        content_types = ContentType.objects.get_for_models(Tip, Example)
         tip_content_type = content_types[Tip].id
         example_content_type = content_types[Example].id
 
         cls.user_grid_url = reverse("v1:managers-users-grid")
 
-        cls.first_user = UserFactory.create(first_name="123", last_name="abc")
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.first_user = UserFactory.create(
+                first_name="123", last_name="abc"
+            )
 
-        cls.tip1 = TipFactory.create(
-            title="tip 1",
-            description="description 1",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+            cls.tip1 = TipFactory.create(
+                title="tip 1",
+                description="description 1",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
         cls.tip1.created_at -= timezone.timedelta(hours=24)
         cls.tip1.save()
 
@@ -52,20 +53,21 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         tip1_notification.timestamp -= timezone.timedelta(hours=24)
         tip1_notification.save()
 
-        cls.tip2 = TipFactory.create(
-            title="tip 2",
-            description="description 2",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip2 = TipFactory.create(
+                title="tip 2",
+                description="description 2",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
 
-        cls.example1 = ExampleFactory.create(
-            description="example 1",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example1 = ExampleFactory.create(
+                description="example 1",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example1.created_at -= timezone.timedelta(hours=24)
         cls.example1.save()
 
@@ -82,17 +84,21 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         example1_notification.timestamp -= timezone.timedelta(hours=24)
         example1_notification.save()
 
-        cls.example2 = ExampleFactory.create(
-            description="example 2",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example2 = ExampleFactory.create(
+                description="example 2",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example = ExampleFactory.create(
-            added_by=cls.normal_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example = ExampleFactory.create(
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example.created_at -= timezone.timedelta(days=365)
         cls.old_example.save()
 
@@ -110,12 +116,13 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         old_example_notification.save()
 
         # of admin and manager
-        cls.tip3 = TipFactory.create(
-            title="tip 3 of admin and manager",
-            description="description 3 of admin and manager",
-            added_by=cls.manager_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip3 = TipFactory.create(
+                title="tip 3 of admin and manager",
+                description="description 3 of admin and manager",
+                added_by=cls.manager_user,
+                updated_by=None,
+            )
         cls.tip3.created_at -= timezone.timedelta(hours=24)
         cls.tip3.save()
 
@@ -132,20 +139,21 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         tip3_notification.timestamp -= timezone.timedelta(hours=24)
         tip3_notification.save()
 
-        cls.tip4 = TipFactory.create(
-            title="tip 4 of admin and manager",
-            description="description 4 of admin and manager",
-            added_by=cls.manager_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip4 = TipFactory.create(
+                title="tip 4 of admin and manager",
+                description="description 4 of admin and manager",
+                added_by=cls.manager_user,
+                updated_by=None,
+            )
 
-        cls.example3 = ExampleFactory.create(
-            description="example 3 of admin and manager",
-            added_by=cls.manager_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example3 = ExampleFactory.create(
+                description="example 3 of admin and manager",
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example3.created_at -= timezone.timedelta(hours=24)
         cls.example3.save()
 
@@ -162,17 +170,21 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         example3_notification.timestamp -= timezone.timedelta(hours=24)
         example3_notification.save()
 
-        cls.example4 = ExampleFactory.create(
-            description="example 4 of admin and manager",
-            added_by=cls.manager_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example4 = ExampleFactory.create(
+                description="example 4 of admin and manager",
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example1 = ExampleFactory.create(
-            added_by=cls.manager_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example1 = ExampleFactory.create(
+                added_by=cls.manager_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example1.created_at -= timezone.timedelta(days=365)
         cls.old_example1.save()
 
@@ -189,6 +201,11 @@ class TestManagerUserGridAPI(BaseAPITestCase):
         old_example1_notification.timestamp -= timezone.timedelta(days=365)
         old_example1_notification.save()
 
+        # the timestamps were moved behind the notification writer's back
+        UserActivitySummary.objects.rebuild(
+            [cls.normal_user.id, cls.manager_user.id]
+        )
+
         cls.pagination_keys = [
             "count",
             "next",
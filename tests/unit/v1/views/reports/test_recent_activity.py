@@ -16,18 +16,17 @@ class TestRecentActivityAPI(BaseAPITestCase):
 
         cls.url = reverse("v1:recent-activities")
 
-        content_types = ContentType.objects.get_for_models(
-            Tip, Example
-        )
+        content_types = ContentType.objects.get_for_models(Tip, Example)
         tip_content_type = content_types[Tip].id
         example_content_type = content_types[Example].id
 
-        cls.tip1 = TipFactory.create(
-            title="tip 1",
-            description="description 1",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip1 = TipFactory.create(
+                title="tip 1",
+                description="description 1",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
         cls.tip1.created_at -= timezone.timedelta(hours=24)
         cls.tip1.save()
 
@@ -43,20 +42,21 @@ class TestRecentActivityAPI(BaseAPITestCase):
         tip1_notification.timestamp -= timezone.timedelta(hours=24)
         tip1_notification.save()
 
-        cls.tip2 = TipFactory.create(
-            title="tip 2",
-            description="description 2",
-            added_by=cls.normal_user,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.tip2 = TipFactory.create(
+                title="tip 2",
+                description="description 2",
+                added_by=cls.normal_user,
+                updated_by=None,
+            )
 
-        cls.example1 = ExampleFactory.create(
-            description="example 1",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+            cls.example1 = ExampleFactory.create(
+                description="example 1",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.example1.created_at -= timezone.timedelta(hours=24)
         cls.example1.save()
 
@@ -72,17 +72,21 @@ class TestRecentActivityAPI(BaseAPITestCase):
         example1_notification.timestamp -= timezone.timedelta(hours=24)
         example1_notification.save()
 
-        cls.example2 = ExampleFactory.create(
-            description="example 2",
-            added_by=cls.normal_user,
-            tip=None,
-            episode=None,
-            updated_by=None,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.example2 = ExampleFactory.create(
+                description="example 2",
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
 
-        cls.old_example = ExampleFactory.create(
-            added_by=cls.normal_user, tip=None, episode=None, updated_by=None
-        )
+            cls.old_example = ExampleFactory.create(
+                added_by=cls.normal_user,
+                tip=None,
+                episode=None,
+                updated_by=None,
+            )
         cls.old_example.created_at -= timezone.timedelta(days=365)
         cls.old_example.save()
 
@@ -1,8 +1,11 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
 import constants
+from main.models import Episode
 from tests.base_api_test import BaseAPITestCase
 from tests.factories import (
     EpisodeFactory,
@@ -333,6 +336,66 @@ class TestEpisodeAPI(BaseAPITestCase):
         self.assertNotIn(self.episode1.id, ids)
         self.assertIn(self.episode2.id, ids)
 
+    def test_get_list_omit_large_texts(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.forced_authenticated_client.get(
+                self.list_url, format="json"
+            )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        for episode in response.data["results"]:
+            for field_name in Episode.LARGE_TEXT_FIELDS:
+                self.assertNotIn(field_name, episode)
+            self.assertIn("description", episode)
+
+        queries = " ".join(query["sql"] for query in context)
+        self.assertNotIn('"main_episode"."transcript"', queries)
+
+    def test_get_list_with_expand(self):
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"expand": "transcript,transcript_html"}
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        episode = response.data["results"][0]
+        self.assertIn("transcript", episode)
+        self.assertIn("transcript_html", episode)
+        self.assertNotIn("transcript_ids", episode)
+        self.assertIn("title", episode)
+
+    def test_get_list_with_fields(self):
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"fields": "id,title,transcript"}
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        for episode in response.data["results"]:
+            self.assertEqual(
+                ["id", "title", "transcript"], sorted(episode.keys())
+            )
+
+    def test_get_list_contributors(self):
+        example1 = ExampleFactory.create(episode=self.episode1)
+        ExampleFactory.create(
+            episode=self.episode1, added_by=example1.added_by
+        )
+        example3 = ExampleFactory.create(episode=self.episode1)
+
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"student": self.student1.id}
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        contributors = response.data["results"][0]["contributors"]
+        self.assertEqual(
+            sorted([example1.added_by.id, example3.added_by.id]),
+            sorted(contributor["id"] for contributor in contributors),
+        )
+
     def test_get_detail_success(self):
         example = ExampleFactory.create(episode=self.episode1)
 
@@ -0,0 +1,114 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from notifications.models import Notification
+from rest_framework import status
+
+import constants
+from tests.base_api_test import BaseAPITestCase
+from tests.factories import (
+    EpisodeFactory,
+    StudentFactory,
+    StudentTipFactory,
+    TipFactory,
+)
+
+
+class TestNotificationAPI(BaseAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.student = StudentFactory.create()
+
+        cls.list_url = reverse("v1:notifications-list")
+        cls.unread_url = reverse("v1:notifications-unread")
+
+    def setUp(self):
+        super().setUp()
+
+        Notification.objects.all().delete()
+
+    def create_notifications(self, count):
+        for _ in range(count):
+            episode = EpisodeFactory.create(student=self.student)
+            student_tip = StudentTipFactory.create(
+                student=self.student, tip=TipFactory.create()
+            )
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        recipient=self.normal_user,
+                        actor=self.manager_user,
+                        verb=constants.Activity.CREATE_EPISODE,
+                        action_object=episode,
+                    ),
+                    Notification(
+                        recipient=self.normal_user,
+                        actor=self.admin_user,
+                        verb=constants.Activity.SUGGEST_TIP,
+                        action_object=student_tip,
+                    ),
+                ]
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.forced_authenticated_client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_list_notifications(self):
+        self.create_notifications(1)
+
+        response = self.forced_authenticated_client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {item["verb"]: item for item in response.data["results"]}
+        episode_notification = results[constants.Activity.CREATE_EPISODE]
+        self.assertEqual(
+            self.manager_user.id, episode_notification["actor"]["id"]
+        )
+        self.assertEqual(
+            {
+                "episode": self.student.episode_set.get().id,
+                "student": self.student.id,
+                "student_nickname": self.student.nickname,
+            },
+            episode_notification["action_object"],
+        )
+        self.assertEqual(
+            self.student.nickname,
+            results[constants.Activity.SUGGEST_TIP]["action_object"][
+                "student_nickname"
+            ],
+        )
+
+    def test_list_notifications_queries_do_not_grow_with_page(self):
+        self.create_notifications(1)
+        queries_count = self.count_queries(self.list_url)
+
+        self.create_notifications(4)
+        self.assertEqual(queries_count, self.count_queries(self.list_url))
+
+    def test_unread_notifications_queries_do_not_grow_with_page(self):
+        self.create_notifications(1)
+        queries_count = self.count_queries(self.unread_url)
+
+        self.create_notifications(4)
+        self.assertEqual(queries_count, self.count_queries(self.unread_url))
+
+    def test_list_notifications_of_deleted_object(self):
+        self.create_notifications(1)
+        self.student.episode_set.all().delete()
+
+        response = self.forced_authenticated_client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {item["verb"]: item for item in response.data["results"]}
+        self.assertIsNone(
+            results[constants.Activity.CREATE_EPISODE]["action_object"][
+                "episode"
+            ]
+        )
@@ -0,0 +1,71 @@
+from django.urls import reverse
+
+from tests.base_api_test import BaseAPITestCase
+from tests.factories import (
+    ExampleFactory,
+    StudentTipFactory,
+    TipFactory,
+    TipRatingFactory,
+    UserStudentMappingFactory,
+)
+
+# The budgets include the 6 queries of the throttle, which the tests'
+# database cache runs on every request
+QUERY_BUDGETS = {
+    "tips": 10,
+    "student-tips": 8,
+    "users-grid": 19,
+    "unread-notifications": 9,
+    "recent-activities": 15,
+}
+
+
+class TestQueryBudgets(BaseAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.student = StudentTipFactory.create(is_queued=False).student
+        UserStudentMappingFactory.create(
+            user=cls.manager_user,
+            student=cls.student,
+            added_by=cls.manager_user,
+        )
+
+        for _ in range(10):
+            tip = TipFactory.create(added_by=cls.normal_user)
+            ExampleFactory.create(tip=tip, added_by=cls.normal_user)
+            TipRatingFactory.create(tip=tip, added_by=cls.manager_user)
+            StudentTipFactory.create(
+                student=cls.student, tip=tip, is_queued=False
+            )
+
+    def assert_within_budget(self, name, url):
+        with self.assertMaxQueries(QUERY_BUDGETS[name]):
+            response = self.authenticated_manager_client.get(url)
+
+        self.assertEqual(200, response.status_code)
+
+    def test_tips(self):
+        self.assert_within_budget("tips", reverse("v1:tips-list"))
+
+    def test_student_tips(self):
+        self.assert_within_budget(
+            "student-tips",
+            reverse("v1:student-tips-list", args=[self.student.id]),
+        )
+
+    def test_users_grid(self):
+        self.assert_within_budget(
+            "users-grid", reverse("v1:managers-users-grid")
+        )
+
+    def test_unread_notifications(self):
+        self.assert_within_budget(
+            "unread-notifications", reverse("v1:notifications-unread")
+        )
+
+    def test_recent_activities(self):
+        self.assert_within_budget(
+            "recent-activities", reverse("v1:recent-activities")
+        )
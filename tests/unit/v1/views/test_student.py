@@ -1,10 +1,12 @@
+import json
+
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Max, signals
 from django.urls import reverse
 from django.utils import timezone
 from factory.django import mute_signals
 from notifications.models import Notification
-from rest_framework import status
+from rest_framework import serializers, status
 
 import constants
 from main.models import Student, Tip, User
@@ -439,11 +441,14 @@ class TestStudentAPI(BaseAPITestCase):
 
         self.assertIn("last_name", response.data)
 
+    def get_streamed_json(self, response):
+        return json.loads(b"".join(response.streaming_content))
+
     def test_get_heads_up(self):
         response = self.forced_authenticated_client.get(self.heads_up_url)
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
-        self.assertEqual([], response.data)
+        self.assertEqual([], self.get_streamed_json(response))
 
         episode = EpisodeFactory.create(
             student=self.student1, heads_up_json={"test": "hello"}
@@ -452,8 +457,48 @@ class TestStudentAPI(BaseAPITestCase):
         response = self.forced_authenticated_client.get(self.heads_up_url)
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
-        self.assertEqual("hello", response.data[0]["test"])
-        self.assertEqual(episode.date, response.data[0]["date"])
+        data = self.get_streamed_json(response)
+        self.assertEqual("hello", data[0]["test"])
+        self.assertEqual(episode.id, data[0]["episode"])
+        self.assertEqual(
+            episode.date,
+            serializers.DateTimeField().to_internal_value(data[0]["date"]),
+        )
+
+    def test_get_heads_up_with_date_range_and_limit(self):
+        now = timezone.localtime()
+        episodes = [
+            EpisodeFactory.create(
+                student=self.student1,
+                heads_up_json={"test": index},
+                date=now - timezone.timedelta(days=index),
+            )
+            for index in range(4)
+        ]
+
+        response = self.forced_authenticated_client.get(
+            self.heads_up_url,
+            {
+                "start_date": (now - timezone.timedelta(days=2)).isoformat(),
+                "limit": 2,
+            },
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        data = self.get_streamed_json(response)
+        self.assertEqual(
+            [episodes[2].id, episodes[1].id],
+            [item["episode"] for item in data],
+        )
+
+    def test_get_heads_up_invalid_limit(self):
+        for limit in ["abc", "0", "-1"]:
+            response = self.forced_authenticated_client.get(
+                self.heads_up_url, {"limit": limit}
+            )
+
+            self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+            self.assertIn("limit", response.data)
 
     def test_get_list_success_experimental_teacher(self):
         user = UserFactory(role=constants.Role.EXPERIMENTAL_TEACHER)
@@ -523,6 +568,26 @@ class TestStudentAPI(BaseAPITestCase):
         self.assertEqual(data[student1.id], 1)
         self.assertEqual(data[student2.id], 0)
 
+    def test_get_list_page_context_only_covers_page(self):
+        student = StudentFactory.create()
+        StudentTipFactory.create(student=student)
+        EpisodeFactory.create(student=student)
+
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"page_size": 1, "ordering": "-id"}
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(1, len(response.data["results"]))
+
+        item = response.data["results"][0]
+        self.assertEqual(student.id, item["id"])
+        self.assertEqual(1, item["number_of_tips"])
+        self.assertEqual(1, item["number_of_episodes"])
+
+        context = response.renderer_context["view"].get_page_context([student])
+        self.assertListEqual([student.id], list(context["student_tips"]))
+
     @classmethod
     @mute_signals(signals.pre_save, signals.post_save)
     def create_student_notifications(cls):
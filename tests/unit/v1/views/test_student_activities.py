@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -44,6 +46,43 @@ class TestStudentActivitiesAPI(BaseAPITestCase):
             "v1:student-activities-list", args=[cls.student1.id]
         )
 
+    def get_activities(self, response):
+        result = {
+            "tip": [],
+            "example": [],
+            "episode": [],
+        }
+        for item in response.data["results"]:
+            result[item["type"]].append(item["id"])
+
+        return result
+
+    def walk_activities(self, limit):
+        activities = []
+        url = self.student_activities_url
+        params = {"limit": limit}
+        while url:
+            response = self.forced_authenticated_client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), limit)
+
+            activities.extend(
+                (item["type"], item["id"]) for item in response.data["results"]
+            )
+            url = response.data["next"]
+            params = None
+
+        return activities
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.forced_authenticated_client.get(
+                self.student_activities_url
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
     def test_get_student_activities_success(self):
         response = self.forced_authenticated_client.get(
             self.student_activities_url
@@ -51,17 +90,85 @@ class TestStudentActivitiesAPI(BaseAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        result = {
-            "tips": [],
-            "examples": [],
-            "episodes": [],
-        }
-        for key, items in response.data.items():
-            result[key] = [item["id"] for item in items]
+        result = self.get_activities(response)
+        self.assertIn(self.tip.id, result["tip"])
+        self.assertIn(self.example.id, result["example"])
+        self.assertIn(self.episode.id, result["episode"])
+        self.assertIsNone(response.data["next"])
+
+        episode = response.data["results"][-1]
+        self.assertEqual(
+            ["id", "title", "type", "updated_at", "user"],
+            sorted(episode.keys()),
+        )
+        self.assertEqual(self.episode.title, episode["title"])
+        self.assertEqual(self.episode.user_id, episode["user"]["id"])
+
+    def test_get_student_activities_newest_first(self):
+        response = self.forced_authenticated_client.get(
+            self.student_activities_url
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        updated_ats = [item["updated_at"] for item in response.data["results"]]
+        self.assertEqual(sorted(updated_ats, reverse=True), updated_ats)
+
+    def test_get_student_activities_with_cursor(self):
+        response = self.forced_authenticated_client.get(
+            self.student_activities_url
+        )
+        expected = [
+            (item["type"], item["id"]) for item in response.data["results"]
+        ]
+
+        self.assertEqual(expected, self.walk_activities(limit=1))
+        self.assertEqual(("episode", self.episode.id), expected[-1])
+
+    def test_get_student_activities_with_same_updated_at(self):
+        updated_at = timezone.localtime() - timezone.timedelta(days=1)
+        episodes = EpisodeFactory.create_batch(3, student=self.student1)
+        Episode.objects.filter(
+            id__in=[episode.id for episode in episodes]
+        ).update(updated_at=updated_at)
+
+        activities = self.walk_activities(limit=2)
+
+        episode_ids = [
+            activity_id
+            for activity_type, activity_id in activities
+            if activity_type == "episode"
+        ]
+        self.assertEqual(
+            sorted([episode.id for episode in episodes], reverse=True)
+            + [self.episode.id],
+            episode_ids,
+        )
+        self.assertEqual(len(activities), len(set(activities)))
+
+    def test_get_student_activities_queries_do_not_grow(self):
+        queries_count = self.count_queries()
+
+        EpisodeFactory.create_batch(5, student=self.student1)
+        StudentTipFactory.create_batch(5, student=self.student1)
+
+        self.assertEqual(queries_count, self.count_queries())
+
+    def test_get_student_activities_invalid_cursor(self):
+        response = self.forced_authenticated_client.get(
+            self.student_activities_url, {"cursor": "invalid"}
+        )
 
-        self.assertIn(self.tip.id, result["tips"])
-        self.assertIn(self.example.id, result["examples"])
-        self.assertIn(self.episode.id, result["episodes"])
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_student_activities_invalid_limit(self):
+        for limit in ["abc", "0", "-1"]:
+            response = self.forced_authenticated_client.get(
+                self.student_activities_url, {"limit": limit}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("limit", response.data)
 
     def test_get_student_activities_fail(self):
         student_activities_url = reverse(
@@ -82,17 +189,10 @@ class TestStudentActivitiesAPI(BaseAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        result = {
-            "tips": [],
-            "examples": [],
-            "episodes": [],
-        }
-        for key, items in response.data.items():
-            result[key] = [item["id"] for item in items]
-
-        self.assertIn(self.tip.id, result["tips"])
-        self.assertIn(self.example.id, result["examples"])
-        self.assertNotIn(self.episode.id, result["episodes"])
+        result = self.get_activities(response)
+        self.assertIn(self.tip.id, result["tip"])
+        self.assertIn(self.example.id, result["example"])
+        self.assertNotIn(self.episode.id, result["episode"])
 
     def test_get_student_activities_success_with_filter_end_date(self):
         data_params = {
@@ -104,14 +204,7 @@ class TestStudentActivitiesAPI(BaseAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        result = {
-            "tips": [],
-            "examples": [],
-            "episodes": [],
-        }
-        for key, items in response.data.items():
-            result[key] = [item["id"] for item in items]
-
-        self.assertNotIn(self.tip.id, result["tips"])
-        self.assertNotIn(self.example.id, result["examples"])
-        self.assertIn(self.episode.id, result["episodes"])
+        result = self.get_activities(response)
+        self.assertNotIn(self.tip.id, result["tip"])
+        self.assertNotIn(self.example.id, result["example"])
+        self.assertIn(self.episode.id, result["episode"])
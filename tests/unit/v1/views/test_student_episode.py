@@ -3,6 +3,7 @@ from django.utils import timezone
 from rest_framework import status
 
 import constants
+from main.models import Episode
 from tests.base_api_test import BaseAPITestCase
 from tests.factories import EpisodeFactory, ExampleFactory
 
@@ -80,6 +81,28 @@ class TestStudentEpisodeAPI(BaseAPITestCase):
         self.assertIn(self.episode1.id, ids)
         self.assertIn(self.episode2.id, ids)
 
+    def test_get_list_writers_without_large_texts(self):
+        ExampleFactory.create(
+            episode=self.episode1, added_by=self.example1.added_by
+        )
+
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"expand": "description_html"}
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        episodes = {item["id"]: item for item in response.data["results"]}
+        episode = episodes[self.episode1.id]
+        self.assertEqual(
+            [self.example1.added_by.id],
+            [writer["id"] for writer in episode["writers"]],
+        )
+        self.assertIn("description_html", episode)
+        for field_name in Episode.LARGE_TEXT_FIELDS:
+            if field_name != "description_html":
+                self.assertNotIn(field_name, episode)
+
     def test_get_list_with_filter_page_not_found(self):
         response = self.forced_authenticated_client.get(
             self.list_url, {"page": 99999999}, format="json"
@@ -1,3 +1,4 @@
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from notifications.models import Notification
@@ -233,6 +234,26 @@ class TestTipAPI(BaseAPITestCase):
         self.assertIn(self.tip1.id, ids)
         self.assertIn(self.tip2.id, ids)
 
+    def test_get_list_success_with_cursor(self):
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"cursor": "", "page_size": 1}, format="json"
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIsNone(response.data["count"])
+        self.assertIsNone(response.data["previous"])
+
+        ids = [item["id"] for item in response.data["results"]]
+        response = self.forced_authenticated_client.get(
+            response.data["next"], format="json"
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        ids += [item["id"] for item in response.data["results"]]
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual(2, len(set(ids)))
+        self.assertIsNotNone(response.data["previous"])
+
     def test_get_list_success_with_filter_tag(self):
         # prepare data
         tag1 = TagFactory.create(name="name_1", slug="slug_1")
@@ -643,6 +664,30 @@ class TestTipAPI(BaseAPITestCase):
         self.assertNotIn(self.tip1.id, ids)
         self.assertIn(self.tip2.id, ids)
 
+    @override_settings(SEARCH_ENGINE=constants.SearchEngine.FULL_TEXT)
+    def test_search_text_ordered_by_rank(self):
+        sub_goal_tip = TipFactory.create(sub_goal="xylophone practice")
+        title_tip = TipFactory.create(title="xylophone warm up")
+
+        response = self.forced_authenticated_client.get(
+            self.list_url, {"search_text": "xylophone"}, format="json"
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        # title matches weigh more than sub goal ones
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual([title_tip.id, sub_goal_tip.id], ids)
+
+        response = self.forced_authenticated_client.get(
+            self.list_url,
+            {"search_text": "xylophone", "ordering": "id"},
+            format="json",
+        )
+
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual([sub_goal_tip.id, title_tip.id], ids)
+
     def test_search_text(self):
         self.tip1.sub_goal = "SUB_GOAL_TEST"
         self.tip1.save()
@@ -974,7 +1019,8 @@ class TestTipAPI(BaseAPITestCase):
 
     def test_get_detail_success_with_check_read_tip_notification(self):
         detail_url = reverse("v1:tips-detail", args=[self.tip3.id])
-        response = self.forced_authenticated_client.get(detail_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.forced_authenticated_client.get(detail_url)
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
@@ -1411,9 +1457,10 @@ class TestTipAPI(BaseAPITestCase):
 
         data = {"students": [student.id]}
 
-        response = self.forced_authenticated_client.post(
-            self.suggest_url, data=data, format="json"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.forced_authenticated_client.post(
+                self.suggest_url, data=data, format="json"
+            )
 
         self.assertEqual(status.HTTP_201_CREATED, response.status_code)
         self.assertEqual({"status": "created"}, response.data)
@@ -1507,6 +1554,8 @@ class TestTipAPI(BaseAPITestCase):
 
         for key in data.keys():
             self.assertEqual(tip_field_dict[key], data[key])
+        self.assertNotIn("rating_count", tip_field_dict)
+        self.assertNotIn("search_vector", tip_field_dict)
 
         self.assertEqual("", reversion.comment)
         self.assertEqual(self.normal_user.id, reversion.user_id)
@@ -1818,7 +1867,8 @@ class TestTipAPI(BaseAPITestCase):
         self.assertTrue(self.tip_rating3.retry_later)
 
     def test_try_tip_success_with_check_try_tip_notification(self):
-        response = self.authenticated_dlp_client.post(self.try_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.authenticated_dlp_client.post(self.try_url)
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
@@ -321,9 +321,10 @@ class TestTipRatingAPI(BaseAPITestCase):
             "uniqueness": 4.5,
         }
 
-        response = self.authenticated_admin_client.post(
-            self.list_url, data=data, format="json"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.authenticated_admin_client.post(
+                self.list_url, data=data, format="json"
+            )
 
         self.assertEqual(status.HTTP_201_CREATED, response.status_code)
 
@@ -352,9 +353,10 @@ class TestTipRatingAPI(BaseAPITestCase):
             "comment": "this is bad",
         }
 
-        response = self.authenticated_admin_client.post(
-            self.list_url, data=data, format="json"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.authenticated_admin_client.post(
+                self.list_url, data=data, format="json"
+            )
 
         self.assertEqual(status.HTTP_201_CREATED, response.status_code)
 
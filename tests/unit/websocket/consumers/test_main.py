@@ -0,0 +1,44 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import AnonymousUser
+
+from tests.base_test import BaseTestCase
+from websocket.consumers import MainConsumer
+
+
+class TestMainConsumer(BaseTestCase):
+    def get_communicator(self, user):
+        communicator = WebsocketCommunicator(MainConsumer.as_asgi(), "/ws/")
+        communicator.scope["user"] = user
+        return communicator
+
+    def test_connect_fail_with_anonymous_user(self):
+        async def run():
+            communicator = self.get_communicator(AnonymousUser())
+            connected, code = await communicator.connect()
+
+            self.assertFalse(connected)
+            self.assertEqual(401, code)
+
+        async_to_sync(run)()
+
+    def test_send_message(self):
+        data = {"new_notification": True, "unread_count": 3}
+
+        async def run():
+            communicator = self.get_communicator(self.normal_user)
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+
+            await get_channel_layer().group_send(
+                "user_{}".format(self.normal_user.id),
+                {"type": "send_message", "data": data},
+            )
+
+            response = await communicator.receive_json_from()
+            self.assertEqual(data, response)
+
+            await communicator.disconnect()
+
+        async_to_sync(run)()
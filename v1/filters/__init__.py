@@ -6,7 +6,6 @@ from .example_rating import ExampleRatingFilter
 from .recent_example import RecentExampleFilter
 from .recent_tip import RecentTipFilter
 from .student import StudentFilter
-from .student_activities import StudentActivitiesFilter
 from .student_episode import StudentEpisodeFilter
 from .student_example import StudentExampleFilter
 from .student_tip import StudentTipFilter
@@ -37,7 +36,6 @@ __all__ = [
     "RecentExampleFilter",
     "RecentTipFilter",
     "UserGridFilter",
-    "StudentActivitiesFilter",
     "TagFilter",
     "TaggedItemFilter",
 ]
@@ -16,7 +16,7 @@ from .student import (
     StudentDetailSerializer,
     StudentSerializer,
 )
-from .student_activities import StudentActivitiesSerializer
+from .student_activities import StudentActivitySerializer
 from .student_episode import StudentEpisodeSerializer
 from .student_example import StudentExampleSerializer
 from .student_tip import StudentTipSerializer, SuggestTipSerializer
@@ -76,7 +76,7 @@ __all__ = [
     "UnAssignStudentSerializer",
     "UserGridSerializer",
     "UserChangeSerializer",
-    "StudentActivitiesSerializer",
+    "StudentActivitySerializer",
     "DLPTipSerializer",
     "LightweightDLPTipSerializer",
     "TagSerializer",
@@ -1,12 +1,17 @@
 from taggit.serializers import TaggitSerializer, TagListSerializerField
 
+from libs.serializers import ProjectedFieldsMixin
 from main.models import Episode
 
 from .base_updated_by import BaseUpdatedBySerializer
 from .user import LightUserSerializer
 
 
-class EpisodeSerializer(TaggitSerializer, BaseUpdatedBySerializer):
+class EpisodeSerializer(
+    ProjectedFieldsMixin, TaggitSerializer, BaseUpdatedBySerializer
+):
+    expandable_fields = Episode.LARGE_TEXT_FIELDS
+
     user = LightUserSerializer(required=False)
     contributors = LightUserSerializer(required=False, many=True)
     tags = TagListSerializerField(required=False)
@@ -40,7 +45,7 @@ class EpisodeSerializer(TaggitSerializer, BaseUpdatedBySerializer):
     def to_representation(self, instance):
         representation = super().to_representation(instance)
 
-        if instance.practitioner_id:
+        if "practitioner" in representation and instance.practitioner_id:
             representation["practitioner"] = LightUserSerializer(
                 instance.practitioner
             ).data
@@ -48,7 +53,11 @@ class EpisodeSerializer(TaggitSerializer, BaseUpdatedBySerializer):
         return representation
 
 
-class LightweightEpisodeSerializer(BaseUpdatedBySerializer):
+class LightweightEpisodeSerializer(
+    ProjectedFieldsMixin, BaseUpdatedBySerializer
+):
+    expandable_fields = Episode.LARGE_TEXT_FIELDS
+
     user = LightUserSerializer(required=False)
 
     class Meta:
@@ -59,3 +59,8 @@ class ExampleSerializer(TaggitSerializer, LightweightExampleSerializer):
             "tags",
             "student_ids",
         ]
+        read_only_fields = [
+            *LightweightExampleSerializer.Meta.read_only_fields,
+            "clarity_average_rating",
+            "recommended_average_rating",
+        ]
@@ -2,6 +2,7 @@ from notifications.models import Notification
 from rest_framework import serializers
 
 import constants
+from libs.notification import NotificationObjectLoader
 
 from .user import LightUserSerializer
 
@@ -27,11 +28,23 @@ class NotificationSerializer(serializers.ModelSerializer):
                 instance
             )
 
-        representation["actor"] = LightUserSerializer(instance.actor).data
+        representation["actor"] = LightUserSerializer(
+            self.get_object(instance, "actor")
+        ).data
         representation["created_at"] = representation.pop("timestamp")
 
         return representation
 
+    def get_object(self, instance, name):
+        """Generic relation `name` of `instance`, read from the objects the
+        view loaded for the whole page when there are any."""
+        objects = self.context.get("notification_objects")
+        if objects is None:
+            return getattr(instance, name)
+
+        key = NotificationObjectLoader.get_key(instance, name)
+        return objects.get(key)
+
     def get_action_object_for_create_episode(self, instance):
         data = {
             "episode": None,
@@ -39,7 +52,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             "student_nickname": None,
         }
 
-        episode = instance.action_object
+        episode = self.get_object(instance, "action_object")
         if episode:
             data = {
                 "episode": episode.id,
@@ -56,7 +69,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             "student_nickname": None,
         }
 
-        student_tip = instance.action_object
+        student_tip = self.get_object(instance, "action_object")
         if student_tip:
             data = {
                 "tip": student_tip.tip_id,
@@ -72,7 +85,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             "student_nickname": None,
         }
 
-        user_student_mapping = instance.action_object
+        user_student_mapping = self.get_object(instance, "action_object")
         if user_student_mapping:
             data = {
                 "student": user_student_mapping.student_id,
@@ -82,7 +95,7 @@ class NotificationSerializer(serializers.ModelSerializer):
         return data
 
     def get_action_object_for_attach_tip_with_example(self, instance):
-        example = instance.action_object
+        example = self.get_object(instance, "action_object")
         data = {
             "tip": example.tip_id,
             "example": example.id,
@@ -95,7 +108,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             "tip": None,
         }
 
-        tip = instance.action_object
+        tip = self.get_object(instance, "action_object")
         if tip:
             data = {
                 "tip": tip.id,
@@ -108,7 +121,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             "tip": None,
         }
 
-        tip = instance.action_object
+        tip = self.get_object(instance, "action_object")
         if tip:
             data = {
                 "tip": tip.id,
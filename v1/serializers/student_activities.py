@@ -1,29 +1,11 @@
 from rest_framework import serializers
 
-from main.models import Student
+from .user import LightUserSerializer
 
-from .episode import LightweightEpisodeSerializer
-from .example import LightweightExampleSerializer
-from .tip import LightweightTipSerializer
 
-
-class StudentActivitiesSerializer(serializers.ModelSerializer):
-    tips = LightweightTipSerializer(many=True)
-    examples = LightweightExampleSerializer(many=True)
-    episode_set = LightweightEpisodeSerializer(many=True)
-
-    class Meta:
-        model = Student
-        fields = [
-            "tips",
-            "examples",
-            "episode_set",
-        ]
-        read_only_fields = fields
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-
-        representation["episodes"] = representation.pop("episode_set")
-
-        return representation
+class StudentActivitySerializer(serializers.Serializer):
+    type = serializers.CharField(read_only=True)
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    user = LightUserSerializer(read_only=True)
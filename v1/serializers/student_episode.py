@@ -1,10 +1,13 @@
+from libs.serializers import ProjectedFieldsMixin
 from main.models import Episode
 
 from .base_updated_by import BaseUpdatedBySerializer
 from .user import LightUserSerializer
 
 
-class StudentEpisodeSerializer(BaseUpdatedBySerializer):
+class StudentEpisodeSerializer(ProjectedFieldsMixin, BaseUpdatedBySerializer):
+    expandable_fields = Episode.LARGE_TEXT_FIELDS
+
     user = LightUserSerializer(required=False)
     writers = LightUserSerializer(required=False, many=True)
 
@@ -42,7 +45,7 @@ class StudentEpisodeSerializer(BaseUpdatedBySerializer):
     def to_representation(self, instance):
         representation = super().to_representation(instance)
 
-        if instance.practitioner_id:
+        if "practitioner" in representation and instance.practitioner_id:
             representation["practitioner"] = LightUserSerializer(
                 instance.practitioner
             ).data
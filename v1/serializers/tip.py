@@ -60,6 +60,9 @@ class TipSerializer(TaggitSerializer, BaseUpdatedBySerializer):
             "tip_summary",
         ]
         read_only_fields = [
+            "clarity_average_rating",
+            "relevance_average_rating",
+            "uniqueness_average_rating",
             "updated_by",
             "created_at",
             "updated_at",
@@ -66,7 +66,7 @@ class TipRatingSerializer(BaseUpdatedBySerializer):
             defaults=validated_data,
         )
         if "comment" in validated_data:
-            notification.create_notifications.delay(
+            notification.send_notifications(
                 instance.generate_comment_tip_rating_notification()
             )
 
@@ -65,6 +65,11 @@ urlpatterns = [
         views.ManagerUserGridView.as_view(),
         name="managers-users-grid",
     ),
+    path(
+        "managers/endpoint-stats/",
+        views.ManagerEndpointStatsView.as_view(),
+        name="managers-endpoint-stats",
+    ),
 ]
 
 urlpatterns += router.urls
@@ -7,6 +7,7 @@ from .example import ExampleViewSet
 from .example_rating import ExampleRatingViewSet
 from .managers import (
     ManagerContributionView,
+    ManagerEndpointStatsView,
     ManagerRecentExampleViewSet,
     ManagerRecentTipViewSet,
     ManagerUserGridView,
@@ -57,6 +58,7 @@ __all__ = [
     "ManagerRecentExampleViewSet",
     "ManagerContributionView",
     "ManagerUserGridView",
+    "ManagerEndpointStatsView",
     "TopRatedExampleViewSet",
     "TopRatedTipViewSet",
     "VersionViewMixin",
@@ -4,9 +4,10 @@ from ..filters import EpisodeFilter
 from ..permissions import IsAuthenticated
 from ..serializers import EpisodeSerializer
 from .base import BaseStandardPaginationViewSet
+from .mixins import FieldProjectionMixin
 
 
-class EpisodeViewSet(BaseStandardPaginationViewSet):
+class EpisodeViewSet(FieldProjectionMixin, BaseStandardPaginationViewSet):
     permission_classes = [IsAuthenticated]
 
     serializer_class = EpisodeSerializer
@@ -20,11 +21,8 @@ class EpisodeViewSet(BaseStandardPaginationViewSet):
     def get_queryset(self):
         queryset = (
             Episode.objects.select_related("user", "practitioner")
-            .prefetch_related(
-                "example_set",
-                "example_set__added_by",
-                "tags",
-            )
+            .prefetch_writers()
+            .prefetch_related("tags")
             .order_by("id")
         )
 
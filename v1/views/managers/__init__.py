@@ -1,10 +1,12 @@
 from .contribution import ManagerContributionView
+from .endpoint_stats import ManagerEndpointStatsView
 from .recent_example import ManagerRecentExampleViewSet
 from .recent_tip import ManagerRecentTipViewSet
 from .user_grid import ManagerUserGridView
 
 __all__ = [
     "ManagerContributionView",
+    "ManagerEndpointStatsView",
     "ManagerRecentExampleViewSet",
     "ManagerRecentTipViewSet",
     "ManagerUserGridView",
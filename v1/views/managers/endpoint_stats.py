@@ -0,0 +1,13 @@
+from rest_framework.response import Response
+
+from libs.cache import EndpointStats
+
+from .base import BaseManagerView
+
+
+class ManagerEndpointStatsView(BaseManagerView):
+    """Per endpoint averages collected by the request stats middleware,
+    slowest endpoints (by total time spent) first."""
+
+    def get(self, request, format=None):
+        return Response(EndpointStats.get_all())
@@ -1,6 +1,4 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Max
-from notifications.models import Notification
 from rest_framework.generics import ListAPIView
 
 from main.models import (
@@ -8,6 +6,7 @@ from main.models import (
     Student,
     Tip,
     User,
+    UserActivitySummary,
     UserStudentMapping,
 )
 from libs.cache import ActivityCache
@@ -16,9 +15,10 @@ from ...filters import UserGridFilter
 from ...pagination import SmallResultsSetPagination
 from ...permissions import IsManagerUser
 from ...serializers import UserGridSerializer
+from ..mixins import PageContextMixin
 
 
-class ManagerUserGridView(ListAPIView):
+class ManagerUserGridView(PageContextMixin, ListAPIView):
     permission_classes = [IsManagerUser]
 
     serializer_class = UserGridSerializer
@@ -34,21 +34,23 @@ class ManagerUserGridView(ListAPIView):
 
         return queryset
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
+    def get_page_context(self, users):
+        context = super().get_page_context(users)
 
-        user_ids = self.filter_queryset(self.get_queryset()).values_list(
-            "id", flat=True
-        )
+        user_ids = [user.id for user in users]
 
-        last_activities = ActivityCache.get_user_activities(
-            user_ids, **self.request.query_params.dict()
-        )
-        content_types = ContentType.objects.get_for_models(
-            Tip, Example
+        content_types = ContentType.objects.get_for_models(Tip, Example)
+        summaries = UserActivitySummary.objects.for_users(user_ids)
+
+        last_activities = self.get_last_activities(
+            user_ids, summaries, content_types
         )
 
-        context["user_last_activity"] = self.get_user_last_activity(user_ids)
+        context["user_last_activity"] = {
+            user_id: summary.last_activity
+            for user_id, summary in summaries.items()
+            if summary.last_activity
+        }
         context["user_students"] = self.get_user_students(user_ids)
         context["last_activities"] = last_activities
         context["all_action_objects"] = self.get_all_action_objects(
@@ -58,6 +60,27 @@ class ManagerUserGridView(ListAPIView):
 
         return context
 
+    def get_last_activities(self, user_ids, summaries, content_types):
+        params = self.request.query_params.dict()
+
+        # the summaries only keep the latest touches, a date range is
+        # answered from the notifications of the page users
+        if params.get("start_date") or params.get("end_date"):
+            return ActivityCache.get_user_activities(user_ids, **params)
+
+        last_activities = {}
+        for user_id, summary in summaries.items():
+            last_activities[user_id] = {
+                content_types[Tip].id: summary.get_recent_activities(
+                    "recent_tips"
+                ),
+                content_types[Example].id: summary.get_recent_activities(
+                    "recent_examples"
+                ),
+            }
+
+        return last_activities
+
     def get_all_action_objects(self, last_activities, content_types):
         actions = {}
         for _, activity in last_activities.items():
@@ -103,22 +126,3 @@ class ManagerUserGridView(ListAPIView):
                 user_students[user_id].append(students[student_id])
 
         return user_students
-
-    def get_user_last_activity(self, user_ids):
-        notifications = (
-            Notification.objects.filter(
-                recipient_id__in=user_ids, level="success"
-            )
-            .values("recipient_id")
-            .annotate(
-                last_activity=Max("timestamp"),
-            )
-            .order_by("recipient_id")
-        )
-
-        result = {}
-        for notification in notifications:
-            user_id = notification["recipient_id"]
-            result[user_id] = notification["last_activity"]
-
-        return result
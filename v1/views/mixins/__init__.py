@@ -1,7 +1,11 @@
 from .contribution_mixin import ContributionMixin
+from .field_projection_mixin import FieldProjectionMixin
+from .page_context_mixin import PageContextMixin
 from .params_conversion_mixin import ParamsConversionMixinView
 
 __all__ = [
+    "FieldProjectionMixin",
+    "PageContextMixin",
     "ParamsConversionMixinView",
     "ContributionMixin",
 ]
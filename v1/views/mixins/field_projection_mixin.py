@@ -0,0 +1,43 @@
+from libs.serializers import FieldProjection
+
+
+class FieldProjectionMixin:
+    """Applies the `fields` / `expand` query parameters to list actions.
+
+    The expandable fields of the serializer that are not asked for are
+    left out of the representation and deferred in the queryset, so their
+    columns are not read at all.
+    """
+
+    projection_actions = ["list"]
+
+    def get_projection(self):
+        if self.action not in self.projection_actions:
+            return None
+
+        return FieldProjection.from_query_params(self.request.query_params)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        projection = self.get_projection()
+        if projection is not None:
+            context["projection"] = projection
+
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        projection = self.get_projection()
+        if projection is not None:
+            expandable_fields = getattr(
+                self.get_serializer_class(), "expandable_fields", []
+            )
+            deferred_fields = projection.get_deferred_fields(
+                queryset.model, expandable_fields
+            )
+            if deferred_fields:
+                queryset = queryset.defer(*deferred_fields)
+
+        return queryset
@@ -0,0 +1,29 @@
+class PageContextMixin:
+    """Builds the list serializer context from the objects being rendered.
+
+    `get_page_context` receives the objects of the current page (all of
+    them when the view is not paginated) so related data is batch-loaded
+    for those objects only instead of the whole filtered queryset.
+    """
+
+    page_objects = None
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+
+        # an unpaginated queryset is evaluated once, its result cache is
+        # reused when it is serialized
+        self.page_objects = queryset if page is None else page
+
+        return page
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        if self.page_objects is not None:
+            context.update(self.get_page_context(self.page_objects))
+
+        return context
+
+    def get_page_context(self, objects):
+        return {}
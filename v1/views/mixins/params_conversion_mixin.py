@@ -1,3 +1,6 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
 from libs.datetimes import to_datetime
 
 
@@ -26,5 +29,29 @@ class ParamsConversionMixinView:
 
         return serialized_params
 
+    def get_limit(self, request, default=None, max_value=None):
+        """The `limit` query param as a positive int, at most `max_value`.
+
+        An invalid limit is a 400, not a conversion error.
+        """
+        value = request.query_params.get("limit")
+        if value is None:
+            return default
+
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+
+        if limit < 1:
+            raise ValidationError(
+                {"limit": _("Ensure this value is a positive integer")}
+            )
+
+        if max_value is not None:
+            limit = min(limit, max_value)
+
+        return limit
+
     def serialize_data(self, *args, **kwargs):
         pass
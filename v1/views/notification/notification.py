@@ -4,12 +4,16 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 import constants
+from libs.notification import NotificationObjectLoader
 
 from ...pagination import StandardResultsSetPagination
 from ...serializers import NotificationSerializer
+from ..mixins import PageContextMixin
 
 
-class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class NotificationViewSet(
+    PageContextMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     permission_classes = [IsAuthenticated]
 
     serializer_class = NotificationSerializer
@@ -29,7 +33,8 @@ class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     def unread(self, request):
         limit = int(request.GET.get("limit", 10))
         notifications = self.get_queryset()
-        notifications_unread = notifications.unread()[:limit]
+        notifications_unread = list(notifications.unread()[:limit])
+        self.page_objects = notifications_unread
         serializer = self.get_serializer(notifications_unread, many=True)
         return Response(serializer.data)
 
@@ -47,3 +52,12 @@ class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     def read_all(self, request):
         self.get_queryset().mark_all_as_read()
         return Response({}, status=status.HTTP_204_NO_CONTENT)
+
+    def get_page_context(self, notifications):
+        context = super().get_page_context(notifications)
+
+        context["notification_objects"] = NotificationObjectLoader.load(
+            notifications
+        )
+
+        return context
@@ -1,9 +1,13 @@
+import json
+
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Max
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from notifications.models import Notification
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 from main.models import Episode, Student, StudentTip
 
@@ -15,9 +19,12 @@ from ..serializers import (
     StudentDetailSerializer,
 )
 from .base import BaseStandardPaginationViewSet
+from .mixins import PageContextMixin, ParamsConversionMixinView
 
 
-class StudentViewSet(BaseStandardPaginationViewSet):
+class StudentViewSet(
+    PageContextMixin, ParamsConversionMixinView, BaseStandardPaginationViewSet
+):
     permission_classes = [IsAuthenticated]
 
     serializer_class = LightweightStudentSerializer
@@ -47,8 +54,26 @@ class StudentViewSet(BaseStandardPaginationViewSet):
     @action(detail=True, url_path="heads-up")
     def heads_up(self, request, pk=None):
         instance = self.get_object()
+        limit = self.get_limit(request)
+        params = self.get_params_filters(request)
+
+        heads_up = instance.episode_set.heads_up(
+            start_date=params.get("start_date"),
+            end_date=params.get("end_date"),
+            limit=limit,
+        )
+
+        return StreamingHttpResponse(
+            self.stream_json_list(heads_up), content_type="application/json"
+        )
 
-        return Response(instance.heads_up)
+    def stream_json_list(self, items):
+        yield "["
+        for index, item in enumerate(items):
+            if index:
+                yield ","
+            yield json.dumps(item, cls=JSONEncoder)
+        yield "]"
 
     @action(detail=True)
     def notifications(self, request, pk=None):
@@ -84,25 +109,34 @@ class StudentViewSet(BaseStandardPaginationViewSet):
 
         return Response(serializer.data)
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
+    def get_page_context(self, students):
+        context = super().get_page_context(students)
 
         if self.action == "list":
-            context["student_tips"] = StudentTip.objects.count_by_days()
-            context["student_episodes"] = Episode.objects.count_by_days()
+            student_ids = [student.id for student in students]
+
+            context["student_tips"] = StudentTip.objects.count_by_days(
+                student_ids=student_ids
+            )
+            context["student_episodes"] = Episode.objects.count_by_days(
+                student_ids=student_ids
+            )
             context[
                 "last_activity_timestamps_on_students"
-            ] = self.get_last_activity_timestamps_on_students()
+            ] = self.get_last_activity_timestamps_on_students(student_ids)
 
         return context
 
-    def get_last_activity_timestamps_on_students(self):
+    def get_last_activity_timestamps_on_students(self, student_ids):
         student_content_type_id = ContentType.objects.get_for_model(Student).id
 
         notifications = (
             Notification.objects.filter(
                 recipient_id=self.request.user.id,
                 target_content_type_id=student_content_type_id,
+                target_object_id__in=[
+                    str(student_id) for student_id in student_ids
+                ],
             )
             .values("target_object_id")
             .annotate(last_activity_timestamp=Max("timestamp"))
@@ -1,32 +1,101 @@
+from collections import OrderedDict
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import mixins
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import GenericViewSet
 
+from libs.pagination import KeysetPagination
 from main.models import Student
 
-from ..filters import StudentActivitiesFilter
 from ..permissions import IsAuthenticated
-from ..serializers import StudentActivitiesSerializer
+from ..serializers import StudentActivitySerializer
+from .mixins import ParamsConversionMixinView
 
 
-class StudentActivitiesView(mixins.ListModelMixin, GenericViewSet):
-    permission_classes = [IsAuthenticated]
+class StudentActivitiesView(
+    ParamsConversionMixinView, mixins.ListModelMixin, GenericViewSet
+):
+    """Timeline of the tips, examples and episodes of a student.
 
-    serializer_class = StudentActivitiesSerializer
+    A page is read with one UNION query limited in SQL, the `next` cursor
+    points to the older activities.
+    """
+
+    permission_classes = [IsAuthenticated]
 
-    filterset_class = StudentActivitiesFilter
+    serializer_class = StudentActivitySerializer
 
     queryset = Student.objects.all()
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+    default_days = 30
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = KeysetPagination.cursor_query_param
+    invalid_cursor_message = KeysetPagination.invalid_cursor_message
 
+    def list(self, request, *args, **kwargs):
         student_id = self.kwargs["student_pk"]
-        queryset = queryset.filter(pk=student_id).first()
+        student = self.get_queryset().filter(pk=student_id).first()
 
-        if not queryset:
+        if not student:
             raise NotFound("student_id is invalid")
 
-        serializer = self.get_serializer(queryset)
-        return Response(serializer.data)
+        limit = self.get_limit(
+            request, default=self.page_size, max_value=self.max_page_size
+        )
+        params = self.get_params_filters(request)
+        start_date = params.get(
+            "start_date",
+            timezone.localtime() - timezone.timedelta(days=self.default_days),
+        )
+
+        activities = student.get_activities(
+            start_date=start_date,
+            end_date=params.get("end_date"),
+            before=self.decode_cursor(request),
+            limit=limit + 1,
+        )
+
+        next_link = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_link = self.encode_cursor(activities[-1])
+
+        serializer = self.get_serializer(activities, many=True)
+        return Response(
+            OrderedDict([("next", next_link), ("results", serializer.data)])
+        )
+
+    def encode_cursor(self, activity):
+        cursor = KeysetPagination.dumps_cursor(
+            [activity["updated_at"], activity["type"], activity["id"]]
+        )
+
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+
+        position = KeysetPagination.loads_cursor(cursor)
+        try:
+            updated_at, activity_type, activity_id = position
+            updated_at = parse_datetime(updated_at)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            updated_at is None
+            or activity_type not in Student.ACTIVITY_SOURCES
+            or not isinstance(activity_id, int)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return updated_at, activity_type, activity_id
@@ -4,9 +4,12 @@ from ..filters import StudentEpisodeFilter
 from ..permissions import IsAuthenticated
 from ..serializers import StudentEpisodeSerializer
 from .base import BaseStandardPaginationViewSet
+from .mixins import FieldProjectionMixin
 
 
-class StudentEpisodeViewSet(BaseStandardPaginationViewSet):
+class StudentEpisodeViewSet(
+    FieldProjectionMixin, BaseStandardPaginationViewSet
+):
     permission_classes = [IsAuthenticated]
 
     serializer_class = StudentEpisodeSerializer
@@ -22,6 +25,6 @@ class StudentEpisodeViewSet(BaseStandardPaginationViewSet):
         return (
             Episode.objects.filter(student_id=student_id)
             .select_related("user", "practitioner")
-            .prefetch_related("example_set", "example_set__added_by")
+            .prefetch_writers()
             .order_by("id")
         )
@@ -1,7 +1,6 @@
 from rest_framework import mixins, viewsets
 
 from main.models import StudentTip, TipRating
-from tasks import notification
 
 from ..filters import StudentTipFilter
 from ..pagination import StandardResultsSetPagination
@@ -48,12 +47,8 @@ class StudentTipViewSet(
         student_tip = self.get_object()
         user = self.request.user
 
-        tip_rating = TipRating.objects.get_or_update_read_count(
+        TipRating.objects.record_read(
             user=user, tip=student_tip.tip, student=student_tip.student
         )
 
-        notification.create_notifications.delay(
-            tip_rating.generate_read_tip_rating_notification()
-        )
-
         return super().retrieve(request, *args, **kwargs)
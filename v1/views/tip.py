@@ -1,3 +1,4 @@
+from django.db.models import F
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
@@ -86,13 +87,14 @@ class TipViewSet(
             user=user, tip=tip, student=student
         )
 
-        notification.create_notifications.delay(
+        notification.send_notifications(
             tip_rating.generate_try_tip_rating_notification()
         )
 
         if helpful:
-            tip.helpful_count += 1
-            tip.save()
+            tip.helpful_count = F("helpful_count") + 1
+            tip.save(update_fields=["helpful_count"])
+            tip.refresh_from_db(fields=["helpful_count"])
         if retry_later is not None:
             TipRating.objects.get_or_update_retry_later(
                 user=user, tip=tip, retry_later=retry_later
@@ -105,12 +107,6 @@ class TipViewSet(
         tip = self.get_object()
         user = self.request.user
 
-        tip_rating = TipRating.objects.get_or_update_read_count(
-            user=user, tip=tip
-        )
-
-        notification.create_notifications.delay(
-            tip_rating.generate_read_tip_rating_notification()
-        )
+        TipRating.objects.record_read(user=user, tip=tip)
 
         return super().retrieve(request, *args, **kwargs)
@@ -1,40 +1,42 @@
 import json
 
-from asgiref.sync import async_to_sync
-from channels.generic.websocket import WebsocketConsumer
+from channels.generic.websocket import AsyncWebsocketConsumer
 
 
-class MainConsumer(WebsocketConsumer):
-    def connect(self):
+class MainConsumer(AsyncWebsocketConsumer):
+    async def connect(self):
         if self.user.is_anonymous:
-            self.close(code=401)
+            await self.close(code=401)
             return
 
         self.group_name = "user_{}".format(self.user.id)
 
         # Join room group
-        async_to_sync(self.channel_layer.group_add)(
-            self.group_name, self.channel_name
-        )
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
 
-        self.accept()
+        await self.accept()
 
     @property
     def user(self):
         return self.scope["user"]
 
-    def disconnect(self, close_code):
+    async def disconnect(self, close_code):
+        if not hasattr(self, "group_name"):
+            return
+
         # Leave room group
-        async_to_sync(self.channel_layer.group_discard)(
+        await self.channel_layer.group_discard(
             self.group_name, self.channel_name
         )
 
     # Receive message from WebSocket
-    def receive(self, text_data):
+    async def receive(self, text_data=None, bytes_data=None):
         pass
 
-    # Receive message from room group
-    def send_message(self, event):
+    # Receive message from room group, the data already carries the
+    # notification delta (e.g. unread_count) so clients do not need to
+    # re-fetch /notifications/unread
+    async def send_message(self, event):
         data = event["data"]
         # Send message to WebSocket
-        self.send(text_data=json.dumps(data))
+        await self.send(text_data=json.dumps(data))